@@ -0,0 +1,42 @@
+# مقارنة عدد النصوص المشكلة في الثانية قبل وبعد الذاكرة المؤقتة
+# الاستعمال (من جذر المستودع): python benchmarks/arabic_shaping.py
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.arabic import display_arabic_text, display_arabic_texts
+
+# تسميات من الأقسام، تتعاود كيف ما تتعاود في كل إعادة تشغيل
+LABELS = [
+    'الثابت', 'الدخل', 'الاستثمار', 'الإنفاق الحكومي',
+    'القيم الفعلية', 'القيم المتوقعة', 'البواقي', 'توزيع البواقي',
+    'الدخل المتاح (مليار دينار)', 'الاستهلاك (مليار دينار)',
+    'المعلمات المقدرة وفترات الثقة 95%', 'مقارنة معايير تقييم النماذج المختلفة',
+] * 25
+
+uncached = display_arabic_text.__wrapped__
+
+
+def rate(func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    return len(LABELS) * number / seconds
+
+
+def main():
+    display_arabic_texts(LABELS)
+    results = [
+        ('before (no cache)', rate(lambda: [uncached(t) for t in LABELS], 5)),
+        ('display_arabic_text', rate(lambda: [display_arabic_text(t) for t in LABELS], 200)),
+        ('display_arabic_texts', rate(lambda: display_arabic_texts(LABELS), 200)),
+    ]
+    base = results[0][1]
+    print(f"{'variant':22s} {'strings/s':>14s} {'speedup':>9s}")
+    for name, value in results:
+        print(f"{name:22s} {value:14,.0f} {value / base:8.1f}x")
+    print(display_arabic_text.cache_info())
+
+
+if __name__ == '__main__':
+    main()
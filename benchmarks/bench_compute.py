@@ -0,0 +1,76 @@
+# قياس مسارات الحساب: توليد البيانات، الانحدار البسيط والمتعدد، ملخص النموذج، مسار Lasso، التحقق المتقاطع، VIF، اختبار Wald ومعايير التقييم
+import numpy as np
+
+from engine.crossval import cross_validate_subsets, make_splits
+from engine.data import synthetic_data
+from engine.influence import InfluenceDiagnostics
+from engine.metrics import calculate_metrics
+from engine.models import compute_vif, fit_linear, fit_ols, wald_test
+from engine.ols import fit_ols_chunks
+from engine.penalized import regularization_path
+from engine.summary import coefficient_table, fit_table
+
+REGRESSORS = ['الدخل', 'الاستثمار', 'الإنفاق الحكومي']
+TARGET = 'الاستهلاك'
+
+# القيد المستعمل في قسم اختبار الفرضيات: معامل الدخل = معامل الاستثمار
+RESTRICTION = np.array([[0, 1, -1, 0]])
+
+CHUNK_ROWS = 200_000
+
+
+def bench_synthetic_data(benchmark, n, cold):
+    cold(benchmark, synthetic_data, n)
+
+
+def bench_simple_regression(benchmark, data, cold):
+    cold(benchmark, fit_linear, data[['الدخل']], data[TARGET])
+
+
+def bench_multiple_regression(benchmark, data, cold):
+    cold(benchmark, fit_ols, data[REGRESSORS], data[TARGET])
+
+
+def bench_streaming_regression(benchmark, data, cold):
+    def fit():
+        chunks = (data.iloc[start:start + CHUNK_ROWS] for start in range(0, len(data), CHUNK_ROWS))
+        return fit_ols_chunks(chunks, REGRESSORS, TARGET)
+
+    cold(benchmark, fit)
+
+
+# جداول الملخص من نموذج مقدر من قبل (بلا التقدير نفسه)
+def bench_ols_summary(benchmark, data):
+    model = fit_ols(data[REGRESSORS], data[TARGET])
+    benchmark(lambda: (coefficient_table(model), fit_table(model)))
+
+
+# مسار Lasso كامل (100 قيمة λ) على X'X، بلا التحقق المتقاطع
+def bench_lasso_path(benchmark, data):
+    benchmark(regularization_path, data[REGRESSORS], data[TARGET], 1.0)
+
+
+# التحقق المتقاطع بـ 10 طيات مكررة 10 مرات لثلاث نماذج مرشحة، من مصفوفات الطيات
+def bench_repeated_kfold(benchmark, data):
+    candidates = {'1': REGRESSORS[:1], '2': REGRESSORS[:2], '3': REGRESSORS}
+    splits = make_splits(len(data), 'repeated', folds=10, repeats=10)
+    benchmark(cross_validate_subsets, data[REGRESSORS], data[TARGET], candidates, splits)
+
+
+# تشخيصات التأثير لكل المشاهدات (الرفع، Cook، DFFITS، PRESS) من QR واحد على دفعات
+def bench_influence(benchmark, data):
+    benchmark(InfluenceDiagnostics, data[REGRESSORS], data[TARGET])
+
+
+def bench_vif(benchmark, data, cold):
+    cold(benchmark, compute_vif, data[REGRESSORS].values)
+
+
+def bench_wald_test(benchmark, data, cold):
+    cold(benchmark, wald_test, data[REGRESSORS], data[TARGET], RESTRICTION)
+
+
+def bench_calculate_metrics(benchmark, data):
+    y = data[TARGET].to_numpy()
+    y_pred = y + np.random.default_rng(0).normal(size=len(y))
+    benchmark(calculate_metrics, y, y_pred)
@@ -0,0 +1,53 @@
+# قياس الرسومات (من البناء حتى الصورة) وتشكيل النص العربي
+# رسومات Matplotlib اللي ترسم كل النقاط ما تتقاسش فوق 10^5 سطر، لأن الرسم نفسه يولي هو الحد
+# رسومات Plotly تختصر النقاط في الخادم، لذلك تتقاس على كل الأحجام (البناء + تحويل JSON اللي يتبعث للمتصفح)
+import plotly.io as pio
+import pytest
+
+from engine.arabic import display_arabic_text
+from engine.figures import build_plotly, render_figure
+from engine.models import fit_linear
+from sections.descriptive import plot_correlation, plot_distributions, plot_income_consumption
+from sections.simple_regression import plot_simple_regression
+
+FIGURE_MAX_N = 100_000
+
+# كل رسم ياخذ مئات الميلي ثانية، لذلك عدد تكرارات أقل
+FIGURE_ROUNDS = 5
+
+LABELS = [
+    'الثابت', 'الدخل', 'الاستثمار', 'الإنفاق الحكومي',
+    'القيم الفعلية', 'القيم المتوقعة', 'البواقي', 'توزيع البواقي',
+    'الدخل المتاح (مليار دينار)', 'الاستهلاك (مليار دينار)',
+    'المعلمات المقدرة وفترات الثقة 95%', 'مقارنة معايير تقييم النماذج المختلفة',
+]
+
+
+def bench_plot_simple_regression(benchmark, data, cold):
+    X, y = data[['الدخل']], data['الاستهلاك']
+    model = fit_linear(X, y)
+    cold(benchmark, lambda: pio.to_json(build_plotly(plot_simple_regression, X, y, model.intercept_, model.coef_[0],
+                                                     0.9), validate=False), rounds=FIGURE_ROUNDS)
+
+
+@pytest.mark.max_n(FIGURE_MAX_N)
+def bench_plot_distributions(benchmark, data, cold):
+    cold(benchmark, render_figure, plot_distributions, data, rounds=FIGURE_ROUNDS)
+
+
+def bench_plot_income_consumption(benchmark, data, cold):
+    cold(benchmark, lambda: pio.to_json(build_plotly(plot_income_consumption, data), validate=False),
+         rounds=FIGURE_ROUNDS)
+
+
+def bench_plot_correlation(benchmark, data, cold):
+    cold(benchmark, render_figure, plot_correlation, data.corr(), rounds=FIGURE_ROUNDS)
+
+
+def bench_arabic_shaping_uncached(benchmark):
+    shape = display_arabic_text.__wrapped__
+    benchmark(lambda: [shape(text) for text in LABELS])
+
+
+def bench_arabic_shaping_cached(benchmark):
+    benchmark(lambda: [display_arabic_text(text) for text in LABELS])
@@ -0,0 +1,67 @@
+# إعدادات قياس الأداء بلا واجهة: كل قياس يشغل مسار الحساب نفسه اللي تستعمله الأقسام
+# يحتاج pytest و pytest-benchmark (pip install pytest pytest-benchmark)، وما يحتاجوش التطبيق نفسه
+# الاستعمال (من جذر المستودع):
+#   python -m pytest benchmarks                                  كل الأحجام من 100 إلى 10^7
+#   python -m pytest benchmarks --sizes=100,10000                أحجام محددة
+#   python -m pytest benchmarks --benchmark-autosave             حفظ النتائج في .benchmarks
+#   python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+#                                                                مقارنة مع آخر نتيجة محفوظة، ويفشل إذا تباطأ قياس بأكثر من 10%
+import os
+import sys
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from engine.cache import CACHES
+from engine.data import synthetic_data
+
+DEFAULT_SIZES = '100,1000,10000,100000,1000000,10000000'
+
+
+def pytest_addoption(parser):
+    parser.addoption('--sizes', default=DEFAULT_SIZES, help="أحجام البيانات (عدد الأسطر) مفصولة بفواصل")
+
+
+# كل قياس عنده المعامل n يتكرر على كل الأحجام، إلا إذا حدد max_n حد أقصى
+def pytest_generate_tests(metafunc):
+    if 'n' not in metafunc.fixturenames:
+        return
+    sizes = [int(float(size)) for size in metafunc.config.getoption('sizes').split(',')]
+    marker = metafunc.definition.get_closest_marker('max_n')
+    if marker is not None:
+        sizes = [size for size in sizes if size <= marker.args[0]]
+    metafunc.parametrize('n', sizes, ids=[f'n={size:.0e}' for size in sizes])
+
+
+# البيانات تتولد مرة وحدة لكل حجم في كامل الجلسة
+@pytest.fixture(scope='session')
+def datasets():
+    return {}
+
+
+@pytest.fixture
+def data(n, datasets):
+    if n not in datasets:
+        datasets[n] = synthetic_data(n)
+    return datasets[n]
+
+
+# عدد التكرارات يقل مع الحجم باش القياسات الكبيرة ما تطولش بزاف
+def rounds_for(n):
+    return max(3, min(50, 1_000_000 // max(n, 1)))
+
+
+# قياس الحساب من الصفر: نفرغو الذواكر المؤقتة قبل كل تكرار باش ما نقيسوش غير البحث في الذاكرة
+@pytest.fixture
+def cold(n):
+    def run(benchmark, func, *args, rounds=None):
+        def setup():
+            for cache in CACHES.values():
+                cache.clear()
+
+        rounds = rounds_for(n) if rounds is None else rounds
+        return benchmark.pedantic(func, args=args, setup=setup, rounds=rounds, iterations=1)
+
+    return run
@@ -0,0 +1,55 @@
+# قياس زمن الإقلاع البارد: كل قياس يتم في مفسر Python جديد
+# الاستعمال (من جذر المستودع): python benchmarks/startup.py [عدد التكرارات]
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# المكتبات اللي كان begin.py يحملها في البداية قبل التقسيم إلى أقسام
+EAGER_IMPORTS = """
+import streamlit, numpy, pandas, matplotlib.pyplot, statsmodels.api, seaborn
+import sklearn.linear_model, sklearn.metrics, sklearn.model_selection
+import arabic_reshaper, bidi.algorithm
+"""
+
+HEAVY = ('statsmodels', 'sklearn', 'seaborn')
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def measure(body, repeat):
+    code = SNIPPET.format(body=body, heavy=HEAVY)
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                             text=True, check=True).stdout.split()
+        times.append(float(out[0]))
+    loaded = out[1] if len(out) > 1 else '-'
+    return statistics.median(times), loaded
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    from sections import SECTIONS
+
+    rows = [('eager imports (before)', EAGER_IMPORTS)]
+    for title, module in SECTIONS.items():
+        rows.append((module, f"import streamlit\nimport sections.{module}"))
+
+    print(f"{'page':28s} {'median (ms)':>12s}  heavy modules loaded")
+    for name, body in rows:
+        median, loaded = measure(body, repeat)
+        print(f"{name:28s} {median * 1000:12.1f}  {loaded}")
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    main()
@@ -0,0 +1 @@
+# طبقة الحساب: دوال التقدير والتخزين المؤقت المستقلة عن واجهة Streamlit
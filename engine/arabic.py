@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+import arabic_reshaper
+from bidi.algorithm import get_display
+
+from engine.instrument import timed
+
+
+# تشكيل النص العربي واتجاهه مرة وحدة لكل نص، لأن العناوين والتسميات تتعاود في كل إعادة تشغيل
+# lru_cache محدود الحجم وآمن مع الخيوط (threads)
+@lru_cache(maxsize=4096)
+@timed('arabic_shaping')
+def display_arabic_text(text):
+    reshaped_text = arabic_reshaper.reshape(text)
+    bidi_text = get_display(reshaped_text)
+    return bidi_text
+
+
+# تشكيل قائمة كاملة من التسميات في نداء واحد (مثلا تسميات المحاور)
+def display_arabic_texts(texts):
+    return [display_arabic_text(text) for text in texts]
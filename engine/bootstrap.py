@@ -0,0 +1,83 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+METHODS = ('pairs', 'residual', 'wild')
+
+# أقصى عدد عناصر في مصفوفة الأوزان أو البواقي لكل دفعة (عدد التكرارات × عدد الأسطر)
+BATCH_ELEMENTS = 4_000_000
+
+
+# تكرارات Bootstrap لمعاملات OLS (مع الثابت)، كل التكرارات في دفعة تتحسب بعمليات مصفوفات
+# - pairs: إعادة سحب الأسطر، وكل تكرار يساوي OLS موزون بعدد مرات ظهور كل سطر
+# - residual: y* = Xb + e* مع e* مسحوبة من البواقي، ومنه b* = b + (X'X)⁻¹X'e*
+# - wild: نفس الشيء مع e* = e × v و v من توزيع Rademacher (يتحمل عدم تجانس التباين)
+# النتيجة ما تتبدلش مع عدد الخيوط، لأن كل دفعة عندها بذرة خاصة بها مشتقة من seed
+def bootstrap_coefficients(X, y, method='pairs', replicates=2000, seed=0, workers=None):
+    if method not in METHODS:
+        raise ValueError(f"طريقة Bootstrap غير معروفة: {method}")
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    n, k = X.shape
+
+    # نطرحو المتوسطات قبل ما نحسبو X'X باش نحافظو على الدقة
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Z = np.column_stack([np.ones(n), X - x_mean])
+    yc = y - y_mean
+    xtx_inv = np.linalg.pinv(Z.T @ Z)
+    beta = xtx_inv @ (Z.T @ yc)
+
+    batch = max(1, min(replicates, BATCH_ELEMENTS // n))
+    sizes = [min(batch, replicates - start) for start in range(0, replicates, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if method == 'pairs':
+        # كل عناصر X'X و X'y كأعمدة، باش X'WX لكل التكرارات تكون ضرب مصفوفات واحد
+        p = k + 1
+        products = np.column_stack([(Z[:, :, None] * Z[:, None, :]).reshape(n, p * p), Z * yc[:, None]])
+
+        def run(size, seed_seq):
+            rng = np.random.default_rng(seed_seq)
+            draws = rng.integers(0, n, size=(size, n)) + (np.arange(size) * n)[:, None]
+            counts = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n).astype(np.float64)
+            sums = counts @ products
+            xtx = sums[:, :p * p].reshape(size, p, p)
+            xty = sums[:, p * p:, None]
+            try:
+                return np.linalg.solve(xtx, xty)[:, :, 0]
+            except np.linalg.LinAlgError:
+                return (np.linalg.pinv(xtx) @ xty)[:, :, 0]
+    else:
+        residuals = yc - Z @ beta
+        projection = xtx_inv @ Z.T
+
+        def run(size, seed_seq):
+            rng = np.random.default_rng(seed_seq)
+            if method == 'residual':
+                errors = residuals[rng.integers(0, n, size=(size, n))]
+            else:
+                errors = residuals * rng.choice(np.array([-1.0, 1.0]), size=(size, n))
+            return beta + errors @ projection.T
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        draws = [run(size, seed_seq) for size, seed_seq in zip(sizes, seeds)]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bootstrap') as pool:
+            draws = list(pool.map(run, sizes, seeds))
+    coefs = np.vstack(draws)
+
+    # نرجعو الثابت للمتغيرات الأصلية: الثابت = a + متوسط y - b'متوسط X
+    coefs[:, 0] += y_mean - coefs[:, 1:] @ x_mean
+    return coefs
+
+
+# فترات الثقة بطريقة المئينات، بنفس شكل model.conf_int (عمودين 0 و 1)
+def percentile_intervals(coefs, names, alpha=0.05):
+    lower, upper = np.percentile(coefs, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+    return pd.DataFrame({0: lower, 1: upper}, index=names)
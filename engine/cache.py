@@ -0,0 +1,132 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+# كل الذواكر المؤقتة المنشأة في العملية، باش نقدرو نجمعو إحصائياتها
+CACHES = {}
+
+
+# ذاكرة مؤقتة محدودة الحجم (LRU) مشتركة بين كل الجلسات
+# إذا طلبت عدة جلسات نفس المفتاح في نفس الوقت، يتحسب مرة وحدة برك والباقي يستنى النتيجة
+class LRUCache:
+    def __init__(self, name, maxsize=128):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        CACHES[name] = self
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            del self._pending[key]
+        future.set_result(value)
+        return value
+
+    # قراءة قيمة بلا ما نحسبوها (None إذا ما كانتش موجودة)
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    # تخزين قيمة تحسبت خارج get_or_compute (مثلا نتيجة بحث يتعرض على مراحل)
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+
+# إحصائيات كل الذواكر المؤقتة
+def cache_stats():
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+
+# بصمة ثابتة للمدخلات (مصفوفات، جداول، قيم بسيطة) تستعمل كمفتاح للذاكرة المؤقتة
+def fingerprint(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update(h, part)
+    return h.hexdigest()
+
+
+def _update(h, obj):
+    if isinstance(obj, pd.DataFrame):
+        h.update(b'frame')
+        _update(h, tuple(str(c) for c in obj.columns))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b'series')
+        _update(h, str(obj.name))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(b'array')
+        h.update(f'{obj.dtype.str}{obj.shape}'.encode())
+        if obj.dtype == object:
+            h.update(repr(obj.tolist()).encode())
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(b'seq%d' % len(obj))
+        for item in obj:
+            _update(h, item)
+    elif isinstance(obj, dict):
+        h.update(b'dict%d' % len(obj))
+        for k in sorted(obj, key=repr):
+            _update(h, k)
+            _update(h, obj[k])
+    else:
+        h.update(repr(obj).encode())
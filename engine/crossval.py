@@ -0,0 +1,93 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from engine.metrics import batch_metrics
+from engine.subsets import _solve
+
+SCHEMES = ('kfold', 'repeated', 'rolling')
+
+
+# تقسيمات التحقق المتقاطع: قائمة (train_end, test) حيث test هي أرقام أسطر الاختبار
+# و train_end = None معناها التدريب على كل الأسطر الأخرى، وإلا التدريب على الأسطر [0, train_end)
+# - kfold: K طيات عشوائية
+# - repeated: نفس الشيء repeats مرات بترتيب عشوائي مختلف
+# - rolling: أصل متحرك للسلاسل الزمنية، التدريب على الماضي والاختبار على الفترة اللي بعده
+def make_splits(n, scheme='kfold', folds=5, repeats=10, seed=0, horizon=None):
+    if scheme not in SCHEMES:
+        raise ValueError(f"طريقة تقسيم غير معروفة: {scheme}")
+    if scheme == 'rolling':
+        horizon = horizon or max(1, n // (2 * folds))
+        origins = np.linspace(n // 2, n - horizon, folds).astype(int)
+        return [(origin, np.arange(origin, min(origin + horizon, n))) for origin in np.unique(origins)]
+
+    rng = np.random.default_rng(seed)
+    splits = []
+    for _ in range(repeats if scheme == 'repeated' else 1):
+        order = rng.permutation(n)
+        splits += [(None, np.sort(part)) for part in np.array_split(order, folds)]
+    return splits
+
+
+# التحقق المتقاطع لعدة نماذج مرشحة ({الاسم: [المتغيرات]}) بلا إعادة التقدير من البيانات:
+# مصفوفة [1, X, y]'[1, X, y] لبيانات التدريب = المصفوفة الكاملة - مصفوفة أسطر الاختبار (downdate)
+# وللأصل المتحرك، مجاميع تراكمية حتى كل أصل. كل طية تتحسب في خيط (numpy يحرر الـ GIL)
+# يرجع (المتوسط، الانحراف المعياري) لمعايير calculate_metrics لكل نموذج عبر الطيات
+def cross_validate_subsets(X, y, candidates, splits, workers=None):
+    columns = list(X.columns)
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    k = X.shape[1]
+
+    # نطرحو المتوسطات قبل الجمع باش الطرح ما يضيعش الدقة
+    Z = np.column_stack([np.ones(len(y)), X - X.mean(axis=0), y - y.mean()])
+    full = Z.T @ Z
+    prefixes = _prefix_products(Z, sorted({end for end, _ in splits if end is not None}))
+    subsets = [[columns.index(column) for column in subset] for subset in candidates.values()]
+
+    def run(split):
+        train_end, test = split
+        Z_test = Z[test]
+        products = full - Z_test.T @ Z_test if train_end is None else prefixes[train_end]
+        n = products[0, 0]
+        x_mean = products[0, 1:k + 1] / n
+        y_mean = products[0, k + 1] / n
+        gram = products[1:k + 1, 1:k + 1] - n * np.outer(x_mean, x_mean)
+        xty = products[1:k + 1, k + 1] - n * x_mean * y_mean
+
+        betas = np.zeros((k, len(subsets)))
+        for column, idx in enumerate(subsets):
+            if idx:
+                betas[idx, column] = _solve(gram[np.ix_(idx, idx)], xty[idx])
+        predictions = y_mean + (Z_test[:, 1:k + 1] - x_mean) @ betas
+        metrics = batch_metrics(Z_test[:, k + 1], predictions)
+        return np.column_stack(list(metrics.values())), list(metrics)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(splits) == 1:
+        results = [run(split) for split in splits]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crossval') as pool:
+            results = list(pool.map(run, splits))
+
+    scores = np.stack([result for result, _ in results])
+    names = results[0][1]
+    mean = pd.DataFrame(scores.mean(axis=0), index=list(candidates), columns=names)
+    std = pd.DataFrame(scores.std(axis=0, ddof=1) if len(splits) > 1 else np.zeros_like(scores[0]),
+                       index=list(candidates), columns=names)
+    return mean, std
+
+
+# المجاميع التراكمية Z'Z حتى كل أصل، بمرور واحد على الأسطر
+def _prefix_products(Z, ends):
+    prefixes = {}
+    products = np.zeros((Z.shape[1], Z.shape[1]))
+    start = 0
+    for end in ends:
+        block = Z[start:end]
+        products = products + block.T @ block
+        prefixes[end] = products
+        start = end
+    return prefixes
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+
+# بيانات عشوائية للأمثلة (n و seed قابلين للتغيير لقياس الأداء على أحجام كبيرة)
+# RandomState يعطي نفس القيم اللي كان يعطيها np.random.seed بلا ما يبدل الحالة العامة
+def synthetic_data(n=100, seed=42):
+    rng = np.random.RandomState(seed)
+    X1 = rng.normal(size=n)
+    X2 = rng.normal(size=n)
+    X3 = 0.5 * X1 + 0.3 * X2 + rng.normal(size=n, scale=0.5)
+    Y = 3 + 2 * X1 + 1.5 * X2 + 0.5 * X3 + rng.normal(size=n)
+
+    return pd.DataFrame({
+        'الدخل': X1 * 1000 + 5000,
+        'الاستهلاك': Y * 500 + 2000,
+        'الاستثمار': X2 * 300 + 1000,
+        'الإنفاق الحكومي': X3 * 200 + 800
+    })
+
+
+# بيانات فيها عدم تجانس التباين: الخطأ يزداد مع زيادة X
+def heteroskedastic_data(n=100, seed=123):
+    rng = np.random.RandomState(seed)
+    X = np.linspace(1, 10, n)
+    noise = rng.normal(0, X, n)
+    return pd.DataFrame({'X': X, 'y': 2 + 3 * X + noise})
+
+
+# نفس بيانات عدم تجانس التباين بعد التحويل اللوغاريتمي
+def log_transformed_data(hetero):
+    return pd.DataFrame({'X': hetero['X'], 'log_X': np.log(hetero['X']), 'log_y': np.log(hetero['y'])})
+
+
+# بيانات فيها ازدواج خطي: X2 مرتبط بشدة مع X1
+def collinear_data(n=100, seed=123):
+    rng = np.random.RandomState(seed)
+    X1 = rng.normal(size=n)
+    X2 = 0.8 * X1 + 0.2 * rng.normal(size=n)
+    X3 = rng.normal(size=n)
+    y = 2 + 3 * X1 + 4 * X2 + 1.5 * X3 + rng.normal(size=n)
+    return pd.DataFrame({'X1': X1, 'X2': X2, 'X3': X3, 'y': y})
+
+
+# بيانات افتراضية للدخل المتاح والاستهلاك في الجزائر (2010-2023)، بالمليار دينار
+def consumption_series():
+    return pd.DataFrame({
+        'السنة': np.arange(2010, 2024),
+        'الدخل المتاح': np.array([10500, 11200, 12100, 12800, 13500, 14000, 14300, 14700,
+                                  15200, 15600, 14800, 15500, 16300, 17100]),
+        'الاستهلاك': np.array([8800, 9300, 9900, 10400, 10900, 11300, 11500, 11800,
+                               12100, 12400, 12000, 12500, 13000, 13600]),
+    })
@@ -0,0 +1,67 @@
+import threading
+
+import pandas as pd
+
+from engine import data
+
+# كل بيانات الأمثلة ثابتة (بذرة محددة)، لذلك تتبنى مرة وحدة في العملية وتتشارك بين كل الجلسات
+# الدالة تاخذ الـ registry باش بيانات تقدر تتبنى من بيانات أخرى (مثلا التحويل اللوغاريتمي)
+DATASETS = {
+    'synthetic': lambda registry: data.synthetic_data(),
+    'hetero': lambda registry: data.heteroskedastic_data(),
+    'log': lambda registry: data.log_transformed_data(registry.get('hetero')),
+    'multi': lambda registry: data.collinear_data(),
+    'consumption': lambda registry: data.consumption_series(),
+}
+
+
+# مخزن البيانات المشتركة: البيانات تتبنى مرة وحدة، وكل طلب ياخذ نسخة سطحية (shallow) منها
+# - مصفوفات الأعمدة مشتركة بلا نسخ وللقراءة فقط: الكتابة مباشرة في المصفوفة (values، to_numpy) ترمي ValueError
+# - تعديل خانة بـ iloc أو loc ينسخ العمود داخل نسخة الجلسة برك (copy-on-write في pandas)
+# - إضافة أو حذف عمود يصير في النسخة السطحية برك، وما يوصلش للجلسات الأخرى
+class DatasetRegistry:
+    def __init__(self, builders):
+        self._builders = builders
+        self._frames = {}
+        # RLock لأن بيانات تقدر تطلب بيانات أخرى وهي تتبنى
+        self._lock = threading.RLock()
+
+    def get(self, name):
+        frame = self._frames.get(name)
+        if frame is None:
+            with self._lock:
+                if name not in self._frames:
+                    if name not in self._builders:
+                        raise KeyError(f"بيانات غير معروفة: {name}")
+                    self._frames[name] = read_only(self._builders[name](self))
+                frame = self._frames[name]
+        return frame.copy(deep=False)
+
+    # بناء كل البيانات مسبقا (مثلا عند تشغيل التطبيق)
+    def preload(self):
+        for name in self._builders:
+            self.get(name)
+
+    # الحجم في الذاكرة لكل بيانات مبنية
+    def info(self):
+        return pd.DataFrame({
+            'الأسطر': {name: len(frame) for name, frame in self._frames.items()},
+            'الحجم (بايت)': {name: int(frame.memory_usage(deep=True).sum()) for name, frame in self._frames.items()},
+        })
+
+
+# نسخة من الجدول أعمدتها مصفوفات numpy للقراءة فقط (كل عمود في مصفوفة مستقلة، بلا نسخ عند البناء)
+def read_only(frame):
+    columns = {}
+    for name in frame.columns:
+        values = frame[name].to_numpy(copy=True)
+        values.flags.writeable = False
+        columns[name] = values
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+registry = DatasetRegistry(DATASETS)
+
+
+def get_dataset(name):
+    return registry.get(name)
@@ -0,0 +1,113 @@
+import math
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+COVARIANCE_TYPES = ('HC0', 'HC1', 'HC2', 'HC3', 'HAC')
+
+
+# تشخيص عدم تجانس التباين من تصميم وبواقي تقدير OLS واحد
+# (X'X)⁻¹ يتحسب مرة وحدة ويتعاود استعماله في انحدار Breusch-Pagan المساعد
+# وفي قيم الرفع (leverage) وفي كل مصفوفات التباين القوية
+class HeteroskedasticityDiagnostics:
+    def __init__(self, exog, resid, names=None, hac_lags=None, hac_correction=False, gq_sort=None, gq_split=0.5, gq_drop=None):
+        X = np.asarray(exog, dtype=np.float64)
+        e = np.asarray(resid, dtype=np.float64).ravel()
+        n, p = X.shape
+        self.names = list(names) if names is not None else [f'x{i}' for i in range(p)]
+        self.nobs = n
+
+        xtx_inv = np.linalg.pinv(X.T @ X)
+        projected = X @ xtx_inv
+        leverage = np.einsum('ij,ij->i', projected, X)
+        squared = e * e
+
+        # Breusch-Pagan (صيغة Koenker): انحدار e² على X بنفس (X'X)⁻¹
+        gamma = projected.T @ squared
+        self.breusch_pagan = _lm_test(squared, X @ gamma, p - 1)
+
+        # White: انحدار e² على X مع المربعات والجداءات المتقاطعة
+        self.white = self._white(X, squared)
+
+        # Goldfeld-Quandt من الإحصاءات الكافية لكل جزء: بواقي y على X هي نفسها بواقي e على X
+        self.goldfeld_quandt = self._goldfeld_quandt(X, e, gq_sort, gq_split, gq_drop)
+
+        # مصفوفات التباين القوية: (X'X)⁻¹ X' diag(w) X (X'X)⁻¹ بأوزان مختلفة لكل نوع
+        weights = {
+            'HC0': squared,
+            'HC1': squared * n / (n - p),
+            'HC2': squared / (1 - leverage),
+            'HC3': squared / np.square(1 - leverage),
+        }
+        self.cov = {kind: xtx_inv @ ((X * w[:, None]).T @ X) @ xtx_inv for kind, w in weights.items()}
+        self.hac_lags = int(math.floor(4 * (n / 100) ** (2 / 9))) if hac_lags is None else hac_lags
+        # افتراضيا بلا تصحيح العينة الصغيرة مثل fit(cov_type='HAC') في statsmodels؛
+        # hac_correction=True يضرب في n/(n-p) مثل cov_hac
+        self.cov['HAC'] = xtx_inv @ _newey_west(X * e[:, None], self.hac_lags) @ xtx_inv
+        if hac_correction:
+            self.cov['HAC'] *= n / (n - p)
+
+    def _white(self, X, squared):
+        n, p = X.shape
+        pairs = [(i, j) for i in range(p) for j in range(i, p)]
+        Z = np.column_stack([X[:, i] * X[:, j] for i, j in pairs])
+        # نحذفو الأعمدة المكررة (مثلا الثابت × الثابت مع مربع متغير ثنائي)
+        _, keep = np.unique(np.round(Z, 12), axis=1, return_index=True)
+        Z = Z[:, np.sort(keep)]
+        fitted = Z @ np.linalg.lstsq(Z, squared, rcond=None)[0]
+        return _lm_test(squared, fitted, int(np.linalg.matrix_rank(Z)) - 1)
+
+    def _goldfeld_quandt(self, X, e, sort, split, drop):
+        n, p = X.shape
+        order = np.argsort(X[:, sort], kind='stable') if sort is not None else np.arange(n)
+        cut = int(n * split)
+        skip = int(n * drop / 2) if drop else 0
+        first, second = order[:cut - skip], order[cut + skip:]
+
+        def ssr(idx):
+            Xi, ei = X[idx], e[idx]
+            beta = np.linalg.lstsq(Xi.T @ Xi, Xi.T @ ei, rcond=None)[0]
+            return max(ei @ ei - beta @ (Xi.T @ ei), 0.0), len(idx) - p
+
+        ssr1, df1 = ssr(first)
+        ssr2, df2 = ssr(second)
+        fvalue = (ssr2 / df2) / (ssr1 / df1)
+        return {'statistic': fvalue, 'pvalue': stats.f.sf(fvalue, df2, df1), 'df': (df2, df1)}
+
+    def bse(self, kind):
+        return pd.Series(np.sqrt(np.diag(self.cov[kind])), index=self.names)
+
+    # جدول الاختبارات الثلاثة
+    def tests_frame(self):
+        rows = {
+            'Breusch-Pagan': self.breusch_pagan,
+            'White': self.white,
+            'Goldfeld-Quandt': self.goldfeld_quandt,
+        }
+        return pd.DataFrame({
+            'الإحصائية': [test['statistic'] for test in rows.values()],
+            'درجات الحرية': [str(test['df']) for test in rows.values()],
+            'p-value': [test['pvalue'] for test in rows.values()],
+        }, index=list(rows))
+
+    # الأخطاء المعيارية القوية لكل المعاملات
+    def bse_frame(self):
+        return pd.DataFrame({kind: self.bse(kind) for kind in COVARIANCE_TYPES})
+
+
+# إحصائية LM = n R² للانحدار المساعد
+def _lm_test(target, fitted, df):
+    centered = target - target.mean()
+    rsquared = 1 - np.sum(np.square(target - fitted)) / np.sum(np.square(centered))
+    statistic = len(target) * rsquared
+    return {'statistic': statistic, 'pvalue': stats.chi2.sf(statistic, df), 'df': df}
+
+
+# مصفوفة Newey-West بأوزان Bartlett من مساهمات المعاملات (X × e)
+def _newey_west(scores, lags):
+    S = scores.T @ scores
+    for lag in range(1, lags + 1):
+        gamma = scores[lag:].T @ scores[:-lag]
+        S += (1 - lag / (lags + 1)) * (gamma + gamma.T)
+    return S
@@ -0,0 +1,49 @@
+import io
+
+import matplotlib.pyplot as plt
+
+from engine.cache import LRUCache, fingerprint
+from engine.instrument import stage
+
+# الرسومات المحولة إلى صور (PNG أو SVG)، مشتركة بين كل الجلسات
+figure_cache = LRUCache('figures', maxsize=128)
+
+# نفس إعدادات st.pyplot باش تبقى الصور كيف ما كانت
+SAVEFIG_OPTIONS = {'bbox_inches': 'tight', 'dpi': 200}
+
+
+# يرسم الشكل مرة وحدة لكل مدخلات ويرجع الصورة كـ bytes
+# الدالة builder لازم ترجع Figure وتعتمد غير على المدخلات اللي تتبعت لها
+# إذا فشلت builder نسكرو الأشكال اللي فتحتها باش ما يبقاوش في pyplot (ممكن حتى شكل لخيط آخر
+# تفتح في نفس الوقت، وهذا ما يضرش: savefig يخدم على الشكل حتى بعد plt.close)
+def render_figure(builder, *args, fmt='png', **kwargs):
+    def compute():
+        before = set(plt.get_fignums())
+        try:
+            with stage(f'figure:{builder.__qualname__}'):
+                fig = builder(*args, **kwargs)
+        except BaseException:
+            for number in set(plt.get_fignums()) - before:
+                plt.close(number)
+            raise
+        try:
+            buffer = io.BytesIO()
+            with stage('savefig'):
+                fig.savefig(buffer, format=fmt, **SAVEFIG_OPTIONS)
+        finally:
+            plt.close(fig)
+        return buffer.getvalue()
+
+    key = fingerprint('figure', builder.__module__, builder.__qualname__, fmt, args, kwargs)
+    return figure_cache.get_or_compute(key, compute)
+
+
+# نفس الفكرة لرسومات Plotly: الشكل (بالنقاط المختصرة) يتبنى مرة وحدة لكل مدخلات
+# ويتبعث للمتصفح كبيانات، والرسم نفسه يصير في المتصفح بـ WebGL
+def build_plotly(builder, *args, **kwargs):
+    def compute():
+        with stage(f'figure:{builder.__qualname__}'):
+            return builder(*args, **kwargs)
+
+    key = fingerprint('plotly', builder.__module__, builder.__qualname__, args, kwargs)
+    return figure_cache.get_or_compute(key, compute)
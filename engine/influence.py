@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+from scipy.linalg import qr, solve_triangular
+
+from engine.summary import PARAM_LABELS
+
+# عدد الأسطر في كل دفعة: الذاكرة الإضافية هي دفعة × عدد المعاملات، ماشي n × عدد المعاملات
+CHUNK_ROWS = 65_536
+
+
+# تشخيصات التأثير (influence) لكل مشاهدة من تحليل QR واحد لـ [1, X, y]:
+# R يعطي المعاملات و RSS مباشرة، وقيمة الرفع h_i = |R⁻ᵀ x_i|²، وكل المقاييس الأخرى صيغ مغلقة في h و e
+# (بلا ما نعاودو التقدير n مرة). الـ QR نفسه يتحسب دفعة بدفعة (TSQR): R الدفعات السابقة فوق الدفعة الجديدة
+# الكائن يتخزن في ذاكرة النماذج، لذلك ما يحفظش X: يحفظ غير R وأشعة بطول n (الرفع، البواقي، ...)،
+# و DFBETAS (اللي تحتاج x_i) تاخذ X من اللي يطلبها
+class InfluenceDiagnostics:
+    def __init__(self, X, y, names=None, chunk_rows=CHUNK_ROWS):
+        X = _design(X)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        n, k = X.shape
+        p = k + 1
+        self.nobs = n
+        self.k_params = p
+        self.names = ['const'] + ([str(name) for name in names] if names is not None else [f'x{i + 1}' for i in range(k)])
+        self.chunk_rows = chunk_rows
+
+        R = np.zeros((0, p + 1))
+        for start in range(0, n, chunk_rows):
+            block = np.column_stack([np.ones(min(chunk_rows, n - start)), X[start:start + chunk_rows],
+                                     y[start:start + chunk_rows]])
+            R = qr(np.vstack([R, block]), mode='r')[0][:p + 1]
+        self._R = R[:p, :p]
+        self.params = solve_triangular(self._R, R[:p, p])
+        self.ssr = R[p, p] ** 2
+        self.scale = self.ssr / (n - p)
+        # قطر (X'X)⁻¹ = مجموع مربعات أسطر R⁻¹
+        R_inv = solve_triangular(self._R, np.eye(p))
+        self._cov_diag = np.sum(np.square(R_inv), axis=1)
+
+        self.leverage = np.empty(n)
+        self.resid = np.empty(n)
+        for start, stop, design in self._chunks(X):
+            self.leverage[start:stop] = np.sum(np.square(self._whiten(design)), axis=1)
+            self.resid[start:stop] = y[start:stop] - design @ self.params
+
+        h, e = self.leverage, self.resid
+        one_minus_h = 1 - h
+        # تباين البواقي بلا المشاهدة i: s²_(i) = ((n-p) s² - e²/(1-h)) / (n-p-1)
+        self.scale_loo = np.maximum(((n - p) * self.scale - e * e / one_minus_h) / (n - p - 1), 0.0)
+        self.student_external = e / np.sqrt(self.scale_loo * one_minus_h)
+        self.cooks_distance = e * e * h / (p * self.scale * np.square(one_minus_h))
+        # مجموع مربعات بواقي الحذف (leave-one-out) PRESS
+        self.press = float(np.sum(np.square(e / one_minus_h)))
+        self.loo_mse = self.press / n
+
+    # المقاييس الأخرى تتحسب من الرفع والبواقي عند الطلب، باش ما نخزنوش أشعة زايدة بطول n
+    @property
+    def student_internal(self):
+        return self.resid / np.sqrt(self.scale * (1 - self.leverage))
+
+    @property
+    def dffits(self):
+        return self.student_external * np.sqrt(self.leverage / (1 - self.leverage))
+
+    # بواقي الحذف (leave-one-out)
+    @property
+    def press_resid(self):
+        return self.resid / (1 - self.leverage)
+
+    def _chunks(self, X):
+        n = self.nobs
+        for start in range(0, n, self.chunk_rows):
+            stop = min(start + self.chunk_rows, n)
+            yield start, stop, np.column_stack([np.ones(stop - start), X[start:stop]])
+
+    def _whiten(self, design):
+        return solve_triangular(self._R, design.T, trans='T').T
+
+    # DFBETAS لأسطر محددة (أو كل الأسطر دفعة بدفعة): (X'X)⁻¹ x_i e_i/(1-h_i) مقسوم على s_(i) √((X'X)⁻¹_jj)
+    # X هو نفس المصفوفة اللي تقدر بها النموذج
+    def dfbetas(self, X, rows=None):
+        X = _design(X)
+        if rows is None:
+            return np.vstack([self._dfbetas(np.arange(start, stop), design)
+                              for start, stop, design in self._chunks(X)])
+        rows = np.asarray(rows)
+        return self._dfbetas(rows, np.column_stack([np.ones(len(rows)), X[rows]]))
+
+    def _dfbetas(self, rows, design):
+        change = solve_triangular(self._R, self._whiten(design).T).T * (self.resid[rows] / (1 - self.leverage[rows]))[:, None]
+        return change / (np.sqrt(self.scale_loo[rows])[:, None] * np.sqrt(self._cov_diag))
+
+    # جدول المقاييس لكل مشاهدة (أو لأسطر محددة)
+    def frame(self, X, rows=None, index=None):
+        rows = np.arange(self.nobs) if rows is None else np.asarray(rows)
+        labels = np.asarray(index)[rows] if index is not None else rows
+        table = pd.DataFrame({
+            'الرفع (h)': self.leverage[rows],
+            'البواقي المعيارية الخارجية': self.student_external[rows],
+            'مسافة Cook': self.cooks_distance[rows],
+            'DFFITS': self.student_external[rows] * np.sqrt(self.leverage[rows] / (1 - self.leverage[rows])),
+        }, index=labels)
+        dfbetas = pd.DataFrame(self.dfbetas(X, rows), index=labels, columns=[f'DFBETAS {PARAM_LABELS.get(name, name)}' for name in self.names])
+        return pd.concat([table, dfbetas], axis=1)
+
+    # المشاهدات الأكثر تأثيرا حسب مسافة Cook
+    def most_influential(self, count=10):
+        count = min(count, self.nobs)
+        top = np.argpartition(-self.cooks_distance, count - 1)[:count]
+        return top[np.argsort(-self.cooks_distance[top])]
+
+    # الحدود الشائعة: رفع > 2p/n، |بواقي معيارية| > 2، Cook > 4/n، |DFFITS| > 2√(p/n)
+    def thresholds(self):
+        n, p = self.nobs, self.k_params
+        return {'leverage': 2 * p / n, 'student': 2.0, 'cooks': 4 / n, 'dffits': 2 * np.sqrt(p / n),
+                'dfbetas': 2 / np.sqrt(n)}
+
+
+def _design(X):
+    X = np.asarray(X, dtype=np.float64)
+    return X.reshape(-1, 1) if X.ndim == 1 else X
@@ -0,0 +1,209 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# عدد الأسطر في كل دفعة عند قراءة الملفات الكبيرة
+CHUNK_ROWS = 200_000
+
+# الأعمدة النصية اللي عدد قيمها المختلفة قليل تتحول إلى category لتوفير الذاكرة
+CATEGORY_RATIO = 0.5
+
+# أقصى عدد قيم نصية مختلفة نجمعوها في المرور الأول لكل عمود: فوقه (أو فوق CATEGORY_RATIO من الأسطر
+# اللي فاتت) العمود يبقى نص، باش أعمدة النص الحر وأرقام التعريف ما تتخزنش كاملة في الذاكرة
+MAX_CATEGORIES = 65_536
+
+SUPPORTED_EXTENSIONS = ('.csv', '.xlsx', '.xlsm')
+
+
+# تقدم القراءة، يتحدث من خيط القراءة ويتقرا من الواجهة
+# الملف يتقرا مرتين (تحديد الأنواع ثم التحويل)، والنسبة تتقسم على المرورين
+class IngestProgress:
+    def __init__(self, total_bytes=None, passes=2):
+        self.total_bytes = total_bytes
+        self.passes = passes
+        self.current_pass = 0
+        self.rows = 0
+        self.fraction = 0.0
+
+
+# ملخص عمود واحد على كل الدفعات (المرور الأول): الأنواع اللي ظهرت، مجال القيم الصحيحة،
+# واش float32 يحفظ القيم بالضبط، واش النص كامل أرقام، والقيم النصية المختلفة (None إذا كثرت)
+class ColumnScan:
+    def __init__(self):
+        self.kinds = set()
+        self.rows = 0
+        self.low = np.inf
+        self.high = -np.inf
+        self.float32 = True
+        self.numeric_text = True
+        self.distinct = set()
+        self.dtype = None
+        # للأعمدة الرقمية: أصغر وأكبر قيمة، وهل القيم صحيحة متزايدة تماما بلا فراغات (أرقام تعريف للأسطر)
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.increasing = True
+        self.last = -np.inf
+
+    def update(self, values):
+        self.rows += len(values)
+        if pd.api.types.is_bool_dtype(values):
+            self.kinds.add('bool')
+        elif pd.api.types.is_numeric_dtype(values):
+            self._numeric(values)
+        elif _is_text(values):
+            self.kinds.add('text')
+            self.dtype = self.dtype or values.dtype
+            if self.distinct is not None:
+                self.distinct.update(values.dropna().unique())
+                if len(self.distinct) > min(MAX_CATEGORIES, CATEGORY_RATIO * self.rows):
+                    self.distinct = None
+            if self.numeric_text:
+                converted = pd.to_numeric(values, errors='coerce')
+                self.numeric_text = converted.notna().sum() == values.notna().sum()
+                if self.numeric_text:
+                    self._numeric(converted)
+        else:
+            self.kinds.add('other')
+            self.dtype = self.dtype or values.dtype
+
+    def _numeric(self, values):
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        # دفعة فارغة في هذا العمود ما تحددش نوعه
+        if np.isnan(numbers).all():
+            self.kinds.add('missing')
+            self.increasing = self.increasing and not len(numbers)
+            return
+        self.minimum = min(self.minimum, np.nanmin(numbers))
+        self.maximum = max(self.maximum, np.nanmax(numbers))
+        if self.increasing:
+            self.increasing = (pd.api.types.is_integer_dtype(values) and numbers[0] > self.last
+                               and bool(np.all(np.diff(numbers) > 0)))
+            self.last = numbers[-1]
+        if pd.api.types.is_integer_dtype(values):
+            self.kinds.add('int')
+            if len(numbers):
+                self.low = min(self.low, numbers.min())
+                self.high = max(self.high, numbers.max())
+        else:
+            self.kinds.add('float')
+        if self.float32:
+            self.float32 = np.array_equal(numbers.astype(np.float32).astype(np.float64), numbers, equal_nan=True)
+
+    # النوع النهائي للعمود، نفسه لكل الدفعات
+    def resolve(self):
+        kinds = self.kinds - {'missing'}
+        if not kinds:
+            return np.dtype(np.float32)
+        if kinds == {'bool'} and 'missing' not in self.kinds:
+            return np.dtype(bool)
+        if kinds == {'other'}:
+            return self.dtype
+        if 'text' in kinds and not self.numeric_text:
+            # أرقام ونص في نفس العمود: كل القيم تولي نص
+            if kinds == {'text'} and self.distinct is not None and len(self.distinct) <= CATEGORY_RATIO * self.rows:
+                return pd.CategoricalDtype(sorted(self.distinct, key=str))
+            return self.dtype
+        if kinds & {'bool', 'other'}:
+            return np.dtype(object)
+        if 'float' in kinds or 'missing' in self.kinds:
+            return np.dtype(np.float32 if self.float32 else np.float64)
+        for candidate in (np.int8, np.int16, np.int32):
+            info = np.iinfo(candidate)
+            if info.min <= self.low and self.high <= info.max:
+                return np.dtype(candidate)
+        return np.dtype(np.int64)
+
+    # العمود ينفع كمتغير في الانحدار: رقمي بعد التحويل، غير ثابت، وماشي أرقام تعريف للأسطر
+    # (نفس القاعدة على كل الدفعات، بلا ما نقراو العمود كامل في الذاكرة)
+    def regressor(self):
+        dtype = self.resolve()
+        if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+            return False
+        if not self.minimum < self.maximum:
+            return False
+        return not (pd.api.types.is_integer_dtype(dtype) and self.increasing)
+
+
+# قراءة CSV على دفعات مباشرة من الملف المرفوع (بدون نسخه في الذاكرة)
+def iter_csv_chunks(source, chunk_rows=CHUNK_ROWS, progress=None):
+    with pd.read_csv(source, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield _advance(chunk, source, progress)
+
+
+# قراءة Excel سطر بسطر بوضع read_only في openpyxl، ونجمعو الأسطر في دفعات
+def iter_excel_chunks(source, chunk_rows=CHUNK_ROWS, progress=None):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(name) if name is not None else f'عمود {i + 1}' for i, name in enumerate(header)]
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunk_rows:
+                yield _advance(pd.DataFrame(batch, columns=columns), source, progress)
+                batch = []
+        if batch:
+            yield _advance(pd.DataFrame(batch, columns=columns), source, progress)
+    finally:
+        workbook.close()
+
+
+# قراءة الملف (CSV أو Excel) دفعة بدفعة بأنواع أعمدة ثابتة:
+# المرور الأول يحدد نوع كل عمود من كل الدفعات (أصغر نوع بلا ضياع، category للنص اللي قيمه قليلة)،
+# والمرور الثاني يحول كل دفعة لنفس الأنواع. الذاكرة هي دفعة وحدة، ماشي الملف كامل
+# إذا تعطى scans (قاموس)، يتعمر بملخص كل عمود منين يكمل المرور الأول
+def iter_table(source, name, chunk_rows=CHUNK_ROWS, progress=None, scans=None):
+    extension = os.path.splitext(name)[1].lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"نوع الملف غير مدعوم: {extension}")
+    read = iter_csv_chunks if extension == '.csv' else iter_excel_chunks
+
+    scans = {} if scans is None else scans
+    source.seek(0)
+    for chunk in read(source, chunk_rows, progress):
+        for col in chunk.columns:
+            scans.setdefault(col, ColumnScan()).update(chunk[col])
+    dtypes = {col: scan.resolve() for col, scan in scans.items()}
+
+    if progress is not None:
+        progress.current_pass = 1
+    source.seek(0)
+    for chunk in read(source, chunk_rows, progress):
+        yield _convert(chunk, dtypes)
+    if progress is not None:
+        progress.fraction = 1.0
+
+
+def _convert(chunk, dtypes):
+    for col, dtype in dtypes.items():
+        values = chunk[col]
+        if _is_text(values) and (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)):
+            values = pd.to_numeric(values, errors='coerce')
+        if values.dtype != dtype:
+            values = values.astype(dtype)
+        chunk[col] = values
+    return chunk
+
+
+def _is_text(values):
+    return pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)
+
+
+def _advance(chunk, source, progress):
+    if progress is not None:
+        if progress.current_pass == 0:
+            progress.rows += len(chunk)
+        if progress.total_bytes and hasattr(source, 'tell'):
+            try:
+                done = min(source.tell() / progress.total_bytes, 1.0)
+            except (OSError, ValueError):
+                return chunk
+            progress.fraction = (progress.current_pass + done) / progress.passes
+    return chunk
@@ -0,0 +1,177 @@
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# القياس يتفعل بمتغير البيئة BASS_INSTRUMENT=1 ويتقرا مرة وحدة عند التحميل
+# إذا كان مطفي: stage يرجع نفس nullcontext و timed يرجع الدالة كيف ما هي، يعني بلا أي كلفة
+ENABLED = os.environ.get('BASS_INSTRUMENT', '').lower() in ('1', 'true', 'yes')
+
+# منفذ نقطة /metrics بصيغة Prometheus (اختياري)، وعنوان الربط: محلي افتراضيا،
+# و BASS_METRICS_HOST=0.0.0.0 يفتحها على كل الواجهات (مثلا إذا Prometheus في حاوية أخرى)
+METRICS_PORT = os.environ.get('BASS_METRICS_PORT')
+METRICS_HOST = os.environ.get('BASS_METRICS_HOST', '127.0.0.1')
+
+# كل مرحلة تنكتب سطر JSON في هذا الـ logger (DEBUG للمراحل، INFO لمجموع القسم)
+logger = logging.getLogger('bass.timing')
+
+_NOOP = nullcontext()
+_section = contextvars.ContextVar('section', default='-')
+_timings = {}
+_lock = threading.Lock()
+_server = None
+
+
+# تسجيل مدة مرحلة: العدد والمجموع والأقصى لكل (قسم، مرحلة)
+def record(stage, seconds):
+    section = _section.get()
+    with _lock:
+        entry = _timings.setdefault((section, stage), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+    level = logging.INFO if stage == 'render' else logging.DEBUG
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps({'section': section, 'stage': stage, 'ms': round(seconds * 1000, 3)},
+                                     ensure_ascii=False))
+
+
+@contextmanager
+def _timer(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+
+# قياس كتلة كود: with stage('fit'): ...
+def stage(name):
+    return _timer(name) if ENABLED else _NOOP
+
+
+# قياس دالة كاملة، والتغليف يصير غير إذا كان القياس مفعل
+def timed(name):
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+@contextmanager
+def _section_timer(title):
+    token = _section.set(title)
+    try:
+        with _timer('render'):
+            yield
+    finally:
+        _section.reset(token)
+
+
+# كل المراحل داخل هذه الكتلة تتسجل باسم القسم، والقسم كامل يتسجل كمرحلة 'render'
+def section(title):
+    return _section_timer(title) if ENABLED else _NOOP
+
+
+def reset():
+    with _lock:
+        _timings.clear()
+
+
+# جدول المدد: سطر لكل (قسم، مرحلة) بالملي ثانية
+def timings_frame():
+    import pandas as pd
+
+    with _lock:
+        rows = [(section, stage, count, total * 1000, total * 1000 / count, peak * 1000)
+                for (section, stage), (count, total, peak) in sorted(_timings.items())]
+    return pd.DataFrame(rows, columns=['section', 'stage', 'calls', 'total_ms', 'mean_ms', 'max_ms'])
+
+
+# جدول الذواكر المؤقتة: إصابات وإخفاقات كل ذاكرة، مع ذاكرة تشكيل النص العربي (lru_cache)
+def cache_frame():
+    import pandas as pd
+
+    return pd.DataFrame(_all_cache_stats()).T
+
+
+def _all_cache_stats():
+    from engine.arabic import display_arabic_text
+    from engine.cache import cache_stats
+
+    stats = cache_stats()
+    info = display_arabic_text.cache_info()
+    stats['arabic'] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+    return stats
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# كل الأرقام بصيغة نص Prometheus (exposition format)
+def prometheus_text():
+    with _lock:
+        timings = sorted(_timings.items())
+    lines = [
+        '# HELP bass_stage_seconds_total Time spent in each stage of each section.',
+        '# TYPE bass_stage_seconds_total counter',
+    ]
+    for (section, stage), (count, total, peak) in timings:
+        lines.append(f'bass_stage_seconds_total{{section="{_label(section)}",stage="{_label(stage)}"}} {total:.6f}')
+    lines += ['# HELP bass_stage_calls_total Number of times each stage ran.', '# TYPE bass_stage_calls_total counter']
+    for (section, stage), (count, total, peak) in timings:
+        lines.append(f'bass_stage_calls_total{{section="{_label(section)}",stage="{_label(stage)}"}} {count}')
+
+    stats = _all_cache_stats()
+    for metric, field, kind in (('bass_cache_hits_total', 'hits', 'counter'),
+                                ('bass_cache_misses_total', 'misses', 'counter'),
+                                ('bass_cache_entries', 'size', 'gauge')):
+        lines.append(f'# TYPE {metric} {kind}')
+        for name, values in stats.items():
+            lines.append(f'{metric}{{cache="{_label(name)}"}} {values[field]}')
+    return '\n'.join(lines) + '\n'
+
+
+# خادم HTTP صغير في خيط منفصل يرجع prometheus_text على /metrics، يتشغل مرة وحدة في العملية
+def serve_metrics(port=None, host=None):
+    global _server
+    port = port or METRICS_PORT
+    host = host or METRICS_HOST
+    if not ENABLED or not port:
+        return None
+    with _lock:
+        if _server is not None:
+            return _server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        _server = ThreadingHTTPServer((host, int(port)), Handler)
+        threading.Thread(target=_server.serve_forever, name='bass-metrics', daemon=True).start()
+    return _server
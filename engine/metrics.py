@@ -0,0 +1,21 @@
+import numpy as np
+
+
+# معايير التقييم لنموذج واحد
+def calculate_metrics(y_true, y_pred):
+    metrics = batch_metrics(y_true, np.asarray(y_pred, dtype=np.float64).reshape(-1, 1))
+    return {name: values[0] for name, values in metrics.items()}
+
+
+# نفس المعايير لعدة نماذج مرة وحدة: كل عمود في predictions هو تنبؤات نموذج
+def batch_metrics(y_true, predictions):
+    y_true = np.asarray(y_true, dtype=np.float64).reshape(-1, 1)
+    errors = y_true - predictions
+    mse = np.mean(errors ** 2, axis=0)
+    ss_tot = np.sum((y_true - y_true.mean()) ** 2)
+    return {
+        'MSE': mse,
+        'RMSE': np.sqrt(mse),
+        'MAE': np.mean(np.abs(errors), axis=0),
+        'R²': 1 - mse * len(y_true) / ss_tot,
+    }
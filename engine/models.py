@@ -0,0 +1,238 @@
+import numpy as np
+import statsmodels.api as sm
+from scipy import stats
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+
+from engine import instrument
+from engine.bootstrap import bootstrap_coefficients, percentile_intervals
+from engine.cache import LRUCache, fingerprint
+from engine.crossval import cross_validate_subsets, make_splits
+from engine.diagnostics import HeteroskedasticityDiagnostics
+from engine.influence import InfluenceDiagnostics
+from engine.ols import fit_ols_chunks, fit_split_chunks
+from engine.penalized import PENALTIES, cross_validate_path, regularization_path
+from engine.permutation import permutation_f_test
+from engine.rls import RecursiveLeastSquares
+from engine.rolling import rolling_ols
+from engine.selection import prepare_problem, search_best_subsets, stepwise
+from engine.subsets import compare_subsets
+from engine.summary import coefficient_table, fit_table, residual_diagnostics
+from engine.vif import variance_inflation_factors
+
+# النماذج المقدرة مشتركة بين كل الجلسات، والمفتاح هو بصمة البيانات ومواصفات النموذج
+model_cache = LRUCache('models', maxsize=256)
+
+
+def _cached(spec, compute, *inputs):
+    if instrument.ENABLED:
+        # المرحلة تتسمى باسم المواصفة (مثلا ols أو ols_summary)، والحساب يتقاس غير كي ما يكونش في الذاكرة
+        name = spec[0] if isinstance(spec, tuple) else spec
+        with instrument.stage('fingerprint'):
+            key = fingerprint(spec, *inputs)
+        return model_cache.get_or_compute(key, instrument.timed(name)(compute))
+    return model_cache.get_or_compute(fingerprint(spec, *inputs), compute)
+
+
+# نموذج الانحدار الخطي (sklearn)
+def fit_linear(X, y):
+    def compute():
+        model = LinearRegression()
+        model.fit(X, y)
+        return model
+
+    return _cached('linear', compute, X, y)
+
+
+# نموذج OLS مع ثابت (statsmodels)
+def fit_ols(X, y):
+    return _cached('ols', lambda: sm.OLS(y, sm.add_constant(X)).fit(), X, y)
+
+
+# نموذج OLS على دفعات (للبيانات الكبيرة)، source_key يعرف مصدر الدفعات
+def fit_ols_streaming(source_key, make_chunks, regressors, target):
+    def compute():
+        return fit_ols_chunks(make_chunks(), regressors, target)
+
+    return _cached(('ols_chunks', tuple(regressors), target), compute, source_key)
+
+
+# تقسيم تدريب/اختبار وتقدير OLS على دفعات (للملفات المرفوعة)، بنفس مفتاح مصدر الدفعات
+def fit_split_streaming(source_key, make_chunks, regressors, target, test_size=0.2, seed=42):
+    def compute():
+        return fit_split_chunks(make_chunks, regressors, target, test_size=test_size, seed=seed)
+
+    return _cached(('split_chunks', tuple(regressors), target, test_size, seed), compute, source_key)
+
+
+# اختبارات عدم تجانس التباين والأخطاء المعيارية القوية من بواقي نفس نموذج OLS
+# sort_by: رقم العمود في X (بدون الثابت) اللي نرتبو به لاختبار Goldfeld-Quandt
+def heteroskedasticity_diagnostics(X, y, sort_by=None):
+    def compute():
+        model = fit_ols(X, y)
+        return HeteroskedasticityDiagnostics(model.model.exog, model.resid, model.model.exog_names,
+                                             gq_sort=None if sort_by is None else sort_by + 1)
+
+    return _cached(('heteroskedasticity', sort_by), compute, X, y)
+
+
+# مسار Ridge أو Lasso أو Elastic Net كامل (100 قيمة λ) مع خطأ التحقق المتقاطع لكل λ
+def penalized_path(X, y, penalty, folds=5, seed=0):
+    def compute():
+        path = regularization_path(X, y, PENALTIES[penalty], names=X.columns)
+        path.cv_mean, path.cv_std = cross_validate_path(X, y, path, folds, seed)
+        return path
+
+    return _cached(('penalized', penalty, folds, seed), compute, X, y)
+
+
+# المربعات الصغرى التكرارية على كل الأسطر بالترتيب (للبواقي التكرارية و CUSUM)
+# النتيجة مشتركة بين الجلسات، لذلك لإضافة أسطر جديدة نستعملو نسخة منها (copy)
+def recursive_fit(X, y, names):
+    return _cached(('rls', tuple(names)), lambda: RecursiveLeastSquares(names).update(X, y), X, y)
+
+
+# انحدار بنافذة متحركة أو متوسعة (window=None)، كل النوافذ في حساب واحد
+def rolling_regression(X, y, window, names, index=None):
+    def compute():
+        return rolling_ols(X, y, window, names, index)
+
+    return _cached(('rolling', window, tuple(names)), compute, X, y, index)
+
+
+# تنبؤ بقيمة جديدة من نموذج OLS المخزن، بلا إعادة تقدير
+# يرجع القيمة المتوقعة مع فترة الثقة للمتوسط وفترة التنبؤ لقيمة فردية
+def predict_with_intervals(X, y, x_new, alpha=0.05):
+    model = fit_ols(X, y)
+    x0 = np.concatenate([[1.0], np.atleast_1d(np.asarray(x_new, dtype=np.float64))])
+    mean = float(x0 @ np.asarray(model.params))
+    se_mean = float(np.sqrt(x0 @ np.asarray(model.cov_params()) @ x0))
+    se_obs = float(np.sqrt(se_mean ** 2 + model.scale))
+    q = stats.t.ppf(1 - alpha / 2, model.df_resid)
+    return {
+        'mean': mean,
+        'mean_ci': (mean - q * se_mean, mean + q * se_mean),
+        'obs_ci': (mean - q * se_obs, mean + q * se_obs),
+    }
+
+
+# ملخص النموذج المختصر: جدول المعاملات وجدول جودة التوفيق، من النموذج المقدر بلا summary() الكاملة
+def ols_summary(X, y):
+    def compute():
+        model = fit_ols(X, y)
+        return coefficient_table(model), fit_table(model)
+
+    return _cached('ols_summary', compute, X, y)
+
+
+# تشخيصات البواقي الإضافية (Omnibus، Jarque-Bera، Durbin-Watson، رقم الشرط)، غير كي يطلبها المستخدم
+def ols_diagnostics(X, y):
+    def compute():
+        model = fit_ols(X, y)
+        return residual_diagnostics(model.resid, model.model.exog)
+
+    return _cached('ols_diagnostics', compute, X, y)
+
+
+# تشخيصات التأثير لكل مشاهدة (الرفع، البواقي المعيارية، Cook، DFFITS، DFBETAS، PRESS) من QR واحد
+def influence_diagnostics(X, y):
+    names = list(X.columns) if hasattr(X, 'columns') else None
+    return _cached('influence', lambda: InfluenceDiagnostics(X, y, names=names), X, y)
+
+
+# فترات ثقة Bootstrap للمعاملات بنفس شكل conf_int، مع البذرة لإعادة نفس النتيجة
+def bootstrap_conf_int(X, y, method, replicates, seed, alpha=0.05):
+    def compute():
+        coefs = bootstrap_coefficients(X, y, method, replicates, seed)
+        return percentile_intervals(coefs, fit_ols(X, y).params.index, alpha)
+
+    return _cached(('bootstrap', method, replicates, seed, alpha), compute, X, y)
+
+
+# اختبار Wald للقيد R b = r على نموذج OLS مع ثابت (R يشمل عمود الثابت)
+def wald_test(X, y, R, r=None):
+    def compute():
+        restriction = R if r is None else (R, r)
+        return fit_ols(X, y).wald_test(restriction, scalar=True)
+
+    return _cached('wald', compute, X, y, R, r)
+
+
+# اختبار القيد R b = r بالتبديلات على نموذج OLS مع ثابت (R يشمل عمود الثابت)
+def restriction_permutation_test(X, y, R, r=None, method='permutation', max_permutations=10000, alpha=0.05, seed=0):
+    def compute():
+        return permutation_f_test(sm.add_constant(X), y, R, r, method, max_permutations, alpha, seed)
+
+    return _cached(('permutation', method, max_permutations, alpha, seed), compute, X, y, R, r)
+
+
+# تقسيم البيانات إلى تدريب واختبار
+def split_data(X, y, test_size, random_state):
+    def compute():
+        return tuple(train_test_split(X, y, test_size=test_size, random_state=random_state))
+
+    return _cached(('split', test_size, random_state), compute, X, y)
+
+
+# مقارنة عدة نماذج مرشحة من مصفوفة Gram مشتركة
+def compare_candidates(X_train, y_train, X_test, y_test, candidates):
+    def compute():
+        return compare_subsets(X_train, y_train, X_test, y_test, candidates)
+
+    return _cached('compare', compute, X_train, y_train, X_test, y_test, candidates)
+
+
+# التحقق المتقاطع للنماذج المرشحة: (متوسط، انحراف معياري) لمعايير التقييم عبر الطيات
+def cross_validate_candidates(X, y, candidates, scheme, folds=5, repeats=10, seed=0):
+    def compute():
+        splits = make_splits(len(y), scheme, folds, repeats, seed)
+        return cross_validate_subsets(X, y, candidates, splits)
+
+    return _cached(('crossval', scheme, folds, repeats, seed), compute, X, y, candidates)
+
+
+# البحث عن أفضل المجموعات الجزئية من المتغيرات، يرجع الترتيب الجزئي على مراحل
+# الترتيب النهائي يتخزن، والطلب الموالي بنفس البيانات يرجعه مباشرة في مرحلة وحدة
+def search_subsets(X_train, y_train, X_test, y_test, criterion, top=20):
+    key = fingerprint(('subset_search', criterion, top), X_train, y_train, X_test, y_test)
+    cached = model_cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+    problem = prepare_problem(X_train, y_train, X_test, y_test)
+    for leaderboard, done, total, evaluated in search_best_subsets(problem, criterion, top):
+        result = (_named(leaderboard, X_train.columns), done, total, evaluated)
+        yield result
+    model_cache.set(key, result)
+
+
+# الاختيار التدريجي (أمامي أو خلفي) بنفس المعايير
+def stepwise_selection(X_train, y_train, X_test, y_test, criterion, direction):
+    def compute():
+        problem = prepare_problem(X_train, y_train, X_test, y_test)
+        columns = list(X_train.columns)
+        return [(step, columns[var] if var is not None else None, action, score, [columns[i] for i in subset])
+                for step, var, action, score, subset in stepwise(problem, criterion, direction)]
+
+    return _cached(('stepwise', criterion, direction), compute, X_train, y_train, X_test, y_test)
+
+
+def _named(leaderboard, columns):
+    return [(score, [columns[i] for i in subset]) for score, subset in leaderboard]
+
+
+# عامل تضخم التباين لكل متغير (من معكوس مصفوفة الارتباط مرة وحدة)
+def compute_vif(X):
+    return _cached('vif', lambda: variance_inflation_factors(X), X)
+
+
+# المعاملات المعيارية (بعد توحيد X و y)
+def standardized_coefficients(X, y):
+    from sklearn.preprocessing import StandardScaler
+
+    def compute():
+        X_scaled = StandardScaler().fit_transform(X)
+        y_scaled = StandardScaler().fit_transform(np.asarray(y).reshape(-1, 1)).ravel()
+        return fit_linear(X_scaled, y_scaled).coef_
+
+    return _cached('standardized', compute, X, y)
@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# أقصى عدد نقاط (الفعلية، المتوقعة) من بيانات الاختبار نحتفظو بها للرسم في التقدير على دفعات
+SAMPLE_POINTS = 20_000
+
+
+# الإحصاءات الكافية لنموذج OLS: X'X و X'y و y'y و n
+# تتجمع دفعة بدفعة، والذاكرة تعتمد غير على عدد المتغيرات ماشي على عدد الأسطر
+# نطرحو متوسطات أول دفعة (shift) قبل الجمع باش نتفادو ضياع الدقة في المصفوفات الكبيرة
+class SufficientStats:
+    def __init__(self, names):
+        self.names = list(names)
+        k = len(self.names)
+        self.gram = np.zeros((k + 2, k + 2))
+        self.n = 0
+        self.x_shift = None
+        self.y_shift = None
+
+    def update(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        keep = np.isfinite(y) & np.isfinite(X).all(axis=1)
+        if not keep.all():
+            X, y = X[keep], y[keep]
+        if len(y) == 0:
+            return self
+        if self.x_shift is None:
+            self.x_shift = X.mean(axis=0)
+            self.y_shift = y.mean()
+
+        Z = np.empty((len(y), X.shape[1] + 2))
+        Z[:, 0] = 1.0
+        np.subtract(X, self.x_shift, out=Z[:, 1:-1])
+        np.subtract(y, self.y_shift, out=Z[:, -1])
+        self.gram += Z.T @ Z
+        self.n += len(y)
+        return self
+
+    def fit(self):
+        return OLSResult.from_gram(self.gram, self.n, self.names, self.x_shift, self.y_shift)
+
+
+# نتائج OLS بنفس أسماء statsmodels (params, bse, tvalues, pvalues, ...)
+class OLSResult:
+    def __init__(self, params, cov, ssr, centered_tss, nobs):
+        self.params = params
+        self.nobs = nobs
+        self.df_model = len(params) - 1
+        self.df_resid = nobs - len(params)
+        self.ssr = ssr
+        self.centered_tss = centered_tss
+        self.scale = ssr / self.df_resid
+        self.normalized_cov_params = cov
+        self._cov = cov * self.scale
+        self.bse = pd.Series(np.sqrt(np.diag(self._cov)), index=params.index)
+        self.tvalues = params / self.bse
+        self.pvalues = pd.Series(2 * stats.t.sf(np.abs(self.tvalues), self.df_resid), index=params.index)
+        self.ess = centered_tss - ssr
+        self.rsquared = 1 - ssr / centered_tss
+        self.rsquared_adj = 1 - (nobs - 1) / self.df_resid * (1 - self.rsquared)
+        self.mse_model = self.ess / self.df_model if self.df_model else np.nan
+        self.fvalue = self.mse_model / self.scale
+        self.f_pvalue = stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    # من المصفوفة [1, X - x_shift, y - y_shift]'[1, X - x_shift, y - y_shift]
+    @classmethod
+    def from_gram(cls, gram, n, names, x_shift, y_shift):
+        p = gram.shape[0] - 1
+        xtx = gram[:p, :p]
+        xty = gram[:p, p]
+        xtx_inv = _inverse(xtx)
+        beta = xtx_inv @ xty
+        ssr = max(gram[p, p] - beta @ xty, 0.0)
+        centered_tss = gram[p, p] - gram[0, p] ** 2 / n
+
+        # نرجعو المعاملات للمتغيرات الأصلية: الثابت = a + y_shift - b'x_shift
+        transform = np.eye(p)
+        transform[0, 1:] = -x_shift
+        params = transform @ beta
+        params[0] += y_shift
+        cov = transform @ xtx_inv @ transform.T
+        index = ['const'] + [str(name) for name in names]
+        result = cls(pd.Series(params, index=index), cov, ssr, centered_tss, n)
+        # الانحرافات المعيارية من نفس المجاميع، للمعاملات المعيارية بلا مرور آخر على البيانات
+        variances = np.diag(gram)[1:] - gram[0, 1:] ** 2 / n
+        result.x_std = np.sqrt(np.maximum(variances[:-1], 0.0) / n)
+        result.y_std = np.sqrt(max(variances[-1], 0.0) / n)
+        return result
+
+    # المعاملات المعيارية b_j × sd(x_j) / sd(y)
+    def standardized_params(self):
+        return self.params.to_numpy()[1:] * self.x_std / self.y_std
+
+    def cov_params(self):
+        return pd.DataFrame(self._cov, index=self.params.index, columns=self.params.index)
+
+    def conf_int(self, alpha=0.05):
+        q = stats.t.ppf(1 - alpha / 2, self.df_resid)
+        return pd.DataFrame({0: self.params - q * self.bse, 1: self.params + q * self.bse})
+
+
+# تقدير OLS من دفعات (DataFrame) بدون ما نحملو البيانات كاملة
+def fit_ols_chunks(chunks, regressors, target):
+    accumulator = SufficientStats(regressors)
+    for chunk in chunks:
+        accumulator.update(chunk[list(regressors)].to_numpy(dtype=np.float64),
+                           chunk[target].to_numpy(dtype=np.float64))
+    return accumulator.fit()
+
+
+# نتيجة التقسيم تدريب/اختبار على دفعات: نموذج التدريب، R² للاختبار، وعينة عشوائية من الاختبار للرسم
+class SplitFit:
+    def __init__(self, model, r2_test, nobs_test, y_test, y_pred_test):
+        self.model = model
+        self.r2_test = r2_test
+        self.nobs_test = nobs_test
+        self.y_test = y_test
+        self.y_pred_test = y_pred_test
+
+
+# تقسيم تدريب/اختبار وتقدير OLS على دفعات: كل سطر يروح للاختبار باحتمال test_size
+# المولد ببذرة ثابتة ويمشي بنفس ترتيب الدفعات، لذلك المرور الثاني يلقى نفس التقسيم
+# المرور الأول يجمع إحصاءات التدريب، والثاني يحسب R² للاختبار ويحتفظ بأقصى sample نقطة عشوائية للرسم
+def fit_split_chunks(make_chunks, regressors, target, test_size=0.2, seed=42, sample=SAMPLE_POINTS):
+    train = SufficientStats(regressors)
+    rng = np.random.default_rng(seed)
+    for X, y in _finite_arrays(make_chunks(), regressors, target):
+        test = rng.random(len(y)) < test_size
+        train.update(X[~test], y[~test])
+    model = train.fit()
+    intercept, slopes = model.params.iloc[0], model.params.to_numpy()[1:]
+
+    rng = np.random.default_rng(seed)
+    picker = np.random.default_rng([seed, 1])
+    n, total, total_sq, sse = 0, 0.0, 0.0, 0.0
+    keys, kept_y, kept_pred = np.empty(0), np.empty(0), np.empty(0)
+    for X, y in _finite_arrays(make_chunks(), regressors, target):
+        test = rng.random(len(y)) < test_size
+        X, y = X[test], y[test]
+        prediction = intercept + X @ slopes
+        resid = y - prediction
+        # مجاميع حول y_shift باش الطرح في R² ما يضيعش الدقة
+        centered = y - train.y_shift
+        n += len(y)
+        total += centered.sum()
+        total_sq += centered @ centered
+        sse += resid @ resid
+
+        # العينة: أصغر sample مفتاح عشوائي من كل أسطر الاختبار اللي فاتت
+        keys = np.concatenate([keys, picker.random(len(y))])
+        kept_y = np.concatenate([kept_y, y])
+        kept_pred = np.concatenate([kept_pred, prediction])
+        if len(keys) > sample:
+            keep = np.argpartition(keys, sample)[:sample]
+            keys, kept_y, kept_pred = keys[keep], kept_y[keep], kept_pred[keep]
+
+    r2_test = 1 - sse / (total_sq - total ** 2 / n) if n > 1 else np.nan
+    return SplitFit(model, r2_test, n, kept_y, kept_pred)
+
+
+def _finite_arrays(chunks, regressors, target):
+    for chunk in chunks:
+        X = chunk[list(regressors)].to_numpy(dtype=np.float64)
+        y = chunk[target].to_numpy(dtype=np.float64)
+        keep = np.isfinite(y) & np.isfinite(X).all(axis=1)
+        if not keep.all():
+            X, y = X[keep], y[keep]
+        yield X, y
+
+
+# معكوس X'X، مع pinv كحل احتياطي إذا كانت المصفوفة شبه منفردة
+def _inverse(xtx):
+    try:
+        chol = np.linalg.cholesky(xtx)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(xtx)
+    chol_inv = np.linalg.inv(chol)
+    return chol_inv.T @ chol_inv
@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+
+# نسبة عقوبة L1 لكل نوع: Ridge (L2 فقط)، Lasso (L1 فقط)، Elastic Net (نص ونص)
+PENALTIES = {'ridge': 0.0, 'lasso': 1.0, 'elastic_net': 0.5}
+
+# Ridge ما عندوش λ_max طبيعي (ما كاين حتى λ يصفر كل المعاملات)، نستعملو نفس حيلة glmnet
+RIDGE_ALPHA_FLOOR = 1e-3
+
+TOLERANCE = 1e-7
+MAX_PASSES = 1000
+
+
+# مسار التنظيم (regularization path) كامل: المعاملات لكل λ بالمتغيرات الأصلية
+# مع خطأ التحقق المتقاطع (متوسط وانحراف MSE) إذا تحسب
+class RegularizationPath:
+    def __init__(self, lambdas, coefs, intercepts, alpha):
+        self.lambdas = lambdas
+        self.coefs = coefs
+        self.intercepts = intercepts
+        self.alpha = alpha
+        # عدد المعاملات غير الصفرية لكل λ
+        self.df = (coefs != 0).sum(axis=1)
+        self.cv_mean = None
+        self.cv_std = None
+
+    # λ اللي تعطي أصغر خطأ تحقق متقاطع
+    def best_lambda(self):
+        return self.lambdas[int(np.argmin(self.cv_mean))]
+
+    # أكبر λ خطؤها في حدود خطأ معياري واحد من الأحسن (نموذج أبسط بنفس الدقة تقريبا)
+    def lambda_1se(self, folds):
+        best = int(np.argmin(self.cv_mean))
+        limit = self.cv_mean[best] + self.cv_std[best] / np.sqrt(folds)
+        return self.lambdas[int(np.flatnonzero(self.cv_mean <= limit)[0])]
+
+
+# المسار كامل بالنزول الإحداثي (coordinate descent) على مصفوفة X'X/n الموحدة
+# - كل λ تبدا من حل λ اللي قبلها (warm start)، لذلك تحتاج غير دورات قليلة
+# - قاعدة الفرز القوية (strong rule) تستبعد المتغيرات اللي يبقاو صفر، ومن بعد نتحققو بشروط KKT
+# - نفس الحل يخدم على عدة مسائل مرة وحدة (مثلا كل طيات التحقق المتقاطع)، كل تحديث إحداثي عملية مصفوفات على كل المسائل
+def regularization_path(X, y, alpha=1.0, n_lambdas=100, eps=1e-3, names=None, lambdas=None):
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    n, k = X.shape
+
+    gram, corr, x_mean, x_scale, y_mean = _standardized_moments(_cross_products(X, y)[None])
+    if lambdas is None:
+        lambdas = lambda_grid(corr[0], alpha, n_lambdas, eps)
+    beta = solve_path(gram, corr, lambdas, alpha)[0]
+
+    coefs = beta / x_scale
+    intercepts = y_mean - coefs @ x_mean[0]
+    columns = [str(name) for name in names] if names is not None else [f'x{i + 1}' for i in range(k)]
+    return RegularizationPath(lambdas, pd.DataFrame(coefs, index=lambdas, columns=columns),
+                              pd.Series(intercepts, index=lambdas), alpha)
+
+
+# شبكة λ لوغاريتمية من λ_max (كل المعاملات صفر) إلى eps × λ_max
+# لـ Ridge الشبكة تنزل حتى eps × max|c| باش توصل لتقليص صغير قريب من OLS
+def lambda_grid(corr, alpha, n_lambdas=100, eps=1e-3):
+    scale = np.max(np.abs(corr))
+    if alpha < RIDGE_ALPHA_FLOOR:
+        return np.geomspace(scale / RIDGE_ALPHA_FLOOR, scale * eps, n_lambdas)
+    return np.geomspace(scale / alpha, scale / alpha * eps, n_lambdas)
+
+
+# خطأ التحقق المتقاطع لكل λ من مصفوفات الطيات: X'X لبيانات التدريب = X'X الكاملة - X'X للطية
+# كل الطيات تتحل مع بعض في solve_path، والنتيجة (متوسط MSE، انحرافه) لكل λ
+def cross_validate_path(X, y, path, folds=5, seed=0):
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    n = len(y)
+    assignment = np.random.default_rng(seed).permutation(n) % folds
+
+    # نطرحو متوسطات العينة كاملة قبل الجمع باش الطرح ما يضيعش الدقة
+    shift_x, shift_y = X.mean(axis=0), y.mean()
+    X, y = X - shift_x, y - shift_y
+    full = _cross_products(X, y)
+    held_out = [assignment == fold for fold in range(folds)]
+    training = np.stack([full - _cross_products(X[mask], y[mask]) for mask in held_out])
+
+    gram, corr, x_mean, x_scale, y_mean = _standardized_moments(training)
+    beta = solve_path(gram, corr, path.lambdas, path.alpha)
+    coefs = beta / x_scale[:, None, :]
+    intercepts = y_mean[:, None] - np.einsum('flk,fk->fl', coefs, x_mean)
+
+    mse = np.empty((folds, len(path.lambdas)))
+    for fold, mask in enumerate(held_out):
+        predictions = X[mask] @ coefs[fold].T + intercepts[fold]
+        mse[fold] = np.mean(np.square(y[mask, None] - predictions), axis=0)
+    return mse.mean(axis=0), mse.std(axis=0, ddof=1)
+
+
+# [1, X, y]'[1, X, y]
+def _cross_products(X, y):
+    Z = np.column_stack([np.ones(len(y)), X, y])
+    return Z.T @ Z
+
+
+# من المجاميع: المتوسطات، الانحرافات المعيارية، X'X/n و X'y/n للمتغيرات الموحدة (لكل مسألة)
+def _standardized_moments(products):
+    n = products[:, 0, 0]
+    means = products[:, 0, 1:] / n[:, None]
+    cov = products[:, 1:, 1:] / n[:, None, None] - means[:, :, None] * means[:, None, :]
+    x_mean, y_mean = means[:, :-1], means[:, -1]
+    x_scale = np.sqrt(np.einsum('bii->bi', cov[:, :-1, :-1]))
+    x_scale = np.where(x_scale > 0, x_scale, 1.0)
+    gram = cov[:, :-1, :-1] / (x_scale[:, :, None] * x_scale[:, None, :])
+    corr = cov[:, :-1, -1] / x_scale
+    return gram, corr, x_mean, x_scale, y_mean
+
+
+# الحل لكل λ (من الكبيرة للصغيرة) لعدة مسائل: gram (B, p, p) و corr (B, p) → معاملات (B, L, p)
+# الدالة الهدف: 1/(2n) |y - Xb|² + λ (α |b|₁ + (1 - α)/2 |b|²)
+def solve_path(gram, corr, lambdas, alpha, tol=TOLERANCE, max_passes=MAX_PASSES):
+    problems, p = corr.shape
+    beta = np.zeros((problems, p))
+    # التدرج الجزئي c - G b يتحدث مع كل تغيير في معامل، بلا ما نعاودو نحسبو G b
+    gradient = corr.copy()
+    diag = np.einsum('bii->bi', gram)
+    path = np.empty((problems, len(lambdas), p))
+    previous = lambdas[0]
+
+    for index, lam in enumerate(lambdas):
+        l1, l2 = lam * alpha, lam * (1 - alpha)
+        # قاعدة الفرز القوية: المتغير اللي |c_j - (G b)_j| < α (2λ - λ_السابقة) يبقى صفر في الغالب
+        active = (np.abs(gradient) >= alpha * (2 * lam - previous)) | (beta != 0)
+        while True:
+            _descend(gram, diag, beta, gradient, active, l1, l2, tol, max_passes)
+            # شروط KKT على المتغيرات المستبعدة: إذا |التدرج| > λα لازم يدخل
+            violations = ~active & (np.abs(gradient) > l1 * (1 + 1e-9))
+            if not violations.any():
+                break
+            active |= violations
+        path[:, index] = beta
+        previous = lam
+    return path
+
+
+# دورات النزول الإحداثي على المتغيرات النشطة، وبعد كل دورة نجربو الحل المباشر:
+# إذا عرفنا المتغيرات غير الصفرية وإشاراتها، الحل هو (G_AA + λ(1-α) I)⁻¹ (c_A - λα s_A) بالضبط
+# وإذا حقق شروط KKT نوقفو بلا ما نستناو تقارب الدورات (مهم كي تكون المتغيرات مرتبطة بقوة)
+def _descend(gram, diag, beta, gradient, active, l1, l2, tol, max_passes):
+    columns = np.flatnonzero(active.any(axis=0))
+    for _ in range(max_passes):
+        largest = 0.0
+        for j in columns:
+            old = beta[:, j]
+            z = gradient[:, j] + diag[:, j] * old
+            new = np.where(active[:, j], np.sign(z) * np.maximum(np.abs(z) - l1, 0.0) / (diag[:, j] + l2), 0.0)
+            delta = new - old
+            if not delta.any():
+                continue
+            gradient -= gram[:, :, j] * delta[:, None]
+            beta[:, j] = new
+            largest = max(largest, float(np.max(np.abs(delta) * np.sqrt(diag[:, j]))))
+        if largest < tol or _exact_solution(gram, beta, gradient, active, l1, l2):
+            return
+
+
+def _exact_solution(gram, beta, gradient, active, l1, l2):
+    solutions = []
+    for problem in range(len(beta)):
+        support = beta[problem] != 0
+        signs = np.sign(beta[problem, support])
+        corr = gradient[problem] + gram[problem] @ beta[problem]
+        block = gram[problem][np.ix_(support, support)] + l2 * np.eye(int(support.sum()))
+        try:
+            solution = np.linalg.solve(block, corr[support] - l1 * signs)
+        except np.linalg.LinAlgError:
+            return False
+        if np.any(np.sign(solution) != signs):
+            return False
+        candidate = np.zeros_like(beta[problem])
+        candidate[support] = solution
+        residual = corr - gram[problem] @ candidate
+        if np.any(np.abs(residual[~support]) > l1 * (1 + 1e-8) + 1e-12):
+            return False
+        solutions.append((candidate, residual))
+    for problem, (candidate, residual) in enumerate(solutions):
+        beta[problem] = candidate
+        gradient[problem] = residual
+    return True
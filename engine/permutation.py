@@ -0,0 +1,97 @@
+import numpy as np
+from scipy import stats
+
+METHODS = ('permutation', 'sign_flip')
+
+# أقصى عدد تبديلات في كل دفعة، وبعد كل دفعة نشوفو إذا القرار عند α ولى محسوم
+BATCH = 1000
+
+# أقصى عدد عناصر في مصفوفة البواقي المبدلة لكل دفعة (عدد التبديلات × عدد الأسطر)
+BATCH_ELEMENTS = 4_000_000
+
+# مستوى الثقة لحدود p-value (Clopper-Pearson) اللي نوقفو بها مبكرا
+STOP_CONFIDENCE = 0.999
+
+
+# نتيجة اختبار القيد: F المحسوبة، p-value التقريبية (توزيع F) و p-value بالتبديلات
+class PermutationResult:
+    def __init__(self, fvalue, df_num, df_denom, exceed, permutations, stopped_early):
+        self.fvalue = fvalue
+        self.df_num = df_num
+        self.df_denom = df_denom
+        self.f_pvalue = stats.f.sf(fvalue, df_num, df_denom)
+        self.exceed = exceed
+        self.permutations = permutations
+        self.stopped_early = stopped_early
+        # نحسبو الإحصائية الأصلية ضمن التبديلات باش p-value ما تكونش صفر
+        self.pvalue = (exceed + 1) / (permutations + 1)
+
+
+# اختبار القيد الخطي R b = r بالتبديلات (طريقة Freedman-Lane)
+# نقدرو النموذج المقيد، نبدلو بواقيه ونحسبو F لكل تبديل
+# القيم المقدرة للنموذج المقيد داخل فضاء النموذجين، لذلك:
+#   RSS_u = |e*|² - |Q_u' e*|²   و   RSS_r = |e*|² - |Q_r' e*|²
+# مع Q_u و Q_r من تحليل QR واحد لكل تصميم، وكل دفعة من التبديلات ضرب مصفوفات واحد
+def permutation_f_test(X, y, R, r=None, method='permutation', max_permutations=10000,
+                       alpha=0.05, seed=0, early_stop=True):
+    if method not in METHODS:
+        raise ValueError(f"طريقة غير معروفة: {method}")
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    R = np.atleast_2d(np.asarray(R, dtype=np.float64))
+    r = np.zeros(len(R)) if r is None else np.atleast_1d(np.asarray(r, dtype=np.float64))
+    n, p = X.shape
+    q = np.linalg.matrix_rank(R)
+
+    # نحولو القيد لقيد متجانس: b = b0 + N g مع R b0 = r و N أساس لفضاء نواة R
+    b0 = np.linalg.lstsq(R, r, rcond=None)[0]
+    null_space = np.linalg.svd(R)[2][q:].T
+    y_shifted = y - X @ b0
+
+    q_unrestricted = np.linalg.qr(X)[0]
+    q_restricted = np.linalg.qr(X @ null_space)[0]
+    df_denom = n - p
+
+    restricted_residuals = y_shifted - q_restricted @ (q_restricted.T @ y_shifted)
+
+    def f_statistics(errors):
+        total = np.einsum('ij,ij->i', errors, errors)
+        rss_u = total - np.square(errors @ q_unrestricted).sum(axis=1)
+        rss_r = total - np.square(errors @ q_restricted).sum(axis=1)
+        return ((rss_r - rss_u) / q) / (rss_u / df_denom)
+
+    observed = f_statistics(restricted_residuals[None, :])[0]
+    # تسامح صغير باش التبديل اللي يعطي نفس الترتيب يتحسب مساوي للإحصائية الأصلية
+    threshold = observed * (1 - 1e-10)
+
+    rng = np.random.default_rng(seed)
+    exceed = 0
+    done = 0
+    stopped_early = False
+    while done < max_permutations:
+        size = max(1, min(BATCH, BATCH_ELEMENTS // n, max_permutations - done))
+        if method == 'permutation':
+            # التبديل في مكانه على نسخ البواقي، بلا مصفوفة أرقام أسطر int64 بنفس الحجم
+            errors = np.tile(restricted_residuals, (size, 1))
+            rng.permuted(errors, axis=1, out=errors)
+        else:
+            flips = rng.integers(0, 2, size=(size, n), dtype=np.int8).astype(bool)
+            errors = np.where(flips, -restricted_residuals, restricted_residuals)
+        exceed += int(np.count_nonzero(f_statistics(errors) >= threshold))
+        done += size
+
+        if early_stop and done < max_permutations:
+            lower, upper = _pvalue_bounds(exceed + 1, done + 1)
+            if upper < alpha or lower > alpha:
+                stopped_early = True
+                break
+
+    return PermutationResult(observed, q, df_denom, exceed, done, stopped_early)
+
+
+# حدود Clopper-Pearson لنسبة k من m
+def _pvalue_bounds(k, m):
+    tail = (1 - STOP_CONFIDENCE) / 2
+    lower = stats.beta.ppf(tail, k, m - k + 1) if k > 0 else 0.0
+    upper = stats.beta.ppf(1 - tail, k + 1, m - k) if k < m else 1.0
+    return lower, upper
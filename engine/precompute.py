@@ -0,0 +1,118 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+from engine.instrument import section
+
+# الحساب المسبق يتطفى بـ BASS_PRECOMPUTE=0 (مثلا في قياس الأداء باش ما يخلطش الأرقام)
+ENABLED = os.environ.get('BASS_PRECOMPUTE', '1').lower() not in ('0', 'false', 'no')
+
+# أقصى عدد مهام في الانتظار، وإذا امتلأت الطابور المهام الجديدة تترمى بدل ما تستنى
+MAX_PENDING = 16
+
+# كم يستنى العامل (بالثواني) قبل ما يعاود يشوف إذا كملو العروض التفاعلية
+IDLE_POLL = 0.05
+
+logger = logging.getLogger('bass.precompute')
+
+
+# عامل خلفي واحد يحسب مسبقا نتائج ورسومات الأقسام ويحطها في الذواكر المؤقتة المشتركة
+# - خيط واحد (ماشي عملية) لأن النتائج لازم تكون في ذاكرة نفس العملية اللي تخدم الجلسات
+# - كل مهمة دالة ترجع مولد (generator): بين خطوة وخطوة العامل يوقف إذا كان كاين عرض تفاعلي
+#   ويتحقق من الإيقاف، هكذا ما ياخذش الوقت من الجلسات المفتوحة
+# - إذا طلبت جلسة نتيجة راهي تتحسب في الخلفية، get_or_compute يستنى نفس الحساب بلا ما يعاودو
+class Precomputer:
+    def __init__(self, max_pending=MAX_PENDING):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._condition = threading.Condition()
+        self._interactive = 0
+        self._submitted = set()
+        self._stopped = False
+        self._thread = None
+        self.completed = []
+        self.failed = []
+
+    # إضافة مهمة باسم (مرة وحدة لكل اسم في العملية). ترجع False إذا الطابور ممتلئ أو المهمة مكررة
+    def submit(self, name, task):
+        with self._condition:
+            if self._stopped or name in self._submitted:
+                return False
+            try:
+                self._queue.put_nowait((name, task))
+            except queue.Full:
+                return False
+            self._submitted.add(name)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='precompute', daemon=True)
+                self._thread.start()
+        return True
+
+    # إيقاف العامل (عند خروج العملية): المهام اللي في الانتظار تترمى، واللي بدات تتوقف عند الخطوة الجاية
+    def cancel(self):
+        with self._condition:
+            self._stopped = True
+            while True:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    break
+            self._condition.notify_all()
+        if self._thread is not None:
+            # مهمة فارغة توقظ العامل إذا كان يستنى في الطابور
+            self._queue.put_nowait((None, None))
+
+    # كتلة عرض تفاعلي: العامل ما يبداش خطوة جديدة حتى تكمل كل العروض المفتوحة
+    @contextmanager
+    def interactive(self):
+        with self._condition:
+            self._interactive += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._interactive -= 1
+                self._condition.notify_all()
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _run(self):
+        while True:
+            name, task = self._queue.get()
+            if self._stopped:
+                self._queue.task_done()
+                return
+            try:
+                with section(f'precompute:{name}'):
+                    self._drive(name, task)
+            except Exception:
+                logger.exception('precompute task %s failed', name)
+                self.failed.append(name)
+            finally:
+                self._queue.task_done()
+
+    # كل خطوة من المولد تبدا غير كي يجي دورها، وإذا توقف العامل نسكرو المولد
+    def _drive(self, name, task):
+        steps = task()
+        while self._wait_turn():
+            try:
+                next(steps)
+            except StopIteration:
+                self.completed.append(name)
+                return
+        steps.close()
+
+    # يستنى حتى ما يبقى حتى عرض تفاعلي، ويرجع False إذا توقف العامل
+    def _wait_turn(self):
+        with self._condition:
+            while self._interactive and not self._stopped:
+                self._condition.wait(IDLE_POLL)
+            return not self._stopped
+
+
+precomputer = Precomputer()
+atexit.register(precomputer.cancel)
@@ -0,0 +1,110 @@
+import copy
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from engine.ols import OLSResult
+
+# معامل حدود CUSUM عند مستوى 5% (Brown, Durbin & Evans)
+CUSUM_5PCT = 0.948
+
+
+# المربعات الصغرى التكرارية: تحديث المعاملات و (X'X)⁻¹ و RSS بكل سطر جديد (rank-one update)
+# بلا ما نعاودو التقدير من الصفر، مع إمكانية حذف أقدم الأسطر (downdate) لنافذة متحركة
+# الثابت يتزاد تلقائيا كيف SufficientStats
+class RecursiveLeastSquares:
+    def __init__(self, names, window=None):
+        self.names = list(names)
+        self.window = window
+        self.params = None
+        self.P = None
+        self.ssr = 0.0
+        self.n = 0
+        self.y_sum = 0.0
+        self.y_sq = 0.0
+        # البواقي التكرارية (المعيارية) لكل سطر بعد التهيئة، بترتيب وصولها
+        self.recursive_residuals = []
+        self._rows = deque()
+
+    def copy(self):
+        return copy.deepcopy(self)
+
+    # إضافة سطر أو عدة أسطر
+    def update(self, X, y):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        for row, target in zip(X, y):
+            self._append(np.concatenate([[1.0], row]), float(target))
+        return self
+
+    def _append(self, x, y):
+        self._rows.append((x, y))
+        self.n += 1
+        self.y_sum += y
+        self.y_sq += y * y
+
+        if self.P is None:
+            # التهيئة: نستناو حتى يكون عندنا عدد كافي من الأسطر المستقلة ونقدرو مباشرة
+            X = np.array([row for row, _ in self._rows])
+            if np.linalg.matrix_rank(X) < len(x):
+                return
+            targets = np.array([target for _, target in self._rows])
+            self.P = np.linalg.inv(X.T @ X)
+            self.params = self.P @ (X.T @ targets)
+            self.ssr = float(np.sum(np.square(targets - X @ self.params)))
+        else:
+            # y - x'b قبل التحديث، والبواقي التكرارية هي هذا الخطأ مقسوم على انحرافه المعياري النسبي
+            Px = self.P @ x
+            denom = 1.0 + x @ Px
+            error = y - x @ self.params
+            self.recursive_residuals.append(error / np.sqrt(denom))
+            gain = Px / denom
+            self.params = self.params + gain * error
+            self.P = self.P - np.outer(gain, Px)
+            self.ssr += error * error / denom
+
+        if self.window is not None and len(self._rows) > self.window:
+            self.downdate()
+
+    # حذف أقدم سطر: نفس صيغة Sherman-Morrison بإشارة معاكسة
+    def downdate(self):
+        x, y = self._rows.popleft()
+        self.n -= 1
+        self.y_sum -= y
+        self.y_sq -= y * y
+        if self.P is None:
+            return self
+        Px = self.P @ x
+        denom = 1.0 - x @ Px
+        if denom <= 1e-12:
+            # السطر ضروري لتحديد المعاملات: نعاودو التهيئة من الأسطر الباقية
+            rows, residuals = list(self._rows), self.recursive_residuals
+            self.P, self.params, self.ssr = None, None, 0.0
+            self._rows.clear()
+            self.n, self.y_sum, self.y_sq = 0, 0.0, 0.0
+            for row, target in rows:
+                self._append(row, target)
+            self.recursive_residuals = residuals
+            return self
+        error = y - x @ self.params
+        gain = Px / denom
+        self.params = self.params - gain * error
+        self.P = self.P + np.outer(gain, Px)
+        self.ssr = max(self.ssr - error * error / denom, 0.0)
+        return self
+
+    # النتائج الحالية بنفس شكل OLSResult
+    def fit(self):
+        index = ['const'] + [str(name) for name in self.names]
+        centered_tss = self.y_sq - self.y_sum ** 2 / self.n
+        return OLSResult(pd.Series(self.params, index=index), self.P.copy(), self.ssr, centered_tss, self.n)
+
+    # اختبار CUSUM للاستقرار: المجموع التراكمي للبواقي التكرارية مقسوم على انحرافها المعياري
+    # مع حدود 5%: ±a (√(n-k) + 2 (t-k) / √(n-k))
+    def cusum(self):
+        w = np.asarray(self.recursive_residuals)
+        statistic = np.cumsum(w) / np.std(w, ddof=1)
+        steps = np.arange(1, len(w) + 1)
+        half_width = CUSUM_5PCT * (np.sqrt(len(w)) + 2 * steps / np.sqrt(len(w)))
+        return statistic, -half_width, half_width
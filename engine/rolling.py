@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+
+# نتائج OLS لكل نافذة: جداول (نافذة × معامل) للمعاملات والأخطاء المعيارية، و R² لكل نافذة
+class RollingResult:
+    def __init__(self, params, bse, rsquared, nobs):
+        self.params = params
+        self.bse = bse
+        self.rsquared = rsquared
+        self.nobs = nobs
+
+
+# انحدار بنافذة متحركة (window) أو متوسعة (window=None) في O(n·k²)
+# نحسبو مساهمة كل سطر في X'X و X'y و y'y مرة وحدة، ومن المجاميع التراكمية
+# مجاميع أي نافذة هي فرق مجموعين، ومن بعد حل واحد مجمع (batched) لكل النوافذ
+# نطرحو المتوسطات قبل الجمع (كيف SufficientStats) باش الفروق ما تضيعش الدقة
+def rolling_ols(X, y, window=None, names=None, index=None, min_nobs=None):
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    n, k = X.shape
+    p = k + 1
+    min_nobs = p + 1 if min_nobs is None else max(min_nobs, p + 1)
+
+    x_shift = X.mean(axis=0)
+    y_shift = y.mean()
+    Z = np.column_stack([np.ones(n), X - x_shift, y - y_shift])
+    cross = np.cumsum(Z[:, :, None] * Z[:, None, :], axis=0)
+
+    if window is None:
+        ends = np.arange(min_nobs - 1, n)
+        sums = cross[ends]
+        counts = ends + 1
+    else:
+        ends = np.arange(window - 1, n)
+        sums = cross[ends].copy()
+        sums[1:] -= cross[ends[1:] - window]
+        counts = np.full(len(ends), window)
+
+    xtx = sums[:, :p, :p]
+    xty = sums[:, :p, p]
+    yty = sums[:, p, p]
+    try:
+        xtx_inv = np.linalg.inv(xtx)
+    except np.linalg.LinAlgError:
+        xtx_inv = np.linalg.pinv(xtx)
+    beta = np.einsum('wij,wj->wi', xtx_inv, xty)
+    ssr = np.maximum(yty - np.einsum('wi,wi->w', beta, xty), 0.0)
+    centered_tss = yty - xty[:, 0] ** 2 / counts
+    scale = ssr / (counts - p)
+    bse = np.sqrt(np.einsum('wii->wi', xtx_inv) * scale[:, None])
+
+    # نرجعو الثابت للمتغيرات الأصلية: الثابت = a + y_shift - b'x_shift، وتباينه من (X'X)⁻¹ المحولة
+    transform = np.eye(p)
+    transform[0, 1:] = -x_shift
+    params = beta @ transform.T
+    params[:, 0] += y_shift
+    const_var = np.einsum('i,wij,j->w', transform[0], xtx_inv, transform[0]) * scale
+    bse[:, 0] = np.sqrt(const_var)
+
+    columns = ['const'] + ([str(name) for name in names] if names is not None else [f'x{i + 1}' for i in range(k)])
+    labels = np.asarray(index)[ends] if index is not None else ends
+    return RollingResult(
+        pd.DataFrame(params, index=labels, columns=columns),
+        pd.DataFrame(bse, index=labels, columns=columns),
+        pd.Series(1 - ssr / centered_tss, index=labels),
+        pd.Series(counts, index=labels),
+    )
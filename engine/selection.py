@@ -0,0 +1,238 @@
+import heapq
+import itertools
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+# المعايير المتاحة، وكلها تتحول لقيمة نحاولو نصغروها
+CRITERIA = ('aic', 'bic', 'adj_r2', 'test_rmse')
+
+# المعايير اللي تزيد مع RSS ومع عدد المعلمات، يعني نقدرو نستعملو branch-and-bound
+MONOTONE = ('aic', 'bic', 'adj_r2')
+
+# تحت هذا العدد من المجموعات البحث يتم في نفس العملية لأن تكلفة العمليات أكبر من الربح
+# (عند k=14 العمليات كانت أبطأ: 2.0 ثانية مقابل 1.8 في نفس العملية)
+SERIAL_LIMIT = 2 ** 14
+
+# فوق SERIAL_LIMIT نحسبو أول مهمة في نفس العملية ونقدرو الوقت الكلي منها:
+# إذا كان أقل من هذا (بالثواني) نكملو في نفس العملية، لأن تشغيل عمليات spawn واستيراد numpy فيها ياخذ قريب ثانية
+PARALLEL_MIN_SECONDS = 2.0
+
+# أقصى عدد متغيرات للبحث في كل التوليفات (2^20 نموذج تقريبا)، فوقه نستعملو الاختيار التدريجي
+MAX_EXHAUSTIVE = 20
+
+# عدد العمليات في مجموعة البحث (BASS_SEARCH_PROCESSES)، محدود باش بحث واحد ما ياكلش كل الأنوية
+SEARCH_PROCESSES = int(os.environ.get('BASS_SEARCH_PROCESSES', min(4, os.cpu_count() or 1)))
+
+_pool = None
+_pool_lock = threading.Lock()
+# المجموعة تخدم بحث واحد في كل مرة: الجلسات الأخرى تبحث في نفس العملية بلا ما تستنى في نفس الطابور
+_pool_slot = threading.Lock()
+
+
+# مجموعة العمليات، تتنشأ أول مرة نحتاجوها
+# نستعملو spawn باش ما ننسخوش خيوط خادم Streamlit مع fork
+def _executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=SEARCH_PROCESSES,
+                                        mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+# كل ما يحتاجه البحث: مصفوفات Gram لبيانات التدريب (واختيارا الاختبار) بعد طرح متوسطات التدريب
+# المصفوفات صغيرة (k×k) لذلك تتبعث للعمليات بسرعة
+def prepare_problem(X_train, y_train, X_test=None, y_test=None):
+    X = np.asarray(X_train, dtype=np.float64)
+    y = np.asarray(y_train, dtype=np.float64).ravel()
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - x_mean
+    yc = y - y_mean
+    problem = {
+        'k': X.shape[1],
+        'n': len(y),
+        'gram': Xc.T @ Xc,
+        'xty': Xc.T @ yc,
+        'yty': float(yc @ yc),
+    }
+    if X_test is not None:
+        Xt = np.asarray(X_test, dtype=np.float64) - x_mean
+        yt = np.asarray(y_test, dtype=np.float64).ravel() - y_mean
+        problem.update(test_gram=Xt.T @ Xt, test_xty=Xt.T @ yt, test_yty=float(yt @ yt), n_test=len(yt))
+    return problem
+
+
+def _solve(problem, subset):
+    idx = list(subset)
+    gram = problem['gram'][np.ix_(idx, idx)]
+    xty = problem['xty'][idx]
+    try:
+        chol = np.linalg.cholesky(gram)
+        beta = np.linalg.solve(chol.T, np.linalg.solve(chol, xty))
+    except np.linalg.LinAlgError:
+        beta = np.linalg.lstsq(gram, xty, rcond=None)[0]
+    return beta, max(problem['yty'] - xty @ beta, 1e-300)
+
+
+# قيمة المعيار (كلما صغرت كان النموذج أحسن) من RSS وعدد المعلمات p (مع الثابت)
+def _information_score(problem, criterion, rss, p):
+    n = problem['n']
+    log_likelihood_term = n * (math.log(2 * math.pi * rss / n) + 1)
+    if criterion == 'aic':
+        return log_likelihood_term + 2 * p
+    if criterion == 'bic':
+        return log_likelihood_term + p * math.log(n)
+    if criterion == 'adj_r2':
+        return (rss / (n - p)) / (problem['yty'] / (n - 1)) - 1
+    raise ValueError(f"معيار غير معروف: {criterion}")
+
+
+def score_subset(problem, criterion, subset):
+    beta, rss = _solve(problem, subset)
+    if criterion == 'test_rmse':
+        idx = list(subset)
+        test_rss = (problem['test_yty'] - 2 * beta @ problem['test_xty'][idx]
+                    + beta @ problem['test_gram'][np.ix_(idx, idx)] @ beta)
+        return math.sqrt(max(test_rss, 0.0) / problem['n_test'])
+    return _information_score(problem, criterion, rss, len(subset) + 1)
+
+
+# بحث عمق-أولا في شجرة (إدخال/حذف) كل متغير، انطلاقا من قرارات أولية ثابتة (prefix)
+# RSS للمجموعة العليا (المتغيرات المدخلة + اللي ما تقررتش) حد أدنى لـ RSS كل المجموعات تحتها
+def _search_task(problem, criterion, prefix, top):
+    k = problem['k']
+    monotone = criterion in MONOTONE
+    board = []
+    counters = {'evaluated': 0, 'pruned': 0}
+
+    def threshold():
+        return -board[0][0] if len(board) >= top else math.inf
+
+    def record(score, subset):
+        item = (-score, subset)
+        if len(board) < top:
+            heapq.heappush(board, item)
+        elif item > board[0]:
+            heapq.heapreplace(board, item)
+
+    def visit(depth, included, upper, rss_upper):
+        if not upper:
+            return
+        if monotone:
+            bound = _information_score(problem, criterion, rss_upper, max(len(included), 1) + 1)
+            if bound >= threshold():
+                counters['pruned'] += 1
+                return
+        if depth == k:
+            if included:
+                counters['evaluated'] += 1
+                if monotone:
+                    score = _information_score(problem, criterion, rss_upper, len(included) + 1)
+                else:
+                    score = score_subset(problem, criterion, included)
+                record(score, tuple(included))
+            return
+        visit(depth + 1, included + [depth], upper, rss_upper)
+        reduced = [i for i in upper if i != depth]
+        visit(depth + 1, included, reduced, _solve(problem, reduced)[1] if reduced else 0.0)
+
+    included = [i for i, keep in enumerate(prefix) if keep]
+    upper = included + list(range(len(prefix), k))
+    if upper:
+        visit(len(prefix), included, upper, _solve(problem, upper)[1])
+    return [(-neg, subset) for neg, subset in board], counters
+
+
+# البحث عن أفضل المجموعات الجزئية: مولد يرجع ترتيب جزئي كل ما تكمل مهمة
+# كل عنصر: (الترتيب [(القيمة، المجموعة)...]، المهام المكتملة، عدد المهام، عدد النماذج المقدرة)
+# إذا تسكر المولد قبل ما يكمل (مثلا Streamlit عاود تشغيل الصفحة) المهام اللي ما بداتش تتلغى
+# فوق MAX_EXHAUSTIVE متغير نرفضو البحث (ValueError) لأن عدد النماذج 2^k
+def search_best_subsets(problem, criterion='aic', top=20, processes=None):
+    if criterion not in CRITERIA:
+        raise ValueError(f"معيار غير معروف: {criterion}")
+    k = problem['k']
+    if k > MAX_EXHAUSTIVE:
+        raise ValueError(f"{k} متغير بزاف للبحث في كل التوليفات (الحد {MAX_EXHAUSTIVE})، استعمل الاختيار التدريجي")
+    workers = processes or SEARCH_PROCESSES
+    depth = min(k, max(1, math.ceil(math.log2(4 * workers))))
+    prefixes = list(itertools.product((True, False), repeat=depth))
+
+    leaderboard = []
+    evaluated = 0
+    results = _results(problem, criterion, prefixes, top, workers)
+    try:
+        for done, (board, counters) in enumerate(results, start=1):
+            leaderboard = sorted(leaderboard + board)[:top]
+            evaluated += counters['evaluated']
+            yield leaderboard, done, len(prefixes), evaluated
+    finally:
+        results.close()
+
+
+# نتائج المهام بترتيب انتهائها: في نفس العملية للمسائل الصغيرة أو إذا كانت المجموعة مشغولة ببحث آخر،
+# وإلا على مجموعة العمليات. منين يتسكر المولد المهام اللي ما بداتش تتلغى وتتحرر المجموعة
+def _results(problem, criterion, prefixes, top, workers):
+    if workers == 1 or 2 ** problem['k'] <= SERIAL_LIMIT:
+        for prefix in prefixes:
+            yield _search_task(problem, criterion, prefix, top)
+        return
+
+    start = time.perf_counter()
+    yield _search_task(problem, criterion, prefixes[0], top)
+    rest = prefixes[1:]
+    if (time.perf_counter() - start) * len(rest) < PARALLEL_MIN_SECONDS:
+        for prefix in rest:
+            yield _search_task(problem, criterion, prefix, top)
+        return
+
+    if not _pool_slot.acquire(blocking=False):
+        for prefix in rest:
+            yield _search_task(problem, criterion, prefix, top)
+        return
+    futures = []
+    try:
+        pool = _executor()
+        futures.extend(pool.submit(_search_task, problem, criterion, prefix, top) for prefix in rest)
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        _pool_slot.release()
+
+
+# الاختيار التدريجي (أمامي أو خلفي): في كل خطوة نضيفو أو نحذفو المتغير اللي يحسن المعيار أكثر
+# يرجع المسار: [(الخطوة، المتغير، الإجراء، القيمة، المجموعة)]
+def stepwise(problem, criterion='aic', direction='forward'):
+    k = problem['k']
+    current = [] if direction == 'forward' else list(range(k))
+    current_score = score_subset(problem, criterion, current) if current else math.inf
+    path = [] if not current else [(0, None, 'start', current_score, tuple(current))]
+
+    while True:
+        if direction == 'forward':
+            moves = [(score_subset(problem, criterion, sorted(current + [j])), j)
+                     for j in range(k) if j not in current]
+        else:
+            moves = [(score_subset(problem, criterion, [i for i in current if i != j]), j)
+                     for j in current if len(current) > 1]
+        if not moves:
+            break
+        best_score, best = min(moves)
+        if best_score >= current_score:
+            break
+        if direction == 'forward':
+            current = sorted(current + [best])
+        else:
+            current = [i for i in current if i != best]
+        current_score = best_score
+        action = 'add' if direction == 'forward' else 'remove'
+        path.append((path[-1][0] + 1 if path else 1, best, action, best_score, tuple(current)))
+    return path
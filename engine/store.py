@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from engine.ingest import iter_table
+
+# مجلد الملفات المحولة إلى Feather، وحجمه الأقصى (بالبايت)
+CACHE_DIR = os.environ.get('BASS_DATA_CACHE', os.path.join(tempfile.gettempdir(), 'bass-datasets'))
+MAX_CACHE_BYTES = int(os.environ.get('BASS_DATA_CACHE_BYTES', 2 * 1024 ** 3))
+
+# مفتاح قائمة الأعمدة الرقمية في مخطط ملف Feather
+NUMERIC_KEY = b'bass.numeric_columns'
+
+_HASH_BLOCK = 8 * 1024 * 1024
+_lock = threading.Lock()
+# الملفات المفتوحة حاليا (بصمة ← عدد القراءات)، evict ما يحذفهاش
+_open = Counter()
+
+
+# بصمة محتوى الملف، تتحسب على دفعات بلا ما ننسخو الملف
+def content_hash(source):
+    h = hashlib.blake2b(digest_size=20)
+    if hasattr(source, 'getbuffer'):
+        with source.getbuffer() as view:
+            h.update(view)
+    else:
+        position = source.tell()
+        source.seek(0)
+        for block in iter(lambda: source.read(_HASH_BLOCK), b''):
+            h.update(block)
+        source.seek(position)
+    return h.hexdigest()
+
+
+def _path(digest):
+    return os.path.join(CACHE_DIR, f'{digest}.feather')
+
+
+# جدول Arrow من الذاكرة المؤقتة على القرص (memory-mapped) إذا كان موجود، بلا نسخ في الذاكرة:
+# الملف فيه دفعة لكل CHUNK_ROWS سطر، و to_pandas على الجدول كامل يجمعها في نسخة جديدة،
+# لذلك اللي يستعمل الجدول يحول غير الأعمدة اللي يحتاجها (table.select(columns).to_pandas())
+# إذا تحذف الملف في نفس الوقت نرجعو None، و load_or_ingest يعاود يقرا الملف المرفوع
+def load_cached(digest):
+    path = _path(digest)
+    with _opened(digest):
+        try:
+            table = feather.read_table(path, memory_map=True)
+            os.utime(path)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+    return table
+
+
+# نعلمو الملف مفتوح طول مدة القراءة باش evict يخليه
+@contextmanager
+def _opened(digest):
+    with _lock:
+        _open[digest] += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _open[digest] -= 1
+            if not _open[digest]:
+                del _open[digest]
+
+
+# كتابة الدفعات في ملف Feather وحدة بوحدة، بلا ما نجمعو الجدول كامل في الذاكرة
+# كل الدفعات لازم يكون عندها نفس الأعمدة والأنواع (مثل اللي ترجعها iter_table)
+# metadata (اختيارية) دالة ترجع قاموس نصوص يتزاد لمخطط الملف، تتنادى منين توصل أول دفعة
+def write_cached(digest, chunks, metadata=None):
+    def write(path):
+        writer = None
+        try:
+            for chunk in chunks:
+                if writer is None:
+                    schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                    if metadata is not None:
+                        schema = schema.with_metadata({**schema.metadata, **metadata()})
+                    writer = pa.ipc.new_file(path, schema)
+                writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False))
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            empty = pa.table({}).replace_schema_metadata(metadata() if metadata is not None else None)
+            feather.write_feather(empty, path, compression='uncompressed')
+
+    _write_atomic(digest, write)
+
+
+# الكتابة في ملف مؤقت ثم os.replace، باش القراء ما يشوفوش ملف ناقص
+def _write_atomic(digest, write):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _path(digest)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    evict(keep=(digest,))
+
+
+# حذف الملفات الأقدم استعمالا حتى يرجع الحجم تحت الحد الأقصى
+# ما نحذفوش الملفات المفتوحة للقراءة ولا اللي في keep (مثلا الملف اللي تكتب توا)
+def evict(max_bytes=None, keep=()):
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    with _lock:
+        try:
+            entries = [entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith('.feather')]
+        except FileNotFoundError:
+            return
+        files = []
+        for entry in entries:
+            try:
+                info = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((info.st_mtime, info.st_size, entry.path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        protected = {_path(digest) for digest in (*keep, *_open)}
+        for _, size, path in files:
+            if total <= max_bytes:
+                break
+            if path in protected:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+# قراءة الملف المرفوع: من القرص إذا تحول من قبل، وإلا نقراوه على دفعات ونحفظوه
+# ترجع البصمة مع جدول Arrow (memory-mapped) باش نقدرو نقراو الملف على دفعات من بعد
+def load_or_ingest(source, name, progress=None):
+    digest = content_hash(source)
+    table = load_cached(digest)
+    # ملف من نسخة قديمة بلا قائمة الأعمدة الرقمية يتعاود
+    if table is not None and NUMERIC_KEY in (table.schema.metadata or {}):
+        if progress is not None:
+            progress.rows = table.num_rows
+            progress.fraction = 1.0
+        return digest, table
+    with _opened(digest):
+        ingest(digest, source, name, progress)
+        table = load_cached(digest)
+    return digest, table
+
+
+# قراءة الملف المرفوع على دفعات وكتابتها مباشرة في Feather (بلا الجدول كامل في الذاكرة)
+# الأعمدة اللي تنفع كمتغيرات تتحدد من ملخصات المرور الأول وتتحفظ في مخطط الملف
+def ingest(digest, source, name, progress=None):
+    scans = {}
+    chunks = iter_table(source, name, progress=progress, scans=scans)
+
+    def numeric():
+        return {NUMERIC_KEY: json.dumps([col for col, scan in scans.items() if scan.regressor()])}
+
+    write_cached(digest, chunks, metadata=numeric)
+
+
+# الأعمدة الرقمية (اللي تنفع كمتغيرات في الانحدار) من مخطط جدول كتبو ingest
+def numeric_columns(table):
+    return json.loads(table.schema.metadata[NUMERIC_KEY])
+
+
+# قراءة أعمدة محددة من ملف Feather دفعة بدفعة (record batches) عبر memory map
+# إذا تحذف الملف من الذاكرة المؤقتة، reingest يعاود يكتبو قبل القراءة
+def iter_cached_batches(digest, columns, reingest=None):
+    columns = list(dict.fromkeys(columns))
+    with _opened(digest):
+        try:
+            source = pa.memory_map(_path(digest))
+        except FileNotFoundError:
+            if reingest is None:
+                raise
+            reingest()
+            source = pa.memory_map(_path(digest))
+        with source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i).select(columns).to_pandas()
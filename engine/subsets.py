@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from engine.metrics import batch_metrics
+
+
+# تقدير عدة نماذج (مجموعات جزئية من المتغيرات) من مصفوفة Gram وحدة X'X لبيانات التدريب
+# كل نموذج يحتاج غير حل نظام صغير k×k، والتنبؤات لكل النماذج تتحسب بضرب مصفوفات واحد
+class SubsetFitter:
+    def __init__(self, X_train, y_train):
+        X = np.asarray(X_train, dtype=np.float64)
+        y = np.asarray(y_train, dtype=np.float64).ravel()
+        self.columns = list(X_train.columns) if hasattr(X_train, 'columns') else list(range(X.shape[1]))
+        self.n = len(y)
+        self.x_mean = X.mean(axis=0)
+        self.y_mean = y.mean()
+        Xc = X - self.x_mean
+        yc = y - self.y_mean
+        self.gram = Xc.T @ Xc
+        self.xty = Xc.T @ yc
+        self.yty = yc @ yc
+
+    def _indices(self, subset):
+        return [self.columns.index(column) for column in subset]
+
+    # معاملات النموذج على المتغيرات المختارة (صفر للباقي)
+    def coefficients(self, subset):
+        beta = np.zeros(len(self.columns))
+        idx = self._indices(subset)
+        if idx:
+            beta[idx] = _solve(self.gram[np.ix_(idx, idx)], self.xty[idx])
+        return beta
+
+    def intercept(self, beta):
+        return self.y_mean - self.x_mean @ beta
+
+    # مجموع مربعات البواقي على بيانات التدريب بلا ما نرجعو للبيانات
+    def rss(self, beta):
+        return self.yty - 2 * beta @ self.xty + beta @ self.gram @ beta
+
+    def predict_many(self, X, betas):
+        X = np.asarray(X, dtype=np.float64)
+        return self.y_mean + (X - self.x_mean) @ betas
+
+
+# مقارنة النماذج المرشحة: {الاسم: [المتغيرات]} ترجع جدول المعايير والتنبؤات على بيانات الاختبار
+def compare_subsets(X_train, y_train, X_test, y_test, candidates):
+    fitter = SubsetFitter(X_train, y_train)
+    betas = np.column_stack([fitter.coefficients(subset) for subset in candidates.values()])
+    predictions = fitter.predict_many(X_test, betas)
+    metrics = pd.DataFrame(batch_metrics(y_test, predictions), index=list(candidates))
+    predictions = pd.DataFrame(predictions, index=getattr(y_test, 'index', None), columns=list(candidates))
+    return metrics, predictions
+
+
+def _solve(a, b):
+    try:
+        chol = np.linalg.cholesky(a)
+    except np.linalg.LinAlgError:
+        return np.linalg.lstsq(a, b, rcond=None)[0]
+    return np.linalg.solve(chol.T, np.linalg.solve(chol, b))
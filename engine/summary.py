@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# عناوين جدول المعاملات، بنفس ترتيب أعمدة ملخص statsmodels
+COEFFICIENT_COLUMNS = ['المعامل', 'الخطأ المعياري', 'إحصائية t', 'p-value', 'الحد الأدنى (95%)', 'الحد الأعلى (95%)']
+
+# أسماء المعاملات اللي تتبدل في العرض
+PARAM_LABELS = {'const': 'الثابت'}
+
+
+# جدول المعاملات من النموذج المقدر مباشرة (statsmodels أو OLSResult، عندهم نفس الأسماء)
+# كل القيم متحسبة من قبل في النموذج، هنا غير نرتبوها في جدول
+# نقراو مصفوفات statsmodels الخام (_results) لأن الغلاف يعاود يبني Series في كل قراءة
+def coefficient_table(result, alpha=0.05):
+    raw = getattr(result, '_results', result)
+    params = np.asarray(raw.params)
+    bse = np.asarray(raw.bse)
+    q = stats.t.ppf(1 - alpha / 2, raw.df_resid)
+    values = np.column_stack([params, bse, np.asarray(raw.tvalues), np.asarray(raw.pvalues),
+                              params - q * bse, params + q * bse])
+    names = result.model.exog_names if hasattr(result, 'model') else result.params.index
+    return pd.DataFrame(values, index=[PARAM_LABELS.get(name, name) for name in names], columns=COEFFICIENT_COLUMNS)
+
+
+# جودة التوفيق: عدد المشاهدات، R²، R² المعدل، إحصائية F وقيمتها الاحتمالية
+def fit_table(result):
+    values = {
+        'عدد المشاهدات': f'{int(result.nobs)}',
+        'درجات حرية البواقي': f'{int(result.df_resid)}',
+        'R²': f'{result.rsquared:.4f}',
+        'R² المعدل': f'{result.rsquared_adj:.4f}',
+        'إحصائية F': f'{result.fvalue:.4g}',
+        'p-value (F)': f'{result.f_pvalue:.4g}',
+    }
+    return pd.DataFrame({'القيمة': list(values.values())}, index=list(values))
+
+
+# التشخيصات اللي في أسفل ملخص statsmodels (Omnibus، Jarque-Bera، Durbin-Watson، رقم الشرط)
+# تتحسب غير كي يطلبها المستخدم، لأنها تحتاج البواقي كاملة
+def residual_diagnostics(resid, exog):
+    e = np.asarray(resid, dtype=np.float64)
+    X = np.asarray(exog, dtype=np.float64)
+    skew = stats.skew(e)
+    kurtosis = stats.kurtosis(e, fisher=False)
+    jarque_bera = len(e) / 6 * (skew ** 2 + (kurtosis - 3) ** 2 / 4)
+    # اختبار Omnibus (D'Agostino) يحتاج 8 مشاهدات على الأقل
+    omnibus, omnibus_pvalue = stats.normaltest(e) if len(e) >= 8 else (np.nan, np.nan)
+    eigenvalues = np.linalg.eigvalsh(X.T @ X)
+    values = {
+        'Omnibus': omnibus,
+        'Prob(Omnibus)': omnibus_pvalue,
+        'Jarque-Bera': jarque_bera,
+        'Prob(JB)': stats.chi2.sf(jarque_bera, 2),
+        'الالتواء (Skew)': skew,
+        'التفلطح (Kurtosis)': kurtosis,
+        'Durbin-Watson': np.sum(np.square(np.diff(e))) / (e @ e),
+        'رقم الشرط (Cond. No.)': np.sqrt(eigenvalues.max() / eigenvalues.min()),
+    }
+    return pd.DataFrame({'القيمة': list(values.values())}, index=list(values))
@@ -0,0 +1,45 @@
+import numpy as np
+
+# أصغر نسبة بين القيم الذاتية (eigenvalues) قبل ما نعتبرو المصفوفة منفردة
+RCOND = 1e-10
+
+
+# عامل تضخم التباين لكل المتغيرات مرة وحدة: قطر معكوس مصفوفة الارتباط
+# VIF_j = [R^-1]_jj = 1 / (1 - R²_j) بلا ما نقدرو انحدار مساعد لكل متغير
+def variance_inflation_factors(X):
+    X = np.asarray(X, dtype=np.float64)
+    k = X.shape[1]
+    std = X.std(axis=0)
+    vif = np.full(k, np.nan)
+    varying = std > 0
+    if varying.sum() == 0:
+        return vif
+    if varying.sum() == 1:
+        vif[varying] = 1.0
+        return vif
+
+    corr = np.corrcoef(X[:, varying], rowvar=False)
+    vif[varying] = _inverse_diagonal(corr)
+    return vif
+
+
+# قطر معكوس مصفوفة الارتباط: Cholesky في الحالة العادية،
+# وتحليل القيم الذاتية للتصاميم شبه المنفردة (VIF لانهائي للمتغيرات المرتبطة خطيا تماما)
+def _inverse_diagonal(corr):
+    try:
+        chol = np.linalg.cholesky(corr)
+        pivots = np.diag(chol) ** 2
+        if pivots.min() > RCOND * pivots.max():
+            chol_inv = np.linalg.solve(chol, np.eye(len(corr)))
+            return np.sum(chol_inv ** 2, axis=0)
+    except np.linalg.LinAlgError:
+        pass
+
+    eigenvalues, eigenvectors = np.linalg.eigh(corr)
+    small = eigenvalues <= RCOND * eigenvalues.max()
+    weights = eigenvectors ** 2
+    diag = weights[:, ~small] @ (1 / eigenvalues[~small])
+    # المتغيرات اللي عندها وزن في اتجاه منفرد ما عندهاش تباين مستقل
+    degenerate = weights[:, small].sum(axis=1) > np.sqrt(RCOND)
+    diag[degenerate] = np.inf
+    return diag
@@ -0,0 +1,76 @@
+import numpy as np
+import plotly.graph_objects as go
+
+# فوق هذا العدد من النقاط نختصرو سحابة النقاط في الخادم قبل ما نبعثوها للمتصفح
+MAX_POINTS = 5000
+
+# عدد الخانات في كل محور لتجميع النقاط حسب الكثافة (الحد الأقصى للنقاط المبعوثة هو مربعه)
+DENSITY_BINS = 150
+
+
+# تجميع النقاط حسب الكثافة: كل خانة غير فارغة في شبكة bins × bins تولي نقطة وحدة
+# في متوسط نقاطها، مع عدد النقاط اللي فيها. O(n) بـ bincount بلا فرز
+def density_bins(x, y, bins=DENSITY_BINS):
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    keep = np.isfinite(x) & np.isfinite(y)
+    if not keep.all():
+        x, y = x[keep], y[keep]
+    cells = _bin_index(x, bins) * bins + _bin_index(y, bins)
+    counts = np.bincount(cells, minlength=bins * bins)
+    filled = np.flatnonzero(counts)
+    counts = counts[filled]
+    x_mean = np.bincount(cells, weights=x, minlength=bins * bins)[filled] / counts
+    y_mean = np.bincount(cells, weights=y, minlength=bins * bins)[filled] / counts
+    return x_mean, y_mean, counts
+
+
+def _bin_index(values, bins):
+    low, high = values.min(), values.max()
+    if high == low:
+        return np.zeros(len(values), dtype=np.int64)
+    index = ((values - low) * (bins / (high - low))).astype(np.int64)
+    return np.minimum(index, bins - 1)
+
+
+# سحابة نقاط WebGL: النقاط كاملة إذا كانت قليلة، وإلا النقاط المجمعة ملونة حسب عددها
+# المصفوفات float32 باش Plotly يبعثها كمصفوفات ثنائية (typed arrays) بنصف الحجم
+def scatter_trace(x, y, name=None, color='#1976D2', max_points=MAX_POINTS):
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if len(x) <= max_points:
+        return go.Scattergl(x=x.astype(np.float32), y=y.astype(np.float32), mode='markers', name=name,
+                            marker=dict(color=color, opacity=0.7, size=7))
+
+    x_mean, y_mean, counts = density_bins(x, y)
+    return go.Scattergl(
+        x=x_mean.astype(np.float32), y=y_mean.astype(np.float32), mode='markers', name=name,
+        customdata=counts.astype(np.int32),
+        hovertemplate='%{x:.4g}, %{y:.4g}<br>عدد النقاط: %{customdata}<extra></extra>',
+        marker=dict(color=np.log10(counts).astype(np.float32), colorscale='Blues', cmin=0, size=6,
+                    colorbar=dict(title='log₁₀ عدد النقاط')),
+    )
+
+
+# مدرج تكراري محسوب في الخادم: نبعثو غير عدد النقاط في كل فئة ماشي القيم كاملة
+def histogram_trace(values, bins=30, name=None, color='#1976D2'):
+    values = np.asarray(values, dtype=np.float64).ravel()
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=bins)
+    return go.Bar(x=((edges[:-1] + edges[1:]) / 2).astype(np.float32), y=counts.astype(np.int32),
+                  width=np.diff(edges).astype(np.float32), name=name, marker=dict(color=color, opacity=0.7))
+
+
+# خط مستقيم بين نقطتين (خط الانحدار أو الخط المرجعي)، بلا ما نبعثو نقطة لكل مشاهدة
+def line_trace(x0, x1, intercept, slope, name=None, color='red', dash='solid'):
+    return go.Scatter(x=[x0, x1], y=[intercept + slope * x0, intercept + slope * x1], mode='lines', name=name,
+                      line=dict(color=color, width=2, dash=dash))
+
+
+# إعدادات مشتركة لكل الرسومات: عنوان في الوسط وشبكة متقطعة
+# النص العربي ما يحتاجش display_arabic_text هنا لأن المتصفح يشكله ويعرضه من اليمين لليسار
+def base_layout(fig, title, x_title=None, y_title=None, height=500):
+    fig.update_layout(title=dict(text=title, x=0.5, xanchor='center'), height=height,
+                      margin=dict(l=40, r=40, t=70, b=40), legend=dict(orientation='h', y=-0.15))
+    fig.update_xaxes(title_text=x_title, showgrid=True, griddash='dash')
+    fig.update_yaxes(title_text=y_title, showgrid=True, griddash='dash')
+    return fig
@@ -0,0 +1,64 @@
+import importlib
+
+from engine import precompute
+from engine.instrument import section, stage
+
+# كل قسم في موديل خاص به، ويتحمل غير كي يفتحو المستخدم
+# هكذا صفحة المقدمة ما تحملش statsmodels و sklearn و seaborn
+SECTIONS = {
+    "المقدمة": "intro",
+    "أنواع البيانات": "data_types",
+    "تحليل البيانات الوصفي": "descriptive",
+    "نموذج الانحدار الخطي البسيط": "simple_regression",
+    "نموذج الانحدار المتعدد": "multiple_regression",
+    "مشاكل الانحدار وحلولها": "regression_problems",
+    "اختبار الفرضيات": "hypothesis_testing",
+    "تقييم النماذج": "model_evaluation",
+    "تطبيق عملي": "application",
+}
+
+# الأقسام اللي عندها دالة precompute (نتائج ورسومات تستاهل تتحسب مسبقا)
+# precompute يحسب في الخلفية (engine.precompute) نفس النتائج والرسومات اللي يعرضها render بالقيم الافتراضية
+# على بيانات المثال المشتركة، عبر نفس الدوال المساعدة في القسم، وكل yield نقطة يقدر العامل يوقف فيها
+PRECOMPUTED = {'data_types', 'descriptive', 'simple_regression', 'multiple_regression', 'regression_problems',
+               'hypothesis_testing', 'model_evaluation', 'application'}
+
+
+def load_section(title):
+    return importlib.import_module(f"{__name__}.{SECTIONS[title]}")
+
+
+# كي يكون القياس مفعل، مدة التحميل والعرض تتسجل باسم القسم
+# العرض التفاعلي يوقف الحساب المسبق في الخلفية حتى يكمل
+def render_section(title):
+    with precompute.precomputer.interactive(), section(title):
+        with stage('import'):
+            module = load_section(title)
+        module.render()
+
+
+# الحساب المسبق لبيانات الأمثلة ثم باقي الأقسام في الخلفية بترتيب القائمة (كل مهمة مرة وحدة في العملية)
+# الأقسام اللي ما عندهاش precompute ما تتحملش أصلا
+def precompute_sections(current):
+    if not precompute.ENABLED:
+        return
+    precompute.precomputer.submit('datasets', _preload_datasets)
+    for title, name in SECTIONS.items():
+        if title != current and name in PRECOMPUTED:
+            precompute.precomputer.submit(title, lambda title=title: _precompute_steps(title))
+
+
+# أول مهمة: بناء كل بيانات الأمثلة المشتركة، باش حتى أول جلسة تفتح قسم تلقاها جاهزة
+def _preload_datasets():
+    from engine.datasets import registry
+
+    registry.preload()
+    yield
+
+
+# تحميل الموديل هو أول خطوة، باش حتى هو يستنى دوره في العامل
+def _precompute_steps(title):
+    with stage('import'):
+        module = load_section(title)
+    yield
+    yield from module.precompute()
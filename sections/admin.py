@@ -0,0 +1,28 @@
+# لوحة القياس المخفية: تظهر في القائمة الجانبية غير إذا كان القياس مفعل (BASS_INSTRUMENT=1)
+# والرابط فيه ?admin=1، وما تتحملش أصلا إذا كان القياس مطفي
+
+import streamlit as st
+
+from engine import instrument
+from engine.datasets import registry
+from engine.precompute import precomputer
+
+
+def render_admin_panel():
+    instrument.serve_metrics()
+    if st.query_params.get('admin') != '1':
+        return
+
+    with st.sidebar.expander("القياس والأداء", expanded=True):
+        st.caption("مدة كل مرحلة في كل قسم (ملي ثانية)")
+        st.dataframe(instrument.timings_frame(), hide_index=True)
+        st.caption("إصابات وإخفاقات الذواكر المؤقتة")
+        st.dataframe(instrument.cache_frame())
+        st.caption("البيانات المشتركة بين كل الجلسات (نسخة وحدة في العملية)")
+        st.dataframe(registry.info())
+        st.caption(f"الحساب المسبق في الخلفية: {len(precomputer.completed)} مهمة جاهزة، "
+                   f"{precomputer.pending()} في الانتظار، {len(precomputer.failed)} فشل")
+        st.download_button("تحميل بصيغة Prometheus", instrument.prometheus_text(), file_name='metrics.txt',
+                           mime='text/plain')
+        if st.button("تصفير المدد", key='admin_reset'):
+            instrument.reset()
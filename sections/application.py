@@ -0,0 +1,399 @@
+# تطبيق عملي
+
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+from sklearn.metrics import mean_squared_error, r2_score
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from engine.datasets import get_dataset
+from engine.figures import build_plotly, render_figure
+from engine.models import fit_linear, ols_summary, predict_with_intervals, recursive_fit, rolling_regression
+from engine.webgl import base_layout, histogram_trace, line_trace, scatter_trace
+from sections.common import display_arabic_text, show_figure, show_ols_summary, show_plotly
+
+# القيمة الافتراضية لمؤشر الدخل المتوقع في التنبؤ
+EXPECTED_INCOME = 18000
+
+
+def plot_income_consumption_series(years, income, consumption):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.plot(years, income, 'o-', color='#1976D2', linewidth=2, label=display_arabic_text('الدخل المتاح'))
+    ax.plot(years, consumption, 'o-', color='#C62828', linewidth=2, label=display_arabic_text('الاستهلاك'))
+
+    ax.set_title(display_arabic_text('تطور الدخل المتاح والاستهلاك في الجزائر (2010-2023)'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('السنة'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('القيمة (مليار دينار)'), fontsize=12)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    # تعيين المحور السيني ليظهر كل السنوات
+    ax.set_xticks(years)
+    ax.set_xticklabels(years, rotation=45)
+
+    return fig
+
+
+def plot_income_consumption_scatter(years, income, consumption):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.scatter(income, consumption, color='#1976D2', s=80, alpha=0.7)
+
+    # إضافة تسميات النقاط (السنوات)
+    for i, year in enumerate(years):
+        ax.annotate(str(year), (income[i], consumption[i]),
+                    xytext=(5, 5), textcoords='offset points', fontsize=9)
+
+    ax.set_title(display_arabic_text('العلاقة بين الدخل المتاح والاستهلاك'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('الدخل المتاح (مليار دينار)'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('الاستهلاك (مليار دينار)'), fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_consumption_function(income, consumption, intercept, slope):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # البيانات الفعلية
+    ax.scatter(income, consumption, color='#1976D2', s=80, alpha=0.7, label=display_arabic_text('البيانات الفعلية'))
+
+    # خط الانحدار المقدر
+    income_range = np.linspace(income.min() - 500, income.max() + 500, 100)
+    consumption_pred = intercept + slope * income_range
+    ax.plot(income_range, consumption_pred, 'r-', linewidth=2, label=display_arabic_text('دالة الاستهلاك المقدرة'))
+
+    # إضافة معادلة الانحدار على الرسم
+    equation = f"C = {intercept:.2f} + {slope:.2f}Y"
+    ax.text(0.05, 0.95, display_arabic_text(equation), transform=ax.transAxes,
+            fontsize=12, verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+
+    ax.set_title(display_arabic_text('دالة الاستهلاك المقدرة'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('الدخل المتاح (مليار دينار)'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('الاستهلاك (مليار دينار)'), fontsize=12)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_residuals(y_pred, residuals):
+    fig = make_subplots(rows=1, cols=2, subplot_titles=['البواقي مقابل القيم المتوقعة', 'توزيع البواقي'])
+
+    # البواقي مقابل القيم المتوقعة
+    fig.add_trace(scatter_trace(y_pred, residuals), row=1, col=1)
+    fig.add_hline(y=0, line_color='red', opacity=0.3, row=1, col=1)
+    fig.update_xaxes(title_text='القيم المتوقعة', row=1, col=1)
+    fig.update_yaxes(title_text='البواقي', row=1, col=1)
+
+    # المدرج التكراري للبواقي (الفئات تتحسب في الخادم)
+    fig.add_trace(histogram_trace(residuals, bins=8), row=1, col=2)
+    fig.update_xaxes(title_text='البواقي', row=1, col=2)
+    fig.update_yaxes(title_text='التكرار', row=1, col=2)
+
+    fig.update_layout(showlegend=False)
+    return base_layout(fig, None)
+
+
+def plot_forecast(income, consumption, intercept, slope, expected_income, predicted_consumption, interval):
+    # البيانات الفعلية
+    fig = go.Figure(scatter_trace(income, consumption, name='البيانات التاريخية'))
+
+    # خط الانحدار المقدر
+    fig.add_trace(line_trace(income.min() - 500, max(income.max(), expected_income) + 500, intercept, slope,
+                             name='دالة الاستهلاك المقدرة'))
+
+    # نقطة التنبؤ مع فترة التنبؤ 95%
+    fig.add_trace(go.Scatter(
+        x=[expected_income], y=[predicted_consumption], mode='markers', name='الاستهلاك المتوقع (فترة التنبؤ 95%)',
+        marker=dict(color='green', size=16, symbol='star'),
+        error_y=dict(type='data', symmetric=False, array=[interval[1] - predicted_consumption],
+                     arrayminus=[predicted_consumption - interval[0]], color='green', width=6),
+    ))
+
+    # خطوط توضيحية للتنبؤ
+    fig.add_vline(x=expected_income, line_color='green', line_dash='dash', opacity=0.5)
+    fig.add_hline(y=predicted_consumption, line_color='green', line_dash='dash', opacity=0.5)
+
+    return base_layout(fig, 'التنبؤ بالاستهلاك بناءً على الدخل المتاح', 'الدخل المتاح (مليار دينار)',
+                       'الاستهلاك (مليار دينار)')
+
+
+def plot_cusum(years, statistic, lower, upper):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.plot(years, statistic, 'o-', color='#1976D2', linewidth=2, label='CUSUM')
+    ax.plot(years, upper, 'r--', alpha=0.7, label=display_arabic_text('حدود 5%'))
+    ax.plot(years, lower, 'r--', alpha=0.7)
+    ax.axhline(y=0, color='gray', linestyle='-', alpha=0.3)
+
+    ax.set_title(display_arabic_text('اختبار CUSUM لاستقرار دالة الاستهلاك'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('السنة'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('المجموع التراكمي للبواقي التكرارية'), fontsize=12)
+    ax.set_xticks(years)
+    ax.set_xticklabels(years, rotation=45)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    return fig
+
+
+def plot_coefficient_path(periods, slope, slope_se, full_slope):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.plot(periods, slope, 'o-', color='#1976D2', linewidth=2, label=display_arabic_text('الميل الحدي للاستهلاك'))
+    ax.fill_between(periods, slope - 1.96 * slope_se, slope + 1.96 * slope_se, color='#1976D2', alpha=0.2,
+                    label=display_arabic_text('فترة الثقة 95%'))
+    ax.axhline(y=full_slope, color='red', linestyle='--', alpha=0.7, label=display_arabic_text('التقدير على كل الفترة'))
+
+    ax.set_title(display_arabic_text('تطور الميل الحدي للاستهلاك عبر الزمن'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('السنة الأخيرة في النافذة'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('الميل الحدي للاستهلاك'), fontsize=12)
+    ax.set_xticks(periods)
+    ax.set_xticklabels(periods, rotation=45)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    return fig
+
+
+# مؤشر الدخل المتوقع ورسم التنبؤ، من النموذج المقدر والمخزن
+@st.fragment
+def forecast_panel(X, y, income, consumption, intercept, slope):
+    # إدخال قيمة الدخل المتوقع
+    expected_income = st.slider(display_arabic_text('قم بتحديد الدخل المتاح المتوقع (مليار دينار)'),
+                                min_value=10000, max_value=20000, value=EXPECTED_INCOME, step=500, key='expected_income')
+
+    # التنبؤ بالاستهلاك مع فترتي الثقة والتنبؤ من مصفوفة التباين المخزنة
+    forecast, figure = _forecast(X, y, income, consumption, intercept, slope, expected_income)
+    predicted_consumption = forecast['mean']
+    low, high = forecast['obs_ci']
+
+    st.markdown(f"""
+    **النتيجة:** عند دخل متاح قدره {expected_income} مليار دينار، يتوقع أن يكون الاستهلاك {predicted_consumption:.2f} مليار دينار.
+
+    - فترة الثقة 95% لمتوسط الاستهلاك: [{forecast['mean_ci'][0]:.2f} ، {forecast['mean_ci'][1]:.2f}]
+    - فترة التنبؤ 95% لقيمة الاستهلاك: [{low:.2f} ، {high:.2f}]
+    """)
+
+    # رسم التنبؤ في المتصفح (Plotly)، والخادم يبعث غير النقاط
+    show_plotly(*figure)
+
+
+# السنوات والدخل والاستهلاك كمصفوفات، ودالة الاستهلاك المقدرة عليها: X، الثابت، الميل، والقيم المتوقعة
+def _consumption_function(consumption_data):
+    years = consumption_data['السنة'].to_numpy()
+    income = consumption_data['الدخل المتاح'].to_numpy()
+    consumption = consumption_data['الاستهلاك'].to_numpy()
+    X = income.reshape(-1, 1)
+    model = fit_linear(X, consumption)
+    return years, income, consumption, X, model.intercept_, model.coef_[0], model.predict(X)
+
+
+# التنبؤ عند دخل متوقع (القيمة وفترتي الثقة والتنبؤ) مع رسمه
+def _forecast(X, y, income, consumption, intercept, slope, expected_income):
+    forecast = predict_with_intervals(X, y, expected_income)
+    figure = (plot_forecast, income, consumption, intercept, slope, expected_income, forecast['mean'],
+              forecast['obs_ci'])
+    return forecast, figure
+
+
+# رسم CUSUM للبواقي التكرارية مع حدود 5%
+def _cusum_figure(recursive, years):
+    statistic, lower, upper = recursive.cusum()
+    return plot_cusum, years[-len(statistic):], statistic, lower, upper
+
+
+# رسم ميل الدخل عبر الزمن بنافذة متحركة (window سنوات) أو متوسعة (window=None)
+def _coefficient_path(X, y, window, years, slope):
+    rolling = rolling_regression(X, y, window, ['الدخل المتاح'], years)
+    return (plot_coefficient_path, rolling.params.index.to_numpy(), rolling.params['الدخل المتاح'].to_numpy(),
+            rolling.bse['الدخل المتاح'].to_numpy(), slope)
+
+
+# البيانات، دالة الاستهلاك وبواقيها، التنبؤ بالدخل الافتراضي، ثم الاستقرار عبر الزمن
+def precompute():
+    years, income, consumption, X, intercept, slope, y_pred = _consumption_function(get_dataset('consumption'))
+    render_figure(plot_income_consumption_series, years, income, consumption)
+    render_figure(plot_income_consumption_scatter, years, income, consumption)
+    yield
+
+    render_figure(plot_consumption_function, income, consumption, intercept, slope)
+    ols_summary(X, consumption)
+    build_plotly(plot_residuals, y_pred, consumption - y_pred)
+    yield
+
+    build_plotly(*_forecast(X, consumption, income, consumption, intercept, slope, EXPECTED_INCOME)[1])
+    yield
+
+    render_figure(*_cusum_figure(recursive_fit(X, consumption, ['الدخل المتاح']), years))
+    render_figure(*_coefficient_path(X, consumption, 6, years, slope))
+    yield
+
+
+def render():
+    st.markdown('<h2 class="section-title">تطبيق عملي على نموذج اقتصادي</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نموذج دالة الاستهلاك الكينزية
+
+    راح نطبق الآن ما تعلمناه في مثال عملي كامل لتقدير دالة الاستهلاك الكينزية.
+
+    وفقًا للنظرية الكينزية، الاستهلاك يعتمد بشكل أساسي على الدخل المتاح. المعادلة العامة لدالة الاستهلاك هي:
+
+    C = C₀ + cY
+
+    حيث:
+    - C: الاستهلاك
+    - C₀: الاستهلاك التلقائي (الاستهلاك عندما يكون الدخل صفر)
+    - c: الميل الحدي للاستهلاك (نسبة التغير في الاستهلاك إلى التغير في الدخل)
+    - Y: الدخل المتاح
+
+    راح ندرس هذه العلاقة ونشوف مدى صحتها وكيفاش نقدر نستخدمها للتنبؤ.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # إنشاء بيانات افتراضية للاقتصاد الجزائري
+    st.markdown('<h3 class="subsection-title">البيانات المستخدمة</h3>', unsafe_allow_html=True)
+
+    # بيانات افتراضية للدخل والاستهلاك في الجزائر (2010-2023)، بالمليار دينار (مشتركة بين كل الجلسات)
+    consumption_data = get_dataset('consumption')
+    years, income, consumption, X, intercept, slope, y_pred = _consumption_function(consumption_data)
+
+    st.write(display_arabic_text("بيانات الدخل المتاح والاستهلاك في الجزائر (2010-2023):"))
+    st.write(consumption_data)
+
+    # رسم البيانات
+    show_figure(plot_income_consumption_series, years, income, consumption)
+
+    # تحليل وصفي للبيانات
+    st.markdown('<h3 class="subsection-title">التحليل الوصفي للبيانات</h3>', unsafe_allow_html=True)
+
+    st.write(display_arabic_text("الإحصاءات الوصفية:"))
+    st.write(consumption_data.describe())
+
+    # رسم العلاقة بين الدخل والاستهلاك
+    show_figure(plot_income_consumption_scatter, years, income, consumption)
+
+    # حساب معامل الارتباط
+    correlation = np.corrcoef(income, consumption)[0, 1]
+    st.write(f"معامل الارتباط بين الدخل والاستهلاك: {correlation:.4f}")
+
+    # تقدير نموذج الانحدار
+    st.markdown('<h3 class="subsection-title">تقدير دالة الاستهلاك</h3>', unsafe_allow_html=True)
+
+    # تقدير النموذج (X والمعلمات من _consumption_function)
+    y = consumption
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown(f"""
+    ### نتائج تقدير دالة الاستهلاك:
+
+    معادلة دالة الاستهلاك المقدرة:
+
+    الاستهلاك = {intercept:.2f} + {slope:.2f} × الدخل المتاح
+
+    حيث:
+    - {intercept:.2f} هو الاستهلاك التلقائي (C₀)
+    - {slope:.2f} هو الميل الحدي للاستهلاك (c)
+
+    ### تفسير النتائج:
+
+    - **الاستهلاك التلقائي**: يقدر بـ {intercept:.2f} مليار دينار، وهو الاستهلاك الذي يحدث حتى لو كان الدخل صفر (من خلال الاقتراض أو استخدام المدخرات)
+
+    - **الميل الحدي للاستهلاك**: يقدر بـ {slope:.2f}، وهذا يعني أن كل زيادة في الدخل بمقدار 1 مليار دينار تؤدي إلى زيادة في الاستهلاك بمقدار {slope:.2f} مليار دينار
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # رسم خط الانحدار مع البيانات
+    show_figure(plot_consumption_function, income, consumption, intercept, slope)
+
+    # قياس جودة النموذج
+    st.markdown('<h3 class="subsection-title">تقييم النموذج</h3>', unsafe_allow_html=True)
+
+    # حساب المعايير من التنبؤات
+    r2 = r2_score(y, y_pred)
+    mse = mean_squared_error(y, y_pred)
+    rmse = np.sqrt(mse)
+
+    st.markdown(f"""
+    - معامل التحديد (R²): {r2:.4f}
+    - متوسط مربعات الخطأ (MSE): {mse:.2f}
+    - الجذر التربيعي لمتوسط مربعات الخطأ (RMSE): {rmse:.2f}
+    """)
+
+    # اختبار إحصائي للنموذج
+    show_ols_summary(X, y, key='application_diagnostics')
+
+    # تحليل البواقي
+    st.markdown('<h3 class="subsection-title">تحليل البواقي</h3>', unsafe_allow_html=True)
+
+    # البواقي
+    residuals = y - y_pred
+
+    # رسم البواقي
+    show_plotly(plot_residuals, y_pred, residuals)
+
+    # استقرار النموذج عبر الزمن: البواقي التكرارية واختبار CUSUM
+    st.markdown('<h3 class="subsection-title">استقرار دالة الاستهلاك عبر الزمن (CUSUM)</h3>', unsafe_allow_html=True)
+
+    # المربعات الصغرى التكرارية: النموذج يتحدث سنة بسنة، وكل سنة جديدة تعطي باقي تكراري
+    recursive = recursive_fit(X, y, ['الدخل المتاح'])
+    figure = _cusum_figure(recursive, years)
+    statistic, lower, upper = figure[2:]
+    show_figure(*figure)
+
+    if np.any((statistic > upper) | (statistic < lower)):
+        st.write("النتيجة: منحنى CUSUM يخرج من حدود 5%، أي أن معاملات دالة الاستهلاك غير مستقرة عبر الزمن.")
+    else:
+        st.write("النتيجة: منحنى CUSUM يبقى داخل حدود 5%، أي لا يوجد دليل على تغير معاملات دالة الاستهلاك عبر الزمن.")
+
+    # تقدير المعاملات على نوافذ زمنية: متحركة (عدد ثابت من السنوات) أو متوسعة (من البداية)
+    st.write("تطور المعاملات عبر الزمن (انحدار بنافذة متحركة أو متوسعة):")
+    col1, col2 = st.columns(2)
+    with col1:
+        window_type = st.radio("نوع النافذة", ['متحركة', 'متوسعة'], key='window_type', horizontal=True)
+    with col2:
+        window = st.slider("طول النافذة (سنوات)", min_value=4, max_value=len(years) - 1, value=6, key='window_length',
+                           disabled=window_type == 'متوسعة')
+    show_figure(*_coefficient_path(X, y, window if window_type == 'متحركة' else None, years, slope))
+
+    # إضافة سنة جديدة: تحديث المعاملات بسطر واحد بلا إعادة التقدير من الصفر
+    st.write("أضف بيانات سنة جديدة لتحديث النموذج مباشرة:")
+    col1, col2 = st.columns(2)
+    with col1:
+        new_income = st.number_input("الدخل المتاح للسنة الجديدة", value=17800, step=100, key='new_income')
+    with col2:
+        new_consumption = st.number_input("الاستهلاك للسنة الجديدة", value=14100, step=100, key='new_consumption')
+    updated = recursive.copy().update([[new_income]], [new_consumption]).fit()
+    st.write(f"بعد إضافة سنة {years[-1] + 1}: الاستهلاك = {updated.params['const']:.2f} + "
+             f"{updated.params['الدخل المتاح']:.4f} × الدخل المتاح (R² = {updated.rsquared:.4f})")
+
+    # التنبؤ بالاستهلاك في المستقبل
+    st.markdown('<h3 class="subsection-title">التنبؤ بالاستهلاك في المستقبل</h3>', unsafe_allow_html=True)
+
+    # التنبؤ يتعاود وحدو كل ما يتحرك المؤشر، بلا ما يعاود تقدير النموذج ولا رسم باقي القسم
+    forecast_panel(X, y, income, consumption, intercept, slope)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### خلاصة التطبيق العملي:
+
+    1. **تقدير دالة الاستهلاك**: نجحنا في تقدير دالة الاستهلاك الكينزية للاقتصاد الجزائري، ووجدنا أن الميل الحدي للاستهلاك يبلغ حوالي 0.7-0.8، وهو ما يتوافق مع النظرية الاقتصادية التي تتوقع أن يكون الميل الحدي للاستهلاك بين 0 و 1
+
+    2. **جودة النموذج**: النموذج يفسر أكثر من 99% من التغيرات في الاستهلاك، مما يشير إلى قوة العلاقة بين الدخل والاستهلاك
+
+    3. **التنبؤ**: يمكننا استخدام النموذج للتنبؤ بمستويات الاستهلاك المستقبلية بناءً على توقعات الدخل
+
+    4. **التطبيقات السياسية**: يمكن استخدام هذا النموذج في:
+       - تقدير أثر سياسات إعادة توزيع الدخل على الاستهلاك
+       - التنبؤ بأثر التغيرات الضريبية على الاستهلاك الكلي
+       - تحليل أثر برامج التحفيز الاقتصادي
+
+    5. **الحدود**: النموذج يفترض علاقة خطية بسيطة، في حين أن العلاقة الحقيقية قد تكون أكثر تعقيدًا وتتأثر بعوامل أخرى مثل سعر الفائدة، التوقعات، توزيع الدخل، وغيرها
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,98 @@
+import streamlit as st
+import matplotlib.pyplot as plt
+
+from engine.arabic import display_arabic_text, display_arabic_texts
+from engine.figures import build_plotly, render_figure
+from engine.instrument import stage
+
+# تعديل عرض النص العربي في الرسومات
+plt.rcParams['font.family'] = 'Arial'
+
+
+# عرض الشكل من الذاكرة المؤقتة للصور بدل ما نعاودو نرسموه في كل مرة
+def show_figure(builder, *args, fmt='png'):
+    image = render_figure(builder, *args, fmt=fmt)
+    if fmt == 'svg':
+        image = image.decode('utf-8')
+    with stage('st.image'):
+        st.image(image, width='stretch')
+
+
+# عرض رسم Plotly (WebGL) من الذاكرة المؤقتة للأشكال
+def show_plotly(builder, *args):
+    fig = build_plotly(builder, *args)
+    with stage('st.plotly_chart'):
+        st.plotly_chart(fig, width='stretch', config={'displaylogo': False})
+
+
+# عرض ملخص النموذج كجداول: المعاملات وجودة التوفيق، والتشخيصات الإضافية غير إذا فعلها المستخدم
+# model: نموذج مقدر (مثلا من الدفعات)، وإلا نقدرو OLS على X و y من الذاكرة المؤقتة
+def show_ols_summary(X=None, y=None, key=None, model=None):
+    from engine.models import ols_diagnostics, ols_summary
+    from engine.summary import coefficient_table, fit_table
+
+    if model is None:
+        coefficients, goodness = ols_summary(X, y)
+    else:
+        coefficients, goodness = coefficient_table(model), fit_table(model)
+    st.dataframe(coefficients, column_config=_number_columns(coefficients))
+    st.dataframe(goodness)
+    # البواقي غير متوفرة للنماذج المقدرة على دفعات
+    if model is None and st.toggle("عرض التشخيصات الإضافية (Omnibus، Jarque-Bera، Durbin-Watson)", key=key):
+        diagnostics = ols_diagnostics(X, y)
+        st.dataframe(diagnostics, column_config=_number_columns(diagnostics))
+
+
+def _number_columns(frame):
+    return {column: st.column_config.NumberColumn(format='%.4f') for column in frame.columns}
+
+
+# رسم التأثير: البواقي المعيارية الخارجية مقابل الرفع، مع حدود 2p/n و ±2
+# المشاهدات الأكثر تأثيرا (حسب مسافة Cook) تتعلم فوق سحابة النقاط وحجمها يكبر مع √D
+def plot_influence(leverage, student, cooks, k_params, highlight=200):
+    import numpy as np
+    import plotly.graph_objects as go
+    from engine.webgl import base_layout, scatter_trace
+
+    fig = go.Figure(scatter_trace(leverage, student, name='المشاهدات'))
+    count = min(highlight, len(cooks))
+    top = np.argpartition(-cooks, count - 1)[:count]
+    size = np.sqrt(cooks[top] / cooks[top].max())
+    fig.add_trace(go.Scattergl(
+        x=leverage[top].astype(np.float32), y=student[top].astype(np.float32), mode='markers',
+        name='الأكثر تأثيرا (Cook)', customdata=np.column_stack([top, cooks[top]]).astype(np.float32),
+        hovertemplate='المشاهدة %{customdata[0]:.0f}<br>h = %{x:.4f}<br>t = %{y:.3f}<br>D = %{customdata[1]:.4f}<extra></extra>',
+        marker=dict(color='#C62828', opacity=0.6, size=(6 + 24 * size).astype(np.float32),
+                    line=dict(color='black', width=1)),
+    ))
+    fig.add_vline(x=2 * k_params / len(leverage), line=dict(color='gray', dash='dash'))
+    for bound in (-2, 2):
+        fig.add_hline(y=bound, line=dict(color='gray', dash='dash'))
+    return base_layout(fig, 'رسم التأثير (Influence Plot)', 'الرفع (h)', 'البواقي المعيارية الخارجية')
+
+
+# تشخيصات التأثير: الرسم، أخطاء التحقق بحذف مشاهدة وحدة (PRESS)، وجدول المشاهدات الأكثر تأثيرا
+def show_influence(X, y, index=None, top=10):
+    import numpy as np
+    from engine.models import influence_diagnostics
+
+    diagnostics = influence_diagnostics(X, y)
+    show_plotly(plot_influence, *_influence_arrays(diagnostics))
+    limits = diagnostics.thresholds()
+    columns = st.columns(3)
+    columns[0].metric('PRESS', f'{diagnostics.press:.4g}')
+    columns[1].metric('RMSE (حذف مشاهدة وحدة)', f'{np.sqrt(diagnostics.loo_mse):.4f}')
+    columns[2].metric('مشاهدات Cook > 4/n', f'{int(np.sum(diagnostics.cooks_distance > limits["cooks"]))}')
+    table = diagnostics.frame(X, diagnostics.most_influential(top), index=index)
+    st.dataframe(table, column_config=_number_columns(table))
+
+
+# نفس رسم التأثير للحساب المسبق في الخلفية (بلا عرض)
+def precompute_influence(X, y):
+    from engine.models import influence_diagnostics
+
+    build_plotly(plot_influence, *_influence_arrays(influence_diagnostics(X, y)))
+
+
+def _influence_arrays(diagnostics):
+    return diagnostics.leverage, diagnostics.student_external, diagnostics.cooks_distance, diagnostics.k_params
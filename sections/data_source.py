@@ -0,0 +1,147 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from engine.instrument import timed
+
+# الأدوار اللي تستعملها الأقسام، بنفس ترتيب أعمدة بيانات المثال
+ROLES = ['الدخل', 'الاستهلاك', 'الاستثمار', 'الإنفاق الحكومي']
+
+SOURCES = ['بيانات المثال', 'رفع ملف (CSV أو Excel)']
+
+# قراءة الملفات المرفوعة تتم في الخلفية باش الواجهة ما تتجمدش
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ingest')
+
+
+# اختيار مصدر البيانات في القائمة الجانبية
+def render_data_source():
+    st.sidebar.title("مصدر البيانات")
+    source = st.sidebar.radio("اختر مصدر البيانات", SOURCES, key='data_source')
+    if source == SOURCES[0]:
+        return
+
+    uploaded = st.sidebar.file_uploader("ارفع ملف البيانات", type=['csv', 'xlsx', 'xlsm'], key='data_file')
+    if uploaded is None:
+        st.session_state.pop('upload', None)
+        return
+
+    job = st.session_state.get('upload')
+    if job is None or job['file_id'] != uploaded.file_id:
+        job = _start_upload(uploaded)
+        st.session_state['upload'] = job
+
+    with st.sidebar:
+        if not job['future'].done():
+            _upload_progress()
+        elif job['future'].exception() is not None:
+            st.error(f"تعذرت قراءة الملف: {job['future'].exception()}")
+        else:
+            _role_mapping(job)
+
+
+def _start_upload(uploaded):
+    from engine.ingest import IngestProgress
+    from engine.store import load_or_ingest
+
+    progress = IngestProgress(uploaded.size)
+    uploaded.seek(0)
+    future = _executor.submit(load_or_ingest, uploaded, uploaded.name, progress=progress)
+    return {'file_id': uploaded.file_id, 'name': uploaded.name, 'source': uploaded, 'future': future,
+            'progress': progress, 'frame': None}
+
+
+# شريط التقدم يتحدث وحدو بلا ما يعاود تشغيل الصفحة كاملة، ومنين تكمل القراءة نعاودو التشغيل
+@st.fragment(run_every=0.5)
+def _upload_progress():
+    job = st.session_state.get('upload')
+    if job is None or job['future'].done():
+        st.rerun()
+    progress = job['progress']
+    st.progress(progress.fraction, text=f"جاري قراءة {job['name']}: {progress.rows:,} سطر")
+
+
+# ربط أعمدة الملف بالمتغيرات اللي تستعملها الأقسام
+def _role_mapping(job):
+    table = job['future'].result()[1]
+    numeric = _numeric_columns(job)
+    st.caption(f"{job['name']}: {table.num_rows:,} سطر، {len(numeric)} عمود رقمي")
+    if len(numeric) < len(ROLES):
+        st.warning(f"الملف لازم يحتوي على {len(ROLES)} أعمدة رقمية على الأقل، راح نستعملو بيانات المثال.")
+        return
+
+    for i, role in enumerate(ROLES):
+        st.selectbox(role, numeric, index=i, key=f'role_{i}')
+
+
+# الملف المرفوع إذا كان جاهز ومربوط بالأدوار، مع الأعمدة المختارة لكل دور
+def _active_upload():
+    job = st.session_state.get('upload')
+    if st.session_state.get('data_source', SOURCES[0]) == SOURCES[0] or job is None:
+        return None
+    future = job['future']
+    if not future.done() or future.exception() is not None:
+        return None
+    mapping = tuple(st.session_state.get(f'role_{i}') for i in range(len(ROLES)))
+    if None in mapping:
+        return None
+    return job, mapping
+
+
+# البيانات اللي تستعملها الأقسام: الملف المرفوع إذا كان جاهز، وإلا بيانات المثال (نسخة وحدة مشتركة بين الجلسات)
+@timed('data')
+def get_data():
+    from engine.datasets import get_dataset
+
+    active = _active_upload()
+    if active is None:
+        return get_dataset('synthetic')
+    job, mapping = active
+    if job['frame'] is None or job['frame'][0] != mapping:
+        # نحولو غير الأعمدة المختارة من الجدول (memory-mapped) إلى pandas
+        data = job['future'].result()[1].select(list(mapping)).to_pandas().dropna()
+        data.columns = ROLES
+        job['frame'] = (mapping, data)
+    return job['frame'][1]
+
+
+# مصدر دفعات للملف المرفوع: (مفتاح، دالة ترجع الدفعات بأسماء الأدوار)، أو None لبيانات المثال
+# الدفعات تتقرا من ملف Feather على القرص، باش النماذج الكبيرة ما تحتاجش البيانات كاملة في الذاكرة
+def get_chunk_source():
+    active = _active_upload()
+    if active is None:
+        return None
+    job, mapping = active
+    digest = job['future'].result()[0]
+
+    def chunks():
+        import pandas as pd
+        from engine.store import ingest, iter_cached_batches
+
+        # إذا تحذف ملف Feather (حد حجم الذاكرة المؤقتة) نعاودو نكتبوه من الملف المرفوع
+        def reingest():
+            ingest(digest, job['source'], job['name'])
+
+        for batch in iter_cached_batches(digest, mapping, reingest=reingest):
+            yield pd.DataFrame({role: batch[column] for role, column in zip(ROLES, mapping)})
+
+    return (digest, mapping), chunks
+
+
+# كل المتغيرات المستقلة الممكنة للاستهلاك: أعمدة بيانات المثال، أو كل الأعمدة الرقمية في الملف المرفوع
+def get_regressor_pool():
+    active = _active_upload()
+    if active is None:
+        data = get_data()
+        return data.drop(columns=['الاستهلاك']), data['الاستهلاك']
+    job, mapping = active
+    target = mapping[ROLES.index('الاستهلاك')]
+    columns = [col for col in _numeric_columns(job) if col != target]
+    pool = job['future'].result()[1].select(columns + [target]).to_pandas().dropna()
+    return pool[columns], pool[target]
+
+
+# الأعمدة الرقمية في الملف المرفوع، محسوبة وقت القراءة ومحفوظة في مخطط ملف Feather
+def _numeric_columns(job):
+    from engine.store import numeric_columns
+
+    return numeric_columns(job['future'].result()[1])
@@ -0,0 +1,123 @@
+# أنواع البيانات
+
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+
+from engine.figures import render_figure
+from sections.common import display_arabic_text, show_figure
+
+# مثال بيانات سلسلة زمنية: نمو الناتج المحلي في الجزائر (%)
+YEARS = np.arange(2010, 2024)
+GDP_GROWTH = np.array([3.6, 2.8, 3.4, 2.8, 3.8, 3.7, 3.2, 1.3, 1.2, 0.8, -4.9, 3.5, 3.1, 4.1])
+
+# مثال بيانات مقطعية: معدل البطالة حسب الولاية (%)
+WILAYAS = ['الجزائر', 'وهران', 'قسنطينة', 'عنابة', 'سطيف', 'بجاية', 'تلمسان', 'ورقلة']
+UNEMPLOYMENT = np.array([9.8, 11.2, 12.5, 10.3, 13.5, 14.2, 11.8, 8.7])
+
+
+def plot_gdp_growth(years, gdp_growth):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(years, gdp_growth, marker='o', linewidth=2, color='#1976D2')
+    ax.set_title(display_arabic_text('معدل نمو الناتج المحلي الإجمالي في الجزائر (2010-2023)'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('السنة'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('معدل النمو (%)'), fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.axhline(y=0, color='red', linestyle='-', alpha=0.3)
+
+    for i, txt in enumerate(gdp_growth):
+        ax.annotate(f"{txt}%", (years[i], gdp_growth[i]), textcoords="offset points",
+                    xytext=(0, 10), ha='center', fontsize=9)
+
+    return fig
+
+
+def plot_unemployment(wilayas, unemployment):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bars = ax.bar(wilayas, unemployment, color='#2196F3')
+    ax.set_title(display_arabic_text('معدل البطالة حسب الولايات (2023)'), fontsize=16)
+    ax.set_xlabel(display_arabic_text('الولاية'), fontsize=12)
+    ax.set_ylabel(display_arabic_text('معدل البطالة (%)'), fontsize=12)
+    ax.set_ylim(0, 20)
+
+    for bar in bars:
+        height = bar.get_height()
+        ax.annotate(f'{height}%',
+                    xy=(bar.get_x() + bar.get_width() / 2, height),
+                    xytext=(0, 3),
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontsize=10)
+
+    ax.tick_params(axis='x', labelrotation=45)
+
+    return fig
+
+
+# أمثلة القسم: سلسلة زمنية وبيانات مقطعية (الرسم مع معطياته)
+TIME_SERIES = (plot_gdp_growth, YEARS, GDP_GROWTH)
+CROSS_SECTION = (plot_unemployment, WILAYAS, UNEMPLOYMENT)
+
+
+# نفس المثالين اللي يعرضهم render
+def precompute():
+    for figure in (TIME_SERIES, CROSS_SECTION):
+        render_figure(*figure)
+        yield
+
+
+def render():
+    st.markdown('<h2 class="section-title">أنواع البيانات في القياس الاقتصادي</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### أنواع البيانات اللي نستخدموها في القياس الاقتصادي:
+
+    #### 1. بيانات السلاسل الزمنية (Time Series Data)
+    هي بيانات متغير واحد أو أكثر مسجلة عبر فترات زمنية متتالية. مثلا: معدل البطالة في الجزائر من 2000 ل 2023.
+
+    #### 2. بيانات مقطعية (Cross-Sectional Data)
+    هي بيانات لعدة وحدات (أفراد، شركات، دول) في وقت معين. مثلا: دخل الأسر في ولايات الجزائر في سنة 2023.
+
+    #### 3. بيانات البانل (Panel Data)
+    تجمع بين النوعين السابقين، يعني بيانات لعدة وحدات على مدى فترة زمنية. مثلا: معدلات النمو لـ 10 دول عربية من 2010 لـ 2023.
+
+    #### 4. بيانات كمية ونوعية:
+    - **البيانات الكمية**: أرقام قابلة للقياس مثل الدخل، الأسعار، معدل البطالة
+    - **البيانات النوعية**: متغيرات وصفية مثل الجنس، المستوى التعليمي، المنطقة الجغرافية
+
+    ### كيفاش نحصلو على البيانات؟
+
+    1. **مصادر رسمية**: 
+       - الديوان الوطني للإحصائيات (ONS)
+       - بنك الجزائر
+       - الوزارات المختلفة
+
+    2. **مصادر دولية**:
+       - البنك الدولي
+       - صندوق النقد الدولي
+       - منظمة الأمم المتحدة
+
+    3. **المسوحات والاستبيانات**: جمع البيانات الأولية من خلال استبيانات أو مقابلات
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # عرض مثال لكل نوع
+    st.markdown('<h3 class="subsection-title">أمثلة على أنواع البيانات</h3>', unsafe_allow_html=True)
+
+    # مثال بيانات سلسلة زمنية
+    show_figure(*TIME_SERIES)
+
+    # مثال بيانات مقطعية
+    show_figure(*CROSS_SECTION)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصائح للتعامل مع البيانات:
+
+    1. **تحقق من مصدر البيانات**: استخدم مصادر موثوقة ورسمية
+    2. **انتبه للبيانات المفقودة**: كيفاش تتعامل مع القيم الناقصة؟
+    3. **الانتباه للقيم الشاذة**: شوف واش كاين قيم بعيدة بزاف على المتوسط
+    4. **معالجة البيانات قبل التحليل**: تنظيف البيانات من الأخطاء والتحقق من دقتها
+    5. **توثيق مصادر البيانات**: سجل من وين جبت البيانات وكيفاش عالجتها
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
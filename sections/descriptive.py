@@ -0,0 +1,138 @@
+# تحليل البيانات الوصفي
+
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+import plotly.graph_objects as go
+
+from engine.datasets import get_dataset
+from engine.figures import build_plotly, render_figure
+from engine.webgl import base_layout, line_trace, scatter_trace
+from sections.data_source import get_data
+from sections.common import display_arabic_text, show_figure, show_plotly
+
+
+def plot_distributions(data):
+    fig, axes = plt.subplots(2, 2, figsize=(12, 8))
+    fig.suptitle(display_arabic_text('توزيع المتغيرات الاقتصادية'), fontsize=16)
+
+    axes[0, 0].hist(data['الدخل'], bins=15, color='#1976D2', alpha=0.7)
+    axes[0, 0].set_title(display_arabic_text('توزيع الدخل'), fontsize=12)
+
+    axes[0, 1].hist(data['الاستهلاك'], bins=15, color='#2E7D32', alpha=0.7)
+    axes[0, 1].set_title(display_arabic_text('توزيع الاستهلاك'), fontsize=12)
+
+    axes[1, 0].hist(data['الاستثمار'], bins=15, color='#C62828', alpha=0.7)
+    axes[1, 0].set_title(display_arabic_text('توزيع الاستثمار'), fontsize=12)
+
+    axes[1, 1].hist(data['الإنفاق الحكومي'], bins=15, color='#7B1FA2', alpha=0.7)
+    axes[1, 1].set_title(display_arabic_text('توزيع الإنفاق الحكومي'), fontsize=12)
+
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.9)
+
+    return fig
+
+
+# سحابة النقاط بـ WebGL (مجمعة حسب الكثافة للملفات الكبيرة) مع خط الانحدار بين طرفي الدخل
+def plot_income_consumption(data):
+    income, consumption = data['الدخل'].to_numpy(), data['الاستهلاك'].to_numpy()
+    fig = go.Figure(scatter_trace(income, consumption, name='المشاهدات'))
+
+    # إضافة خط الانحدار
+    slope, intercept = np.polyfit(income, consumption, 1)
+    fig.add_trace(line_trace(income.min(), income.max(), intercept, slope, name='خط الانحدار', dash='dash'))
+
+    return base_layout(fig, 'العلاقة بين الدخل والاستهلاك', 'الدخل (دج)', 'الاستهلاك (دج)')
+
+
+def plot_correlation(corr):
+    fig, ax = plt.subplots(figsize=(10, 8))
+    mask = np.triu(np.ones_like(corr, dtype=bool))
+    cmap = sns.diverging_palette(220, 10, as_cmap=True)
+
+    sns.heatmap(corr, ax=ax, mask=mask, cmap=cmap, vmax=1, vmin=-1, center=0,
+                annot=True, fmt=".2f", square=True, linewidths=.5)
+
+    ax.set_title(display_arabic_text('مصفوفة الارتباط'), fontsize=16)
+
+    return fig
+
+
+# رسومات القسم الثلاثة على بيانات المثال
+def precompute():
+    data = get_dataset('synthetic')
+    render_figure(plot_distributions, data)
+    yield
+    build_plotly(plot_income_consumption, data)
+    yield
+    render_figure(plot_correlation, data.corr())
+    yield
+
+
+def render():
+    data = get_data()
+
+    st.markdown('<h2 class="section-title">تحليل البيانات الوصفي</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### تحليل البيانات الوصفي - المفهوم والأهمية
+
+    التحليل الوصفي هو الخطوة الأولى في تحليل البيانات، ويساعدنا نفهمو خصائص البيانات قبل ما نبداو في بناء النماذج.
+
+    ### مقاييس النزعة المركزية:
+
+    1. **المتوسط (Mean)**: مجموع القيم مقسوم على عددها
+    2. **الوسيط (Median)**: القيمة اللي في وسط البيانات بعد ترتيبها
+    3. **المنوال (Mode)**: القيمة الأكثر تكرارًا في البيانات
+
+    ### مقاييس التشتت:
+
+    1. **المدى (Range)**: الفرق بين أكبر وأصغر قيمة
+    2. **الانحراف المعياري (Standard Deviation)**: يقيس تشتت القيم عن المتوسط
+    3. **التباين (Variance)**: مربع الانحراف المعياري
+    4. **الربيعيات (Quartiles)**: تقسم البيانات إلى أربعة أقسام متساوية
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # عرض بيانات عشوائية
+    st.markdown('<h3 class="subsection-title">لنشوفو مثال على البيانات:</h3>', unsafe_allow_html=True)
+    st.write(data.head())
+
+    # الإحصاءات الوصفية
+    st.markdown('<h3 class="subsection-title">الإحصاءات الوصفية للبيانات:</h3>', unsafe_allow_html=True)
+    st.write(data.describe())
+
+    # رسم توزيعات البيانات
+    st.markdown('<h3 class="subsection-title">توزيع المتغيرات:</h3>', unsafe_allow_html=True)
+
+    # هيستوجرام للمتغيرات
+    show_figure(plot_distributions, data)
+
+    # رسم العلاقة بين متغيرين
+    st.markdown('<h3 class="subsection-title">العلاقة بين المتغيرات:</h3>', unsafe_allow_html=True)
+
+    show_plotly(plot_income_consumption, data)
+
+    # مصفوفة الارتباط
+    st.markdown('<h3 class="subsection-title">مصفوفة الارتباط:</h3>', unsafe_allow_html=True)
+
+    corr = data.corr()
+    st.write(corr)
+
+    # رسم مصفوفة الارتباط
+    show_figure(plot_correlation, corr)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصائح لتحليل البيانات الوصفي:
+
+    1. **دائما ابدأ بالتحليل الوصفي**: يعطيك فكرة أولية عن البيانات
+    2. **انتبه للقيم الشاذة**: حاول تفهم سببها واش تحذفها ولا تعالجها
+    3. **تفحص التوزيع**: شوف واش البيانات تتبع التوزيع الطبيعي ولا لا
+    4. **ادرس العلاقات**: شوف قوة واتجاه العلاقة بين المتغيرات من خلال معاملات الارتباط
+    5. **استخدم الرسوم البيانية**: الصورة تغنيك عن ألف كلمة
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,254 @@
+# اختبار الفرضيات
+
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+
+from engine.datasets import get_dataset
+from engine.figures import render_figure
+from engine.models import bootstrap_conf_int, fit_ols, ols_summary, restriction_permutation_test, wald_test
+from sections.data_source import get_data
+from sections.common import display_arabic_text, display_arabic_texts, show_figure, show_ols_summary
+
+REGRESSORS = ['الدخل', 'الاستثمار', 'الإنفاق الحكومي']
+
+# القيد المختبر: معامل الدخل - معامل الاستثمار = 0 (الأعمدة: الثابت، الدخل، الاستثمار، الإنفاق الحكومي)
+RESTRICTION = np.array([[0, 1, -1, 0]])
+
+# طرق حساب فترات الثقة: التحليلية (توزيع t) أو Bootstrap
+CI_METHODS = {
+    'تحليلية (توزيع t)': None,
+    'Bootstrap الأزواج': 'pairs',
+    'Bootstrap البواقي': 'residual',
+    'Bootstrap Wild': 'wild',
+}
+
+# طرق الاستدلال بالتبديلات لاختبار القيد
+PERMUTATION_METHODS = {
+    'تبديل البواقي': 'permutation',
+    'قلب إشارات البواقي': 'sign_flip',
+}
+
+
+def plot_confidence_intervals(coefs, lower, upper):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    coef_names = ['الثابت', 'الدخل', 'الاستثمار', 'الإنفاق الحكومي']
+
+    y_pos = np.arange(len(coef_names))
+
+    # رسم المعلمات
+    ax.errorbar(coefs, y_pos, xerr=[coefs - lower, upper - coefs], fmt='o', capsize=5, color='#1976D2',
+                ecolor='#1976D2', markersize=8)
+
+    ax.axvline(x=0, color='red', linestyle='--', alpha=0.7)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(display_arabic_texts(coef_names))
+    ax.set_xlabel(display_arabic_text('قيمة المعلمة'), fontsize=12)
+    ax.set_title(display_arabic_text('المعلمات المقدرة وفترات الثقة 95%'), fontsize=16)
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+
+    fig.tight_layout()
+
+    return fig
+
+
+# p-value بالتبديلات لاختبار القيد عند مستوى 5%
+def _permutation_test(X, y, method='permutation', max_permutations=10000):
+    return restriction_permutation_test(X, y, RESTRICTION, method=method, max_permutations=max_permutations,
+                                        alpha=0.05, seed=42)
+
+
+# فترات الثقة 95% للمعلمات: تحليلية إذا method=None، وإلا Bootstrap
+# Bootstrap ما يفترضش أن البواقي طبيعية، وكل التكرارات تتحسب بعمليات مصفوفات
+def _conf_int(model, X, y, method=None, replicates=2000, seed=42):
+    if method is None:
+        return model.conf_int(alpha=0.05)
+    return bootstrap_conf_int(X, y, method, replicates, seed, alpha=0.05)
+
+
+# ملخص النموذج، اختبارا القيد، ثم فترات الثقة التحليلية ورسمها
+def precompute():
+    data = get_dataset('synthetic')
+    X, y = data[REGRESSORS], data['الاستهلاك']
+    model = fit_ols(X, y)
+    ols_summary(X, y)
+    yield
+    wald_test(X, y, RESTRICTION)
+    _permutation_test(X, y)
+    yield
+    conf_int = _conf_int(model, X, y)
+    render_figure(plot_confidence_intervals, model.params, conf_int[0], conf_int[1])
+    yield
+
+
+def render():
+    data = get_data()
+
+    st.markdown('<h2 class="section-title">اختبار الفرضيات في القياس الاقتصادي</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### واش معنى اختبار الفرضيات؟
+
+    اختبار الفرضيات هو أسلوب إحصائي يستخدم للتحقق من صحة فرضية معينة حول معلمات المجتمع باستخدام بيانات العينة.
+
+    ### خطوات اختبار الفرضيات:
+
+    1. **تحديد الفرضيات**:
+       - الفرضية الصفرية (H₀): عادة تفترض عدم وجود تأثير أو علاقة
+       - الفرضية البديلة (H₁): تمثل البديل للفرضية الصفرية
+
+    2. **اختيار مستوى المعنوية (α)**:
+       - عادة يكون 0.05 (5%) أو 0.01 (1%)
+
+    3. **حساب إحصائية الاختبار**:
+       - مثل t، F، Chi-square
+
+    4. **حساب القيمة الاحتمالية (p-value)**
+
+    5. **اتخاذ القرار**:
+       - إذا كانت p-value < α، نرفض الفرضية الصفرية
+       - إذا كانت p-value > α، لا نستطيع رفض الفرضية الصفرية
+
+    ### أنواع الاختبارات الشائعة في القياس الاقتصادي:
+
+    1. **اختبار t للمعلمات الفردية**:
+       - يستخدم لاختبار معنوية معلمة واحدة (مثل β₁)
+       - H₀: β₁ = 0 (المتغير ليس له تأثير معنوي)
+       - H₁: β₁ ≠ 0 (المتغير له تأثير معنوي)
+
+    2. **اختبار F للنموذج ككل**:
+       - يختبر المعنوية الإجمالية للنموذج
+       - H₀: β₁ = β₂ = ... = βₙ = 0 (النموذج غير معنوي)
+       - H₁: على الأقل واحدة من المعلمات تختلف عن الصفر
+
+    3. **اختبار القيود (Restriction tests)**:
+       - لاختبار قيود محددة على المعلمات
+       - مثل: H₀: β₁ = β₂
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # تطبيق عملي: اختبار معنوية معلمات النموذج
+    st.markdown('<h3 class="subsection-title">تطبيق عملي: اختبار معنوية معلمات النموذج</h3>', unsafe_allow_html=True)
+
+    # نبني نموذج انحدار متعدد
+    X = data[REGRESSORS]
+    y = data['الاستهلاك']
+
+    # تقدير النموذج (مع ثابت)
+    model = fit_ols(X, y)
+
+    # عرض نتائج النموذج
+    show_ols_summary(X, y, key='hypothesis_diagnostics')
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### تفسير نتائج اختبار t:
+
+    لكل معلمة في الجدول أعلاه، لدينا:
+
+    - **المعامل**: قيمة المعلمة المقدرة
+    - **الخطأ المعياري**: الخطأ المعياري للمعلمة
+    - **إحصائية t**: محسوبة كـ (المعامل / الخطأ المعياري)
+    - **p-value**: القيمة الاحتمالية
+
+    لاختبار معنوية كل معلمة، نقارن p-value مع مستوى المعنوية α (عادة 0.05):
+
+    - إذا كانت p-value < 0.05: المعلمة معنوية إحصائيًا (نرفض الفرضية الصفرية)
+    - إذا كانت p-value > 0.05: المعلمة غير معنوية إحصائيًا (لا نستطيع رفض الفرضية الصفرية)
+
+    ### تفسير نتائج اختبار F:
+
+    في جدول جودة التوفيق، نجد:
+
+    - **إحصائية F**: قيمة إحصائية F للنموذج ككل
+    - **p-value (F)**: القيمة الاحتمالية لاختبار F
+
+    إذا كانت p-value (F) < 0.05، فهذا يعني أن النموذج ككل معنوي إحصائيًا.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # اختبار قيد على المعلمات
+    st.markdown('<h3 class="subsection-title">اختبار قيد على المعلمات</h3>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    نفترض أننا نريد اختبار الفرضية التالية:
+
+    H₀: معامل الدخل = معامل الاستثمار
+    H₁: معامل الدخل ≠ معامل الاستثمار
+
+    يمكننا استخدام اختبار Wald لهذا الغرض:
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # تطبيق اختبار Wald على القيد RESTRICTION
+    wald = wald_test(X, y, RESTRICTION)
+
+    st.write(f"إحصائية F: {wald.fvalue:.4f}")
+    st.write(f"القيمة الاحتمالية (p-value): {wald.pvalue:.4f}")
+
+    # تفسير النتيجة
+    if wald.pvalue < 0.05:
+        st.write("النتيجة: نرفض الفرضية الصفرية، أي أن معامل الدخل يختلف معنويًا عن معامل الاستثمار.")
+    else:
+        st.write(
+            "النتيجة: لا نستطيع رفض الفرضية الصفرية، أي لا يوجد دليل كافي على أن معامل الدخل يختلف عن معامل الاستثمار.")
+
+    # p-value بالتبديلات: ما تعتمدش على توزيع F، ومفيدة في العينات الصغيرة
+    st.markdown("""
+    **p-value بالتبديلات (Permutation test):** نقدرو النموذج المقيد، نبدلو بواقيه عشوائيا ونعاودو حساب F آلاف المرات.
+    نسبة التبديلات اللي تعطي F أكبر من F المحسوبة هي p-value، بلا أي افتراض على توزيع الأخطاء.
+    """)
+    col1, col2 = st.columns(2)
+    with col1:
+        perm_method = st.selectbox("طريقة التبديل", list(PERMUTATION_METHODS), key='perm_method')
+    with col2:
+        max_permutations = st.select_slider("أقصى عدد للتبديلات", [1000, 5000, 10000, 50000], value=10000,
+                                            key='perm_max')
+    permutation = _permutation_test(X, y, PERMUTATION_METHODS[perm_method], max_permutations)
+    st.write(f"القيمة الاحتمالية بالتبديلات: {permutation.pvalue:.4f} "
+             f"({permutation.permutations:,} تبديل)")
+    if permutation.stopped_early:
+        st.caption("توقف الحساب مبكرا لأن القرار عند مستوى 5% ولى محسوم.")
+
+    # اختبار فترة الثقة للمعلمات
+    st.markdown('<h3 class="subsection-title">فترات الثقة للمعلمات</h3>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        ci_method = st.selectbox("طريقة الحساب", list(CI_METHODS), key='ci_method')
+    with col2:
+        replicates = st.select_slider("عدد تكرارات Bootstrap", [1000, 2000, 5000, 10000], value=2000,
+                                      key='ci_replicates', disabled=CI_METHODS[ci_method] is None)
+    with col3:
+        seed = st.number_input("البذرة (seed)", min_value=0, value=42, step=1, key='ci_seed',
+                               disabled=CI_METHODS[ci_method] is None)
+
+    # حساب فترات الثقة
+    conf_int = _conf_int(model, X, y, CI_METHODS[ci_method], replicates, int(seed))
+    lower, upper = conf_int[0], conf_int[1]
+    conf_int = conf_int.set_axis(['الحد الأدنى (95%)', 'الحد الأعلى (95%)'], axis=1)
+
+    st.write("فترات الثقة للمعلمات عند مستوى ثقة 95%:")
+    st.write(conf_int)
+
+    # رسم فترات الثقة
+    show_figure(plot_confidence_intervals, model.params, lower, upper)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصائح لاختبار الفرضيات:
+
+    1. **اختر الفرضيات بناءً على النظرية الاقتصادية**: لازم تكون الفرضيات مبنية على أساس نظري مش عشوائية
+
+    2. **انتبه لمشكلة الاختبارات المتعددة**: عند إجراء عدة اختبارات، زيد احتمال الوقوع في خطأ من النوع الأول
+
+    3. **لا تخلط بين المعنوية الإحصائية والأهمية العملية**: معلمة قد تكون معنوية إحصائيًا لكن تأثيرها في الواقع صغير
+
+    4. **تفسير النتائج في سياقها**: التفسير يعتمد على السياق الاقتصادي وليس فقط على النتائج الإحصائية
+
+    5. **استخدم أخطاء معيارية قوية**: في حالة وجود مشاكل في النموذج، استخدم أخطاء معيارية قوية لتحسين الاستدلال
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,39 @@
+# المقدمة
+
+import streamlit as st
+
+
+def render():
+    st.markdown('<h2 class="section-title">المقدمة لعلم القياس الاقتصادي</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### واش راك خويا/أختي! مرحبا بيك في عالم القياس الاقتصادي 📊
+
+    القياس الاقتصادي (Econometrics) هو علم يجمع بين الاقتصاد، الرياضيات والإحصاء باش نقدرو نحللو البيانات الاقتصادية ونبنيو نماذج تساعدنا نفهمو العلاقات بين المتغيرات ونتنبأو بالمستقبل.
+
+    ### علاه مهم نتعلمو القياس الاقتصادي؟
+
+    1. **تحليل الظواهر الاقتصادية**: يساعدنا نفهمو كيفاش يتأثر الاقتصاد بالعوامل المختلفة
+    2. **اتخاذ القرارات**: يعاون صناع القرار يتخذو قرارات مبنية على أدلة وبيانات
+    3. **التنبؤ**: يمكننا من التنبؤ بالتغيرات الاقتصادية المستقبلية
+    4. **اختبار النظريات**: نقدرو نختبرو النظريات الاقتصادية بالأرقام والتحليل
+
+    ### واش راح نتعلمو في هذا الدليل؟
+
+    - كيفاش نجمعو ونحضرو البيانات
+    - كيفاش نديرو تحليل وصفي للبيانات
+    - كيفاش نبنيو نماذج الانحدار البسيط والمتعدد
+    - كيفاش نتعاملو مع مشاكل النماذج
+    - كيفاش نقيمو النماذج ونختارو الأفضل
+    - كيفاش نطبقو هاد المعرفة على مشاكل حقيقية
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصيحة للطلبة المبتدئين:
+
+    ما تقلقش! القياس الاقتصادي يبان صعيب في البداية، لكن مع الممارسة والصبر راح تفهمو وتحبو. خود وقتك، طبق اللي تعلمتو على بيانات حقيقية، وما تخافش تسأل وتناقش مع زملائك والأساتذة. الطريق للخبرة يبدأ بالخطوة الأولى!
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,318 @@
+# تقييم النماذج
+
+from contextlib import closing
+
+import pandas as pd
+import streamlit as st
+import matplotlib.pyplot as plt
+from plotly.subplots import make_subplots
+
+from engine.datasets import get_dataset
+from engine.figures import build_plotly, render_figure
+from engine.models import (compare_candidates, cross_validate_candidates, search_subsets, split_data,
+                           stepwise_selection)
+from engine.selection import MAX_EXHAUSTIVE
+from engine.webgl import base_layout, line_trace, scatter_trace
+from sections.data_source import get_data, get_regressor_pool
+from sections.common import display_arabic_text, show_figure, show_plotly
+
+# النماذج المرشحة: كل نموذج هو مجموعة من المتغيرات المستقلة
+CANDIDATES = {
+    'النموذج 1 (الدخل فقط)': ['الدخل'],
+    'النموذج 2 (الدخل والاستثمار)': ['الدخل', 'الاستثمار'],
+    'النموذج 3 (كل المتغيرات)': ['الدخل', 'الاستثمار', 'الإنفاق الحكومي'],
+}
+
+# المتغيرات المستقلة للنموذج الأكبر (بيانات المثال أو أدوار الملف المرفوع)
+REGRESSORS = CANDIDATES['النموذج 3 (كل المتغيرات)']
+
+CV_TITLE = 'معايير التقييم بالتحقق المتقاطع (المتوسط ± الانحراف)'
+
+# طرق تقسيم البيانات في التحقق المتقاطع
+CV_SCHEMES = {
+    'K طيات (K-fold)': 'kfold',
+    'K طيات مكررة 10 مرات': 'repeated',
+    'أصل متحرك (سلاسل زمنية)': 'rolling',
+}
+
+# معايير المفاضلة في البحث عن أفضل نموذج
+CRITERIA_LABELS = {
+    'aic': 'AIC',
+    'bic': 'BIC',
+    'adj_r2': 'R² المعدل',
+    'test_rmse': 'RMSE على بيانات الاختبار',
+}
+
+SEARCH_METHODS = ['كل التوليفات', 'اختيار أمامي', 'حذف خلفي']
+
+
+# جدول الترتيب: المعيار المعدل يتخزن بالسالب (لأن البحث يصغر القيم) لذلك نرجعوه موجب هنا
+def leaderboard_frame(leaderboard, criterion):
+    sign = -1 if criterion == 'adj_r2' else 1
+    return pd.DataFrame({
+        'المتغيرات': ['، '.join(columns) for _, columns in leaderboard],
+        'عدد المتغيرات': [len(columns) for _, columns in leaderboard],
+        CRITERIA_LABELS[criterion]: [sign * score for score, _ in leaderboard],
+    }, index=range(1, len(leaderboard) + 1))
+
+
+def stepwise_frame(path, criterion):
+    sign = -1 if criterion == 'adj_r2' else 1
+    actions = {'start': 'كل المتغيرات', 'add': 'إضافة', 'remove': 'حذف'}
+    return pd.DataFrame({
+        'الإجراء': [actions[action] for _, _, action, _, _ in path],
+        'المتغير': [var or '' for _, var, _, _, _ in path],
+        CRITERIA_LABELS[criterion]: [sign * score for _, _, _, score, _ in path],
+        'النموذج': ['، '.join(columns) for _, _, _, _, columns in path],
+    }, index=[step for step, _, _, _, _ in path])
+
+
+# spreads (اختياري): الانحراف المعياري لكل معيار عبر طيات التحقق المتقاطع، يترسم كخطوط خطأ
+def plot_metrics_comparison(metrics1, metrics2, metrics3, spreads=None, title='مقارنة معايير تقييم النماذج المختلفة'):
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig.suptitle(display_arabic_text(title), fontsize=16)
+
+    metrics_names = ['MSE', 'RMSE', 'MAE', 'R²']
+    models = ['النموذج 1', 'النموذج 2', 'النموذج 3']
+
+    for i, metric in enumerate(metrics_names):
+        row, col = i // 2, i % 2
+        values = [metrics1[metric], metrics2[metric], metrics3[metric]]
+
+        errors = [spread[metric] for spread in spreads] if spreads is not None else None
+        bars = axes[row, col].bar(models, values, yerr=errors, capsize=6, color=['#1976D2', '#2E7D32', '#C62828'],
+                                  alpha=0.7)
+
+        axes[row, col].set_title(display_arabic_text(metric), fontsize=14)
+
+        for bar in bars:
+            height = bar.get_height()
+            axes[row, col].annotate(f'{height:.2f}',
+                                    xy=(bar.get_x() + bar.get_width() / 2, height),
+                                    xytext=(0, 3),
+                                    textcoords="offset points",
+                                    ha='center', va='bottom', fontsize=9)
+
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.9)
+
+    return fig
+
+
+def plot_predictions_comparison(y_test, y1_pred, y2_pred, y3_pred):
+    titles = ['النموذج 1 (الدخل فقط)', 'النموذج 2 (الدخل والاستثمار)', 'النموذج 3 (كل المتغيرات)']
+    fig = make_subplots(rows=1, cols=3, subplot_titles=titles)
+    low, high = y_test.min(), y_test.max()
+
+    for col, (y_pred, color) in enumerate(zip([y1_pred, y2_pred, y3_pred], ['#1976D2', '#2E7D32', '#C62828']), 1):
+        fig.add_trace(scatter_trace(y_test, y_pred, name=titles[col - 1], color=color), row=1, col=col)
+        fig.add_trace(line_trace(low, high, 0, 1, color='black', dash='dash'), row=1, col=col)
+
+    fig.update_layout(showlegend=False)
+    return base_layout(fig, 'مقارنة بين القيم الفعلية والمتوقعة للنماذج', 'القيم الفعلية', 'القيم المتوقعة')
+
+
+# مقارنة النماذج المرشحة على تقسيم 70/30: جدول المعايير، رسم المعايير ورسم التنبؤات (Plotly)
+# كل النماذج تتقدر من مصفوفة X'X وحدة لبيانات التدريب والمعايير تتحسب على بيانات الاختبار
+def _compare(X, y):
+    X_train, X_test, y_train, y_test = split_data(X, y, test_size=0.3, random_state=42)
+    metrics_df, predictions = compare_candidates(X_train, y_train, X_test, y_test, CANDIDATES)
+    metrics_figure = (plot_metrics_comparison, *(metrics_df.loc[name].to_dict() for name in CANDIDATES))
+    predictions_figure = (plot_predictions_comparison, y_test,
+                          *(predictions[name].to_numpy() for name in CANDIDATES))
+    return metrics_df, metrics_figure, predictions_figure
+
+
+# التحقق المتقاطع للنماذج المرشحة: متوسط المعايير وانحرافها عبر الطيات، مع رسمهم
+def _cross_validate(X, y, scheme, folds):
+    cv_mean, cv_std = cross_validate_candidates(X, y, CANDIDATES, scheme, folds=folds)
+    figure = (plot_metrics_comparison, *(cv_mean.loc[name].to_dict() for name in CANDIDATES),
+              [cv_std.loc[name].to_dict() for name in CANDIDATES], CV_TITLE)
+    return cv_mean, cv_std, figure
+
+
+# المقارنة على تقسيم واحد ثم التحقق المتقاطع بـ 5 طيات
+def precompute():
+    data = get_dataset('synthetic')
+    X, y = data[REGRESSORS], data['الاستهلاك']
+    _, metrics_figure, predictions_figure = _compare(X, y)
+    yield
+    render_figure(*metrics_figure)
+    yield
+    build_plotly(*predictions_figure)
+    yield
+    *_, cv_figure = _cross_validate(X, y, 'kfold', 5)
+    yield
+    render_figure(*cv_figure)
+    yield
+
+
+def render():
+    data = get_data()
+
+    st.markdown('<h2 class="section-title">تقييم النماذج والمفاضلة بينها</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### أهمية تقييم النماذج:
+
+    تقييم النماذج ضروري للتأكد من أن النموذج يمثل البيانات بشكل جيد ويمكن استخدامه للتنبؤ بدقة مقبولة.
+
+    ### معايير تقييم النماذج:
+
+    #### 1. معايير الملاءمة (Goodness of fit):
+
+    - **معامل التحديد (R²)**:
+      - يقيس نسبة التباين في المتغير التابع المفسرة بواسطة النموذج
+      - تتراوح قيمته بين 0 و 1، وكلما اقتربت من 1 كان النموذج أفضل
+
+    - **معامل التحديد المعدل (Adjusted R²)**:
+      - يعدل R² ليأخذ في الاعتبار عدد المتغيرات المستقلة
+      - يستخدم للمقارنة بين نماذج بأعداد مختلفة من المتغيرات
+
+    #### 2. معايير الخطأ:
+
+    - **متوسط مربعات الخطأ (MSE)**:
+      - متوسط مربعات الفروق بين القيم الحقيقية والمتوقعة
+      - كلما قلت قيمته كان النموذج أفضل
+
+    - **الجذر التربيعي لمتوسط مربعات الخطأ (RMSE)**:
+      - الجذر التربيعي لـ MSE، ويكون بنفس وحدة قياس المتغير التابع
+
+    - **متوسط القيمة المطلقة للخطأ (MAE)**:
+      - متوسط القيم المطلقة للفروق بين القيم الحقيقية والمتوقعة
+
+    #### 3. معايير المعلومات:
+
+    - **معيار أكايكي (AIC)**:
+      - يوازن بين جودة النموذج وتعقيده
+      - كلما قلت قيمته كان النموذج أفضل
+
+    - **معيار شوارتز البياني (BIC/SBC)**:
+      - مشابه لـ AIC لكنه يفرض عقوبة أكبر على تعقيد النموذج
+      - يفضل النماذج الأبسط أكثر من AIC
+
+    #### 4. التحقق المتقاطع (Cross-Validation):
+
+    - تقسيم البيانات إلى مجموعة تدريب ومجموعة اختبار
+    - تقدير النموذج على بيانات التدريب واختباره على بيانات الاختبار
+    - يساعد في تجنب مشكلة الافراط في التخصيص (Overfitting)
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # تطبيق عملي: مقارنة نماذج مختلفة
+    st.markdown('<h3 class="subsection-title">تطبيق عملي: مقارنة بين نماذج مختلفة</h3>', unsafe_allow_html=True)
+
+    # إعداد البيانات ومقارنة النماذج
+    X = data[REGRESSORS]
+    y = data['الاستهلاك']
+    metrics_df, metrics_figure, predictions_figure = _compare(X, y)
+
+    st.write(display_arabic_text("مقارنة معايير تقييم النماذج:"))
+    st.write(metrics_df)
+
+    # رسم بياني لمقارنة أداء النماذج
+    show_figure(*metrics_figure)
+
+    # رسم المقارنة بين القيم الفعلية والمتوقعة
+    show_plotly(*predictions_figure)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### تحليل النتائج:
+
+    من خلال مقارنة معايير التقييم للنماذج الثلاثة، نستنتج:
+
+    1. **النموذج 3 (كل المتغيرات)** يقدم أفضل أداء من حيث:
+       - أقل MSE، RMSE، MAE (أخطاء أقل)
+       - أعلى R² (قدرة تفسيرية أعلى)
+
+    2. **النموذج 2 (الدخل والاستثمار)** يأتي في المرتبة الثانية، مما يشير إلى أن إضافة متغير الاستثمار يحسن النموذج مقارنة بالاعتماد على الدخل فقط
+
+    3. **النموذج 1 (الدخل فقط)** هو الأبسط، لكنه الأقل دقة
+
+    ### الاختيار بين النماذج:
+
+    اختيار النموذج المناسب يعتمد على:
+
+    1. **دقة التنبؤ**: إذا كان الهدف الرئيسي هو التنبؤ بدقة عالية، فالنموذج 3 هو الأفضل
+
+    2. **البساطة**: إذا كنت تبحث عن نموذج بسيط وسهل التفسير، فقد تفضل النموذج 2
+
+    3. **سياق المشكلة**: في بعض الحالات، تكون البساطة أهم من الدقة القصوى
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # التحقق المتقاطع: نفس النماذج على عدة تقسيمات بدل تقسيم واحد
+    st.markdown('<h3 class="subsection-title">التحقق المتقاطع (Cross-Validation)</h3>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    مع 100 مشاهدة، معايير تقسيم واحد (70% تدريب و 30% اختبار) تتبدل بزاف حسب الأسطر اللي طاحت في الاختبار.
+    في التحقق المتقاطع نقسمو البيانات لـ K طيات، كل طية تكون مرة بيانات اختبار والباقي تدريب،
+    ونحسبو متوسط المعايير وانحرافها المعياري عبر الطيات. للسلاسل الزمنية نستعملو أصل متحرك:
+    التدريب دايما على الماضي والاختبار على الفترة اللي بعده.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        scheme = st.selectbox("طريقة التقسيم", list(CV_SCHEMES), key='cv_scheme')
+    with col2:
+        folds = st.select_slider("عدد الطيات (K)", [3, 5, 10], value=5, key='cv_folds')
+
+    cv_mean, cv_std, cv_figure = _cross_validate(X, y, CV_SCHEMES[scheme], folds)
+    st.write("متوسط المعايير ± الانحراف المعياري عبر الطيات:")
+    st.write(cv_mean.map('{:.4g}'.format) + ' ± ' + cv_std.map('{:.2g}'.format))
+
+    show_figure(*cv_figure)
+
+    # البحث عن أفضل نموذج بين كل توليفات المتغيرات المستقلة
+    st.markdown('<h3 class="subsection-title">البحث عن أفضل نموذج: كل التوليفات والاختيار التدريجي</h3>', unsafe_allow_html=True)
+
+    X_pool, y_pool = get_regressor_pool()
+    st.write(f"عدد المتغيرات المرشحة: {X_pool.shape[1]}، أي {2 ** X_pool.shape[1] - 1:,} نموذج ممكن")
+    # فوق MAX_EXHAUSTIVE متغير البحث في كل التوليفات ياخذ بزاف، نخليو غير الاختيار التدريجي
+    methods = SEARCH_METHODS
+    if X_pool.shape[1] > MAX_EXHAUSTIVE:
+        methods = SEARCH_METHODS[1:]
+        st.info(f"البحث في كل التوليفات متاح حتى {MAX_EXHAUSTIVE} متغير، استعمل الاختيار الأمامي أو الحذف الخلفي.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        criterion = st.selectbox("معيار المفاضلة", list(CRITERIA_LABELS), format_func=CRITERIA_LABELS.get,
+                                 key='selection_criterion')
+    with col2:
+        method = st.radio("طريقة البحث", methods, key='selection_method')
+
+    if st.checkbox("تشغيل البحث", key='selection_run'):
+        Xp_train, Xp_test, yp_train, yp_test = split_data(X_pool, y_pool, test_size=0.3, random_state=42)
+        if method == SEARCH_METHODS[0]:
+            # الترتيب يتحدث كل ما تكمل وحدة من مهام البحث الموزعة على العمليات
+            progress = st.progress(0.0)
+            board = st.empty()
+            # closing: إذا تعاود تشغيل الصفحة في وسط البحث، المولد يتسكر والمهام الباقية تتلغى
+            with closing(search_subsets(Xp_train, yp_train, Xp_test, yp_test, criterion)) as steps:
+                for leaderboard, done, total, evaluated in steps:
+                    progress.progress(done / total, text=f"{done}/{total} مهمة، {evaluated:,} نموذج مقدر")
+                    board.dataframe(leaderboard_frame(leaderboard, criterion))
+        else:
+            direction = 'forward' if method == SEARCH_METHODS[1] else 'backward'
+            path = stepwise_selection(Xp_train, yp_train, Xp_test, yp_test, criterion, direction)
+            st.dataframe(stepwise_frame(path, criterion))
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصائح لتقييم واختيار النماذج:
+
+    1. **تجنب الإفراط في التخصيص (Overfitting)**: نموذج معقد جدًا قد يؤدي أداءً جيدًا على بيانات التدريب لكنه ضعيف في التنبؤ ببيانات جديدة
+
+    2. **استخدم التحقق المتقاطع**: خاصة مع البيانات المحدودة لتقييم أداء النموذج بشكل أفضل
+
+    3. **وازن بين الدقة والتفسير**: نموذج بسيط قابل للتفسير أحيانًا أفضل من نموذج معقد غير مفهوم
+
+    4. **راعي الهدف من النموذج**: إذا كان الهدف هو التنبؤ، ركز على معايير الخطأ. إذا كان الهدف هو التفسير، ركز على المعنوية الإحصائية والاقتصادية
+
+    5. **اختبر أداء النموذج على بيانات خارج العينة**: هذا هو الاختبار الحقيقي لقوة النموذج
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
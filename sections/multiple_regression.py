@@ -0,0 +1,216 @@
+# نموذج الانحدار المتعدد
+
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+from sklearn.metrics import r2_score
+import plotly.graph_objects as go
+
+from engine.datasets import get_dataset
+from engine.figures import build_plotly, render_figure
+from engine.models import (fit_linear, fit_ols_streaming, fit_split_streaming, ols_summary, split_data,
+                           standardized_coefficients)
+from engine.webgl import base_layout, line_trace, scatter_trace
+from sections.data_source import get_chunk_source, get_data
+from sections.common import (display_arabic_text, precompute_influence, show_figure, show_influence, show_ols_summary,
+                             show_plotly)
+
+# المتغيرات المستقلة للنموذج المتعدد (أسماء الأدوار في get_data)
+REGRESSORS = ['الدخل', 'الاستثمار', 'الإنفاق الحكومي']
+
+
+def plot_actual_vs_predicted(y_test, y_pred_test, r2_test):
+    # رسم القيم المتوقعة مقابل الفعلية
+    fig = go.Figure(scatter_trace(y_test, y_pred_test, name='بيانات الاختبار'))
+
+    # رسم الخط المرجعي
+    fig.add_trace(line_trace(y_test.min(), y_test.max(), 0, 1, name='y = x', color='black', dash='dash'))
+
+    # إضافة معلومات عن دقة النموذج
+    fig.add_annotation(x=0.02, y=0.98, xref='paper', yref='paper', text=f"R² = {r2_test:.4f}", showarrow=False,
+                       bgcolor='wheat', opacity=0.8, xanchor='left', yanchor='top')
+
+    return base_layout(fig, 'مقارنة القيم الفعلية والمتوقعة للاستهلاك', 'القيم الفعلية', 'القيم المتوقعة')
+
+
+def plot_feature_importance(std_coefficients):
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    features = ['الدخل', 'الاستثمار', 'الإنفاق الحكومي']
+    colors = ['#1976D2', '#2E7D32', '#C62828']
+
+    bars = ax.bar(features, np.abs(std_coefficients), color=colors, alpha=0.7)
+
+    for bar in bars:
+        height = bar.get_height()
+        ax.annotate(f'{height:.4f}',
+                    xy=(bar.get_x() + bar.get_width() / 2, height),
+                    xytext=(0, 3),
+                    textcoords="offset points",
+                    ha='center', va='bottom', fontsize=10)
+
+    ax.set_title(display_arabic_text('الأهمية النسبية للمتغيرات المستقلة'), fontsize=16)
+    ax.set_ylabel(display_arabic_text('المعامل المعياري المطلق'), fontsize=12)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+    return fig
+
+
+# النموذج المتعدد على تقسيم 80/20 للبيانات اللي في الذاكرة:
+# الثابت، المعاملات، R² للتدريب والاختبار، وقيم الاختبار الفعلية والمتوقعة
+def _fit_split(X_multi, y):
+    X_train, X_test, y_train, y_test = split_data(X_multi, y, test_size=0.2, random_state=42)
+    model = fit_linear(X_train, y_train)
+    y_pred_test = model.predict(X_test)
+    r2_train = r2_score(y_train, model.predict(X_train))
+    return model.intercept_, model.coef_, r2_train, r2_score(y_test, y_pred_test), y_test, y_pred_test
+
+
+# التقدير، ملخص OLS، التأثير، ثم رسمي التنبؤات والأهمية النسبية
+def precompute():
+    data = get_dataset('synthetic')
+    X_multi, y = data[REGRESSORS], data['الاستهلاك']
+    *_, r2_test, y_test, y_pred_test = _fit_split(X_multi, y)
+    yield
+    ols_summary(X_multi, y)
+    yield
+    precompute_influence(X_multi, y)
+    yield
+    build_plotly(plot_actual_vs_predicted, y_test, y_pred_test, r2_test)
+    yield
+    render_figure(plot_feature_importance, standardized_coefficients(X_multi, y))
+    yield
+
+
+def render():
+    st.markdown('<h2 class="section-title">نموذج الانحدار الخطي المتعدد</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### واش هو نموذج الانحدار المتعدد؟
+
+    هو امتداد لنموذج الانحدار البسيط، بحيث نستخدمو أكثر من متغير مستقل لتفسير المتغير التابع.
+
+    ### المعادلة العامة للنموذج:
+
+    Y = β₀ + β₁X₁ + β₂X₂ + ... + βₙXₙ + ε
+
+    حيث:
+    - Y: المتغير التابع
+    - X₁, X₂, ..., Xₙ: المتغيرات المستقلة
+    - β₀: الثابت
+    - β₁, β₂, ..., βₙ: معاملات الانحدار للمتغيرات المستقلة
+    - ε: الخطأ العشوائي
+
+    ### ليش نستخدمو الانحدار المتعدد؟
+
+    1. **تحسين القدرة التفسيرية**: إضافة متغيرات مستقلة مناسبة تزيد من قدرة النموذج على تفسير التغيرات في المتغير التابع
+
+    2. **تقليل تحيز المعلمات**: في حالة وجود ارتباط بين المتغيرات، استخدام نموذج بسيط قد يؤدي إلى تحيز في تقدير المعلمات
+
+    3. **فهم أفضل للظاهرة**: معظم الظواهر الاقتصادية متعددة الأبعاد وتتأثر بعدة عوامل
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # مثال على الانحدار المتعدد
+    st.markdown('<h3 class="subsection-title">مثال على الانحدار المتعدد:</h3>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    لندرس العوامل المؤثرة في الاستهلاك. وفقًا للنظرية الاقتصادية، الاستهلاك يتأثر بالدخل وكذلك بعوامل أخرى مثل الاستثمار والإنفاق الحكومي.
+
+    نموذج الانحدار المتعدد هنا يكون:
+
+    الاستهلاك = β₀ + β₁ × الدخل + β₂ × الاستثمار + β₃ × الإنفاق الحكومي + ε
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # تقدير النموذج المتعدد
+    # للملفات المرفوعة كل التقديرات تتحسب على دفعات من ملف Feather (memory map)، بلا الجدول كامل في الذاكرة
+    chunk_source = get_chunk_source()
+    if chunk_source is None:
+        data = get_data()
+        X_multi = data[REGRESSORS]
+        y = data['الاستهلاك']
+        intercept, coefficients, r2_train, r2_test, y_test, y_pred_test = _fit_split(X_multi, y)
+    else:
+        # نفس التقسيم 80/20 لكن عشوائي سطر بسطر، والرسم يستعمل عينة محدودة من بيانات الاختبار
+        source_key, make_chunks = chunk_source
+        split = fit_split_streaming(source_key, make_chunks, REGRESSORS, 'الاستهلاك', test_size=0.2, seed=42)
+        intercept, coefficients = split.model.params.iloc[0], split.model.params.to_numpy()[1:]
+        r2_train, r2_test = split.model.rsquared, split.r2_test
+        y_test, y_pred_test = split.y_test, split.y_pred_test
+
+    # عرض نتائج النموذج
+    st.markdown('<h3 class="subsection-title">نتائج نموذج الانحدار المتعدد:</h3>', unsafe_allow_html=True)
+
+    st.markdown(f"""
+    معادلة الانحدار المقدرة:
+
+    الاستهلاك = {intercept:.2f} + {coefficients[0]:.2f} × الدخل + {coefficients[1]:.2f} × الاستثمار + {coefficients[2]:.2f} × الإنفاق الحكومي
+
+    - معامل الدخل: {coefficients[0]:.4f}
+    - معامل الاستثمار: {coefficients[1]:.4f}
+    - معامل الإنفاق الحكومي: {coefficients[2]:.4f}
+    - الثابت: {intercept:.4f}
+    - معامل التحديد (R²) للبيانات التدريبية: {r2_train:.4f}
+    - معامل التحديد (R²) للبيانات الاختبارية: {r2_test:.4f}
+    """)
+
+    # اختبار معنوية النموذج
+    st.markdown('<h3 class="subsection-title">اختبار معنوية النموذج:</h3>', unsafe_allow_html=True)
+
+    # عرض ملخص النموذج المقدر (مع عمود ثابت) كجداول
+    # للملفات المرفوعة نقدرو النموذج على دفعات من الملف، والذاكرة تعتمد غير على عدد المتغيرات
+    if chunk_source is None:
+        show_ols_summary(X_multi, y, key='multiple_diagnostics')
+
+        # المشاهدات المؤثرة (تحتاج البواقي، لذلك غير للبيانات اللي في الذاكرة)
+        st.markdown('<h3 class="subsection-title">المشاهدات المؤثرة (Influence):</h3>', unsafe_allow_html=True)
+        show_influence(X_multi, y, index=data.index)
+    else:
+        model_streamed = fit_ols_streaming(source_key, make_chunks, REGRESSORS, 'الاستهلاك')
+        show_ols_summary(model=model_streamed)
+        st.caption("النموذج متقدر على دفعات من الملف. تشخيصات البواقي والمشاهدات المؤثرة تحتاج البيانات كاملة "
+                   "في الذاكرة، لذلك ما تظهرش للملفات المرفوعة.")
+
+    # مقارنة القيم الفعلية بالمتوقعة
+    st.markdown('<h3 class="subsection-title">مقارنة القيم الفعلية بالمتوقعة:</h3>', unsafe_allow_html=True)
+
+    show_plotly(plot_actual_vs_predicted, y_test, y_pred_test, r2_test)
+    if chunk_source is not None and split.nobs_test > len(y_test):
+        st.caption(f"الرسم يعرض عينة عشوائية من {len(y_test):,} نقطة من أصل {split.nobs_test:,} في بيانات الاختبار.")
+
+    # الأهمية النسبية للمتغيرات
+    st.markdown('<h3 class="subsection-title">الأهمية النسبية للمتغيرات المستقلة:</h3>', unsafe_allow_html=True)
+
+    # المعاملات المعيارية (للملفات المرفوعة من مجاميع نفس النموذج المقدر على دفعات)
+    if chunk_source is None:
+        std_coefficients = standardized_coefficients(X_multi, y)
+    else:
+        std_coefficients = model_streamed.standardized_params()
+
+    # رسم بياني للأهمية النسبية
+    show_figure(plot_feature_importance, std_coefficients)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### مشاكل شائعة في نماذج الانحدار المتعدد:
+
+    1. **الازدواج الخطي (Multicollinearity)**:
+       - يحدث عندما تكون المتغيرات المستقلة مرتبطة فيما بينها
+       - يؤدي إلى عدم استقرار المعلمات وصعوبة تفسيرها
+       - الحل: حذف المتغيرات المرتبطة أو استخدام تقنيات مثل تحليل المكونات الرئيسية
+
+    2. **انتقاء المتغيرات**:
+       - إضافة متغيرات غير مهمة تؤدي إلى تعقيد النموذج دون تحسين أدائه
+       - الحل: استخدام تقنيات انتقاء المتغيرات مثل Stepwise Regression أو LASSO
+
+    3. **الافراط في التخصيص (Overfitting)**:
+       - النموذج يتعلم ضوضاء البيانات بدل العلاقات الحقيقية
+       - الحل: تقسيم البيانات والتحقق من أداء النموذج على بيانات الاختبار
+
+    4. **عدم خطية العلاقة**:
+       - الحل: استخدام تحويلات للمتغيرات أو نماذج غير خطية
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
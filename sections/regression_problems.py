@@ -0,0 +1,342 @@
+# مشاكل الانحدار وحلولها
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from engine.datasets import get_dataset
+from engine.figures import render_figure
+from engine.models import fit_linear, compute_vif, heteroskedasticity_diagnostics, penalized_path
+from sections.common import display_arabic_text, show_figure
+
+
+def plot_heteroskedasticity(X_h, y_h, predictions_h, residuals_h):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+
+    # رسم نقاط البيانات والنموذج المقدر
+    axes[0].scatter(X_h, y_h, alpha=0.6, color='#1976D2', label=display_arabic_text('البيانات الفعلية'))
+    axes[0].plot(X_h, predictions_h, color='red', linewidth=2, label=display_arabic_text('خط الانحدار المقدر'))
+    axes[0].set_title(display_arabic_text('بيانات تعاني من عدم تجانس التباين'), fontsize=14)
+    axes[0].set_xlabel('X', fontsize=12)
+    axes[0].set_ylabel('Y', fontsize=12)
+    axes[0].legend()
+    axes[0].grid(True, linestyle='--', alpha=0.7)
+
+    # رسم البواقي مقابل القيم المتوقعة
+    axes[1].scatter(predictions_h, residuals_h, alpha=0.6, color='#1976D2')
+    axes[1].axhline(y=0, color='red', linestyle='-', alpha=0.3)
+    axes[1].set_title(display_arabic_text('البواقي مقابل القيم المتوقعة'), fontsize=14)
+    axes[1].set_xlabel(display_arabic_text('القيم المتوقعة'), fontsize=12)
+    axes[1].set_ylabel(display_arabic_text('البواقي'), fontsize=12)
+    axes[1].grid(True, linestyle='--', alpha=0.7)
+
+    fig.tight_layout()
+
+    return fig
+
+
+def plot_log_transform(X_log, y_log, predictions_log, residuals_log):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+
+    # رسم العلاقة بعد التحويل
+    axes[0].scatter(X_log, y_log, alpha=0.6, color='#1976D2', label=display_arabic_text('البيانات بعد التحويل'))
+    axes[0].plot(X_log, predictions_log, color='red', linewidth=2, label=display_arabic_text('خط الانحدار المقدر'))
+    axes[0].set_title(display_arabic_text('العلاقة بعد التحويل اللوغاريتمي'), fontsize=14)
+    axes[0].set_xlabel(display_arabic_text('لوغاريتم X'), fontsize=12)
+    axes[0].set_ylabel(display_arabic_text('لوغاريتم Y'), fontsize=12)
+    axes[0].legend()
+    axes[0].grid(True, linestyle='--', alpha=0.7)
+
+    # رسم البواقي بعد التحويل
+    axes[1].scatter(predictions_log, residuals_log, alpha=0.6, color='#1976D2')
+    axes[1].axhline(y=0, color='red', linestyle='-', alpha=0.3)
+    axes[1].set_title(display_arabic_text('البواقي بعد التحويل اللوغاريتمي'), fontsize=14)
+    axes[1].set_xlabel(display_arabic_text('القيم المتوقعة'), fontsize=12)
+    axes[1].set_ylabel(display_arabic_text('البواقي'), fontsize=12)
+    axes[1].grid(True, linestyle='--', alpha=0.7)
+
+    fig.tight_layout()
+
+    return fig
+
+
+def plot_correlation_matrix(corr_matrix):
+    fig, ax = plt.subplots(figsize=(8, 6))
+    sns.heatmap(corr_matrix, ax=ax, annot=True, cmap='coolwarm', fmt=".2f", linewidths=0.5)
+    ax.set_title(display_arabic_text('مصفوفة الارتباط بين المتغيرات المستقلة'), fontsize=14)
+
+    return fig
+
+
+# المتغيرات المستقلة في مثال الازدواج الخطي (X2 مرتبط بشدة مع X1)
+VIF_COLUMNS = ['X1', 'X2', 'X3']
+
+# أنواع الانحدار المنظم في قسم الازدواج الخطي
+PENALTY_LABELS = {
+    'Ridge': 'ridge',
+    'Lasso': 'lasso',
+    'Elastic Net': 'elastic_net',
+}
+
+CV_FOLDS = 5
+
+
+def plot_regularization_path(lambdas, coefs, cv_mean, cv_std, best_lambda, title):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle(display_arabic_text(title), fontsize=16)
+
+    # مسار المعاملات: كل معامل كدالة في log(λ)
+    for name in coefs.columns:
+        axes[0].plot(np.log10(lambdas), coefs[name], linewidth=2, label=name)
+    axes[0].axvline(np.log10(best_lambda), color='gray', linestyle='--')
+    axes[0].axhline(0, color='black', linewidth=0.8)
+    axes[0].set_title(display_arabic_text('مسار المعاملات'), fontsize=14)
+    axes[0].set_xlabel('log₁₀ λ', fontsize=12)
+    axes[0].set_ylabel(display_arabic_text('المعامل'), fontsize=12)
+    axes[0].legend()
+    axes[0].grid(True, linestyle='--', alpha=0.7)
+
+    # خطأ التحقق المتقاطع مع ± انحراف معياري بين الطيات
+    axes[1].plot(np.log10(lambdas), cv_mean, color='#C62828', linewidth=2)
+    axes[1].fill_between(np.log10(lambdas), cv_mean - cv_std, cv_mean + cv_std, color='#C62828', alpha=0.15)
+    axes[1].axvline(np.log10(best_lambda), color='gray', linestyle='--')
+    axes[1].set_title(display_arabic_text(f'متوسط مربعات الخطأ بالتحقق المتقاطع ({CV_FOLDS} طيات)'), fontsize=14)
+    axes[1].set_xlabel('log₁₀ λ', fontsize=12)
+    axes[1].set_ylabel('MSE', fontsize=12)
+    axes[1].grid(True, linestyle='--', alpha=0.7)
+
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.88)
+
+    return fig
+
+
+# انحدار بسيط لـ y على x في جدول: X بشكل عمود، y، التنبؤات والبواقي
+def _fit_residuals(df, x, y):
+    X = df[x].values.reshape(-1, 1)
+    y = df[y].values
+    predictions = fit_linear(X, y).predict(X)
+    return X, y, predictions, y - predictions
+
+
+# مسار الانحدار المنظم لنوع العقوبة المختار، مع رسمه
+def _penalized(X_vif, y_vif, penalty_label):
+    path = penalized_path(X_vif, y_vif, PENALTY_LABELS[penalty_label], folds=CV_FOLDS)
+    figure = (plot_regularization_path, path.lambdas, path.coefs, path.cv_mean, path.cv_std, path.best_lambda(),
+              f'مسار {penalty_label}')
+    return path, figure
+
+
+# عدم تجانس التباين والتحويل اللوغاريتمي، ثم الازدواج الخطي والمسار المنظم لأول عقوبة
+def precompute():
+    X_h, y_h, predictions_h, residuals_h = _fit_residuals(get_dataset('hetero'), 'X', 'y')
+    render_figure(plot_heteroskedasticity, X_h, y_h, predictions_h, residuals_h)
+    heteroskedasticity_diagnostics(X_h, y_h, sort_by=0)
+    yield
+
+    render_figure(plot_log_transform, *_fit_residuals(get_dataset('log'), 'log_X', 'log_y'))
+    yield
+
+    df_multi = get_dataset('multi')
+    X_vif, y_vif = df_multi[VIF_COLUMNS], df_multi['y']
+    render_figure(plot_correlation_matrix, X_vif.corr())
+    compute_vif(X_vif.values)
+    fit_linear(X_vif, y_vif)
+    yield
+    render_figure(*_penalized(X_vif, y_vif, next(iter(PENALTY_LABELS)))[1])
+    yield
+
+
+def render():
+    st.markdown('<h2 class="section-title">مشاكل الانحدار وحلولها</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### المشاكل الشائعة في نماذج الانحدار والحلول المناسبة لها:
+
+    #### 1. عدم تجانس التباين (Heteroscedasticity)
+
+    **المشكلة**: تباين حدود الخطأ غير ثابت عبر المشاهدات
+
+    **الكشف عنها**:
+    - اختبار White أو Breusch-Pagan
+    - فحص رسم البواقي مقابل القيم المتوقعة
+
+    **الحلول**:
+    - استخدام الأخطاء المعيارية القوية (Robust Standard Errors)
+    - تحويل المتغير التابع (مثل اللوغاريتم)
+    - استخدام نموذج الانحدار الموزون (WLS)
+
+    #### 2. الارتباط الذاتي (Autocorrelation)
+
+    **المشكلة**: حدود الخطأ غير مستقلة عن بعضها، خاصة في بيانات السلاسل الزمنية
+
+    **الكشف عنها**:
+    - اختبار Durbin-Watson
+    - رسم البواقي مع الزمن
+
+    **الحلول**:
+    - تضمين متغيرات مبطأة (Lagged Variables)
+    - استخدام نماذج ARIMA
+    - تصحيح Cochrane-Orcutt
+
+    #### 3. الازدواج الخطي (Multicollinearity)
+
+    **المشكلة**: ارتباط قوي بين المتغيرات المستقلة
+
+    **الكشف عنها**:
+    - عامل تضخم التباين (VIF)
+    - مصفوفة الارتباط بين المتغيرات المستقلة
+
+    **الحلول**:
+    - حذف بعض المتغيرات المرتبطة
+    - استخدام تحليل المكونات الرئيسية (PCA)
+    - تطبيق Ridge Regression أو LASSO
+
+    #### 4. سوء تعيين النموذج (Model Misspecification)
+
+    **المشكلة**: تعيين خاطئ لشكل العلاقة بين المتغيرات
+
+    **الكشف عنها**:
+    - اختبار Ramsey RESET
+    - تحليل البواقي
+
+    **الحلول**:
+    - إضافة متغيرات جديدة
+    - إدخال تحويلات غير خطية
+    - استخدام نماذج أكثر مرونة
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # تطبيق عملي: عدم تجانس التباين
+    st.markdown('<h3 class="subsection-title">تطبيق عملي: الكشف عن عدم تجانس التباين</h3>', unsafe_allow_html=True)
+
+    # بيانات تعاني من عدم تجانس التباين (مشتركة بين كل الجلسات)
+    df_hetero = get_dataset('hetero')
+
+    # تقدير النموذج، التنبؤات والبواقي
+    X_h, y_h, predictions_h, residuals_h = _fit_residuals(df_hetero, 'X', 'y')
+
+    # رسم العلاقة والبواقي
+    show_figure(plot_heteroskedasticity, X_h, y_h, predictions_h, residuals_h)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    في الرسم البياني للبواقي مقابل القيم المتوقعة، نلاحظ أن البواقي تتشتت بشكل أكبر كلما زادت القيمة المتوقعة، مما يشير إلى وجود مشكلة عدم تجانس التباين.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # الاختبارات الإحصائية والأخطاء المعيارية القوية، كلها من بواقي نفس النموذج
+    diagnostics = heteroskedasticity_diagnostics(X_h, y_h, sort_by=0)
+
+    st.write("اختبارات عدم تجانس التباين (الفرضية الصفرية: التباين متجانس):")
+    st.write(diagnostics.tests_frame())
+
+    st.write("الأخطاء المعيارية القوية (HC0–HC3 و Newey-West):")
+    st.write(diagnostics.bse_frame())
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    القيم الاحتمالية للاختبارات الثلاثة أقل من 0.05، لذلك نرفض فرضية تجانس التباين.
+    الأخطاء المعيارية القوية (خاصة HC3 في العينات الصغيرة) تسمح بالاستدلال الصحيح على المعاملات بلا ما نبدلو النموذج.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # الحل: تطبيق تحويل لوغاريتمي
+    st.markdown('<h3 class="subsection-title">الحل: تطبيق التحويل اللوغاريتمي</h3>', unsafe_allow_html=True)
+
+    # تطبيق التحويل اللوغاريتمي
+    df_log = get_dataset('log')
+
+    # تقدير النموذج بعد التحويل، التنبؤات والبواقي
+    X_log, y_log, predictions_log, residuals_log = _fit_residuals(df_log, 'log_X', 'log_y')
+
+    # رسم النتائج بعد التحويل
+    show_figure(plot_log_transform, X_log, y_log, predictions_log, residuals_log)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    بعد تطبيق التحويل اللوغاريتمي، نلاحظ أن البواقي أصبحت أكثر تجانسًا وتتوزع بشكل عشوائي حول الصفر، مما يشير إلى تحسن في مشكلة عدم تجانس التباين.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # مشكلة الازدواج الخطي
+    st.markdown('<h3 class="subsection-title">الكشف عن الازدواج الخطي</h3>', unsafe_allow_html=True)
+
+    # بيانات بها ازدواج خطي (X2 مرتبط بشدة مع X1)
+    df_multi = get_dataset('multi')
+
+    # حساب مصفوفة الارتباط
+    corr_matrix = df_multi[VIF_COLUMNS].corr()
+
+    # عرض مصفوفة الارتباط
+    st.write(display_arabic_text("مصفوفة الارتباط بين المتغيرات المستقلة:"))
+    st.write(corr_matrix)
+
+    # رسم مصفوفة الارتباط
+    show_figure(plot_correlation_matrix, corr_matrix)
+
+    # حساب VIF
+    X_vif = df_multi[VIF_COLUMNS]
+    vif_data = pd.DataFrame()
+    vif_data["متغير"] = X_vif.columns
+    vif_data["VIF"] = compute_vif(X_vif.values)
+
+    st.write(display_arabic_text("عامل تضخم التباين (VIF):"))
+    st.write(vif_data)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    نلاحظ أن قيمة الارتباط بين X1 و X2 مرتفعة (حوالي 0.8)، كما أن قيمة VIF للمتغيرين X1 و X2 أكبر من 5، مما يشير إلى وجود مشكلة الازدواج الخطي.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # الانحدار المنظم كحل للازدواج الخطي
+    st.markdown('<h3 class="subsection-title">الانحدار المنظم: Ridge و Lasso و Elastic Net</h3>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    كي تكون المتغيرات مرتبطة بقوة، معاملات OLS تولي غير مستقرة. الانحدار المنظم يزيد عقوبة على حجم المعاملات:
+    - **Ridge**: عقوبة على مجموع مربعات المعاملات، يقلصها كامل بلا ما يصفرها
+    - **Lasso**: عقوبة على مجموع القيم المطلقة، يقدر يصفر بعض المعاملات (اختيار المتغيرات)
+    - **Elastic Net**: مزيج بين الاثنين
+
+    كلما كبرت λ زادت العقوبة. نحسبو المسار كامل (100 قيمة λ) ونختارو λ اللي تعطي أصغر خطأ بالتحقق المتقاطع.
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    penalty_label = st.radio("نوع العقوبة", list(PENALTY_LABELS), horizontal=True, key='penalty_type')
+    y_vif = df_multi['y']
+    path, figure = _penalized(X_vif, y_vif, penalty_label)
+    best_lambda = path.best_lambda()
+
+    show_figure(*figure)
+
+    # مقارنة المعاملات عند أحسن λ مع معاملات OLS
+    ols = fit_linear(X_vif, y_vif)
+    comparison = pd.DataFrame({
+        'OLS': np.concatenate([[ols.intercept_], ols.coef_]),
+        f'{penalty_label} (λ = {best_lambda:.4g})': np.concatenate([[path.intercepts[best_lambda]],
+                                                                  path.coefs.loc[best_lambda].to_numpy()]),
+    }, index=['الثابت'] + list(X_vif.columns))
+    st.write(comparison)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصائح للتعامل مع مشاكل الانحدار:
+
+    1. **دائمًا افحص افتراضات النموذج**: قبل ما تعتمد على نتائج النموذج، تأكد من أن الافتراضات الأساسية محققة
+
+    2. **استخدم الاختبارات الإحصائية**: هناك اختبارات خاصة للكشف عن كل مشكلة، استخدمها للتحقق
+
+    3. **الرسوم البيانية مهمة**: الفحص البصري للبواقي والعلاقات يمكن أن يكشف مشاكل غير ظاهرة في الإحصاءات
+
+    4. **جرب عدة تحويلات**: في حالة المشاكل، جرب تحويلات مختلفة (لوغاريتم، جذر تربيعي، إلخ)
+
+    5. **استشر النظرية الاقتصادية**: الحلول الفنية مهمة، لكن دائمًا راجع النظرية الاقتصادية لتأكيد معنى النتائج
+
+    6. **تذكر أن النموذج تبسيط للواقع**: كل نموذج فيه قصور، المهم هو فهم حدود النموذج وتفسير النتائج بحذر
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,166 @@
+# نموذج الانحدار الخطي البسيط
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from sklearn.metrics import r2_score
+
+from engine.datasets import get_dataset
+from engine.figures import build_plotly
+from engine.models import fit_linear, ols_summary
+from engine.webgl import base_layout, line_trace, scatter_trace
+from sections.data_source import get_data
+from sections.common import precompute_influence, show_influence, show_ols_summary, show_plotly
+
+
+# الرسم في المتصفح (WebGL): النقاط تتجمع حسب الكثافة إذا كانت كثيرة، وخط الانحدار نقطتين برك
+def plot_simple_regression(X, y, intercept, slope, r2):
+    x = np.asarray(X, dtype=np.float64).ravel()
+    fig = go.Figure(scatter_trace(x, y, name='البيانات الفعلية'))
+
+    # رسم خط الانحدار
+    fig.add_trace(line_trace(x.min(), x.max(), intercept, slope, name='خط الانحدار المقدر'))
+
+    # إضافة معلومات النموذج على الرسم
+    equation_text = f"الاستهلاك = {intercept:.2f} + {slope:.2f} × الدخل<br>R² = {r2:.4f}"
+    fig.add_annotation(x=0.02, y=0.98, xref='paper', yref='paper', text=equation_text, showarrow=False,
+                       bgcolor='wheat', opacity=0.8, xanchor='left', yanchor='top', align='left')
+
+    return base_layout(fig, 'نموذج الانحدار الخطي البسيط: العلاقة بين الدخل والاستهلاك', 'الدخل (دج)',
+                       'الاستهلاك (دج)')
+
+
+# انحدار الاستهلاك على الدخل: X و y مع الثابت والميل و R²
+def _fit_simple(data):
+    X = data['الدخل'].values.reshape(-1, 1)
+    y = data['الاستهلاك'].values
+    model = fit_linear(X, y)
+    return X, y, model.intercept_, model.coef_[0], r2_score(y, model.predict(X))
+
+
+# النموذج ورسمه، ملخص OLS، ثم رسم التأثير
+def precompute():
+    X, y, intercept, slope, r2 = _fit_simple(get_dataset('synthetic'))
+    build_plotly(plot_simple_regression, X, y, intercept, slope, r2)
+    yield
+    ols_summary(X, y)
+    yield
+    precompute_influence(X, y)
+    yield
+
+
+def render():
+    data = get_data()
+
+    st.markdown('<h2 class="section-title">نموذج الانحدار الخطي البسيط</h2>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### واش هو نموذج الانحدار الخطي البسيط؟
+
+    هو نموذج إحصائي يستخدم لدراسة العلاقة بين متغيرين: متغير مستقل (X) ومتغير تابع (Y).
+
+    ### المعادلة العامة للنموذج:
+
+    Y = β₀ + β₁X + ε
+
+    حيث:
+    - Y: المتغير التابع (المتغير اللي حابين نتنبأو به)
+    - X: المتغير المستقل (المتغير المفسر)
+    - β₀: الثابت (قيمة Y لما X تساوي صفر)
+    - β₁: معامل الانحدار (مقدار تغير Y عندما تتغير X بوحدة واحدة)
+    - ε: الخطأ العشوائي (الفرق بين القيم الحقيقية والقيم المتوقعة)
+
+    ### كيفاش نقدرو معلمات النموذج؟
+
+    نستخدم طريقة المربعات الصغرى العادية (OLS) اللي تختار قيم β₀ و β₁ بحيث تقلل مجموع مربعات الأخطاء.
+
+    ### كيفاش نفسرو النتائج؟
+
+    1. **معامل الانحدار (β₁)**:
+       - إذا كان موجب: العلاقة طردية بين X و Y
+       - إذا كان سالب: العلاقة عكسية بين X و Y
+       - القيمة تعبر عن مقدار تغير Y لكل تغير وحدة واحدة في X
+
+    2. **الثابت (β₀)**:
+       - قيمة Y المتوقعة عندما X تساوي صفر (إذا كان له معنى اقتصادي)
+
+    3. **معامل التحديد (R²)**:
+       - يقيس نسبة التباين في Y اللي يفسرها النموذج
+       - تتراوح قيمته بين 0 و 1، وكلما اقتربت من 1 كان النموذج أفضل
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # مثال على الانحدار الخطي البسيط
+    st.markdown('<h3 class="subsection-title">مثال على الانحدار الخطي البسيط:</h3>', unsafe_allow_html=True)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    لنفترض أننا ندرس العلاقة بين الدخل والاستهلاك في الجزائر. وفقًا للنظرية الاقتصادية، كلما زاد الدخل يزيد الاستهلاك.
+
+    نموذج الانحدار هنا يكون:
+
+    الاستهلاك = β₀ + β₁ * الدخل + ε
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # تقدير النموذج: المعلمات و R²
+    X, y, intercept, slope, r2 = _fit_simple(data)
+
+    # عرض نتائج النموذج
+    st.markdown('<h3 class="subsection-title">نتائج نموذج الانحدار:</h3>', unsafe_allow_html=True)
+
+    st.markdown(f"""
+    - معادلة الانحدار المقدرة: الاستهلاك = {intercept:.2f} + {slope:.2f} × الدخل
+    - معامل الانحدار (β₁): {slope:.4f}
+    - الثابت (β₀): {intercept:.4f}
+    - معامل التحديد (R²): {r2:.4f}
+    """)
+
+    # رسم العلاقة والنموذج المقدر
+    show_plotly(plot_simple_regression, X, y, intercept, slope, r2)
+
+    # اختبار معنوية النموذج
+    st.markdown('<h3 class="subsection-title">اختبار معنوية النموذج:</h3>', unsafe_allow_html=True)
+
+    # عرض ملخص النموذج المقدر (مع عمود ثابت) كجداول
+    show_ols_summary(X, y, key='simple_diagnostics')
+
+    # المشاهدات المؤثرة
+    st.markdown('<h3 class="subsection-title">المشاهدات المؤثرة (Influence):</h3>', unsafe_allow_html=True)
+
+    show_influence(X, y, index=data.index)
+
+    st.markdown('<div class="content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### كيفاش نفسرو ملخص النموذج؟
+
+    1. **مستوى المعنوية (p-value)**: 
+       - إذا كانت قيمة p-value أقل من 0.05، فهذا يعني أن المعلمة معنوية إحصائيًا
+       - في هذا المثال، معامل الانحدار معنوي مما يؤكد وجود علاقة بين الدخل والاستهلاك
+
+    2. **R-squared**: 
+       - يبين أن الدخل يفسر نسبة كبيرة من التغيرات في الاستهلاك
+
+    3. **F-statistic**: 
+       - اختبار لمعنوية النموذج ككل، وفي هذه الحالة النموذج معنوي
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="tip-box content-text">', unsafe_allow_html=True)
+    st.markdown("""
+    ### نصائح ومحاذير:
+
+    1. **الارتباط مش سببية**: وجود علاقة ارتباط قوية بين متغيرين ما يعنيش بالضرورة وجود علاقة سببية
+
+    2. **حدود التنبؤ**: احذر من التنبؤ خارج نطاق البيانات المستخدمة في تقدير النموذج
+
+    3. **افحص الافتراضات**: نموذج الانحدار الخطي يستند على افتراضات معينة:
+       - خطية العلاقة
+       - استقلالية الأخطاء
+       - ثبات تباين الأخطاء (التجانس)
+       - التوزيع الطبيعي للأخطاء
+
+    4. **ربط النتائج بالنظرية**: دائمًا حاول تفسير النتائج في ضوء النظرية الاقتصادية
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
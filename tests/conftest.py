@@ -0,0 +1,44 @@
+# اختبارات صحة المحركات: كل محرك يتقارن مع statsmodels أو scikit-learn على بيانات ببذرة ثابتة
+# يحتاج pytest (pip install pytest)، والمراجع statsmodels و scikit-learn موجودة في requirements.txt
+# الاستعمال (من جذر المستودع): python -m pytest tests
+import os
+import sys
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+REGRESSORS = ['x1', 'x2', 'x3', 'x4']
+
+
+# بيانات انحدار صغيرة: متغيرات مرتبطة، متغير بلا أثر (x4)، وتباين يكبر مع x1
+@pytest.fixture(scope='session')
+def data():
+    rng = np.random.default_rng(20240501)
+    n = 400
+    x1 = rng.normal(50, 10, n)
+    x2 = 0.6 * x1 + rng.normal(0, 8, n)
+    x3 = rng.uniform(0, 20, n)
+    x4 = rng.normal(0, 1, n)
+    y = 5 + 0.8 * x1 - 0.5 * x2 + 1.5 * x3 + rng.normal(0, 1, n) * (1 + 0.05 * x1)
+    return pd.DataFrame({'x1': x1, 'x2': x2, 'x3': x3, 'x4': x4, 'y': y})
+
+
+@pytest.fixture(scope='session')
+def X(data):
+    return data[REGRESSORS]
+
+
+@pytest.fixture(scope='session')
+def y(data):
+    return data['y']
+
+
+# نموذج statsmodels المرجعي على نفس البيانات (مع الثابت)
+@pytest.fixture(scope='session')
+def reference(X, y):
+    return sm.OLS(y, sm.add_constant(X)).fit()
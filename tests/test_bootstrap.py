@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from engine.bootstrap import METHODS, bootstrap_coefficients, percentile_intervals
+
+REPLICATES = 2000
+
+
+# الانحراف المعياري للتكرارات يقرب من الخطأ المعياري المناسب في statsmodels:
+# pairs و wild يتحملو عدم تجانس التباين (HC0)، و residual يفترض تباين ثابت (بدون تصحيح درجات الحرية)
+@pytest.mark.parametrize('method', METHODS)
+def test_spread_matches_statsmodels(X, y, reference, method):
+    coefs = bootstrap_coefficients(X, y, method, replicates=REPLICATES, seed=1)
+    if method == 'residual':
+        expected = reference.bse * np.sqrt(reference.df_resid / reference.nobs)
+    else:
+        expected = reference.get_robustcov_results('HC0').bse
+    np.testing.assert_allclose(coefs.std(axis=0, ddof=1), expected, rtol=0.08)
+    assert np.all(np.abs(coefs.mean(axis=0) - reference.params) < 0.1 * reference.bse)
+
+
+# نفس البذرة تعطي نفس التكرارات مهما كان عدد الخيوط (كل دفعة عندها بذرة خاصة بها)
+@pytest.mark.parametrize('method', METHODS)
+def test_deterministic_across_workers(X, y, method, monkeypatch):
+    monkeypatch.setattr('engine.bootstrap.BATCH_ELEMENTS', 40 * len(y))
+    serial = bootstrap_coefficients(X, y, method, replicates=300, seed=5, workers=1)
+    threaded = bootstrap_coefficients(X, y, method, replicates=300, seed=5, workers=4)
+    np.testing.assert_array_equal(serial, threaded)
+    assert serial.shape == (300, X.shape[1] + 1)
+
+
+def test_percentile_intervals(X, y):
+    coefs = bootstrap_coefficients(X, y, 'pairs', replicates=REPLICATES, seed=1)
+    names = ['const'] + list(X.columns)
+    intervals = percentile_intervals(coefs, names)
+    np.testing.assert_allclose(intervals[0], np.quantile(coefs, 0.025, axis=0))
+    np.testing.assert_allclose(intervals[1], np.quantile(coefs, 0.975, axis=0))
+    assert list(intervals.index) == names
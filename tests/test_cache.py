@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from engine.cache import CACHES, LRUCache
+
+
+@pytest.fixture
+def cache():
+    cache = LRUCache('test', maxsize=2)
+    yield cache
+    CACHES.pop('test', None)
+
+
+# يبدا الحساب في خيط ويستنى release، ويرجع النتيجة (أو الخطأ) من كل الخيوط اللي طلبت نفس المفتاح
+def _race(cache, compute, waiters=3):
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return compute()
+
+    def request(fn):
+        try:
+            results.append(cache.get_or_compute('key', fn))
+        except Exception as exc:
+            results.append(exc)
+
+    owner = threading.Thread(target=request, args=(blocking,))
+    owner.start()
+    assert started.wait(5)
+    others = [threading.Thread(target=request, args=(lambda: pytest.fail('computed twice'),))
+              for _ in range(waiters)]
+    for thread in others:
+        thread.start()
+    # كل طلب ينضم للحساب الجاري يتحسب hit قبل ما يستنى النتيجة
+    while cache.stats()['hits'] < waiters:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in [owner, *others]:
+        thread.join(5)
+    return results
+
+
+# الطلبات المتزامنة لنفس المفتاح تستنى حساب واحد وتاخذ نفس القيمة
+def test_concurrent_requests_share_one_computation(cache):
+    value = object()
+    results = _race(cache, lambda: value)
+    assert len(results) == 4 and all(result is value for result in results)
+    assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 3
+    assert cache.get('key') is value
+
+
+# إذا فشل الحساب، نفس الخطأ يوصل لكل اللي كانو يستناو، والمفتاح ما يتخزنش
+def test_exception_reaches_waiters_and_is_not_cached(cache):
+    error = ValueError('failed')
+
+    def fail():
+        raise error
+
+    results = _race(cache, fail)
+    assert len(results) == 4 and all(result is error for result in results)
+    assert cache.get('key') is None and not cache._pending
+    assert cache.get_or_compute('key', lambda: 1) == 1
+
+
+# فوق maxsize يتحذف المفتاح الأقدم استعمالا
+def test_least_recently_used_key_is_evicted(cache):
+    cache.get_or_compute('a', lambda: 1)
+    cache.get_or_compute('b', lambda: 2)
+    cache.get_or_compute('a', lambda: pytest.fail('a was evicted'))
+    cache.get_or_compute('c', lambda: 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from engine.crossval import cross_validate_subsets, make_splits
+
+CANDIDATES = {'x1': ['x1'], 'x1+x3': ['x1', 'x3'], 'all': ['x1', 'x2', 'x3', 'x4']}
+
+
+# نفس التقسيمات بـ sklearn: تقدير LinearRegression على أسطر التدريب لكل طية
+def _sklearn_scores(X, y, columns, splits):
+    rows = []
+    for train_end, test in splits:
+        train = np.setdiff1d(np.arange(len(y)), test) if train_end is None else np.arange(train_end)
+        model = LinearRegression().fit(X.iloc[train][columns], y.iloc[train])
+        prediction = model.predict(X.iloc[test][columns])
+        truth = y.iloc[test]
+        mse = mean_squared_error(truth, prediction)
+        rows.append([mse, np.sqrt(mse), mean_absolute_error(truth, prediction), r2_score(truth, prediction)])
+    return np.array(rows)
+
+
+@pytest.mark.parametrize('scheme', ['kfold', 'repeated', 'rolling'])
+def test_matches_sklearn(X, y, scheme):
+    splits = make_splits(len(y), scheme, folds=5, repeats=3, seed=11)
+    mean, std = cross_validate_subsets(X, y, CANDIDATES, splits, workers=2)
+    for name, columns in CANDIDATES.items():
+        scores = _sklearn_scores(X, y, columns, splits)
+        np.testing.assert_allclose(mean.loc[name], scores.mean(axis=0), rtol=1e-8)
+        np.testing.assert_allclose(std.loc[name], scores.std(axis=0, ddof=1), rtol=1e-6)
+
+
+# التقسيمات: K طيات تغطي كل الأسطر مرة وحدة، والأصل المتحرك يختبر دايما على المستقبل
+def test_splits(X):
+    n = len(X)
+    kfold = make_splits(n, 'kfold', folds=5, seed=1)
+    np.testing.assert_array_equal(np.sort(np.concatenate([test for _, test in kfold])), np.arange(n))
+    assert len(make_splits(n, 'repeated', folds=5, repeats=4)) == 20
+    for train_end, test in make_splits(n, 'rolling', folds=5):
+        assert test.min() == train_end
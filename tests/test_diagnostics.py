@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from statsmodels.stats.diagnostic import het_breuschpagan, het_goldfeldquandt, het_white
+from statsmodels.stats.sandwich_covariance import cov_hac
+
+from engine.diagnostics import HeteroskedasticityDiagnostics
+
+
+@pytest.fixture(scope='module')
+def diagnostics(reference):
+    return HeteroskedasticityDiagnostics(reference.model.exog, reference.resid, reference.model.exog_names, gq_sort=1)
+
+
+def test_breusch_pagan_and_white(diagnostics, reference):
+    exog = reference.model.exog
+    lm, lm_pvalue, _, _ = het_breuschpagan(reference.resid, exog)
+    np.testing.assert_allclose([diagnostics.breusch_pagan['statistic'], diagnostics.breusch_pagan['pvalue']],
+                               [lm, lm_pvalue], rtol=1e-8)
+    lm, lm_pvalue, _, _ = het_white(reference.resid, exog)
+    np.testing.assert_allclose([diagnostics.white['statistic'], diagnostics.white['pvalue']],
+                               [lm, lm_pvalue], rtol=1e-8)
+
+
+# Goldfeld-Quandt بالترتيب حسب x1، والبيانات مرتبة بنفس الشكل في statsmodels
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+def test_goldfeld_quandt(diagnostics, reference):
+    order = np.argsort(reference.model.exog[:, 1], kind='stable')
+    fvalue, pvalue, _ = het_goldfeldquandt(reference.model.endog[order], reference.model.exog[order],
+                                           alternative='increasing')
+    np.testing.assert_allclose([diagnostics.goldfeld_quandt['statistic'], diagnostics.goldfeld_quandt['pvalue']],
+                               [fvalue, pvalue], rtol=1e-8)
+
+
+@pytest.mark.parametrize('kind', ['HC0', 'HC1', 'HC2', 'HC3'])
+def test_sandwich_covariances(diagnostics, reference, kind):
+    np.testing.assert_allclose(diagnostics.cov[kind], reference.get_robustcov_results(kind).cov_params(), rtol=1e-8)
+
+
+# HAC بلا تصحيح مثل fit(cov_type='HAC')، ومع hac_correction=True مثل cov_hac
+def test_newey_west(diagnostics, reference):
+    lags = int(math.floor(4 * (reference.nobs / 100) ** (2 / 9)))
+    expected = sm.OLS(reference.model.endog, reference.model.exog).fit(cov_type='HAC', cov_kwds={'maxlags': lags})
+    np.testing.assert_allclose(diagnostics.cov['HAC'], expected.cov_params(), rtol=1e-8)
+
+    corrected = HeteroskedasticityDiagnostics(reference.model.exog, reference.resid, hac_correction=True)
+    np.testing.assert_allclose(corrected.cov['HAC'], cov_hac(reference, nlags=lags), rtol=1e-8)
@@ -0,0 +1,39 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import pytest
+
+from engine.figures import render_figure
+
+
+def _line(values):
+    fig, ax = plt.subplots()
+    ax.plot(values)
+    return fig
+
+
+def _broken(values):
+    fig, ax = plt.subplots()
+    ax.plot(values)
+    raise RuntimeError('builder failed')
+
+
+# الصورة تتحسب مرة وحدة، والشكل يتسكر بعد savefig
+def test_render_figure_caches_and_closes():
+    before = plt.get_fignums()
+    image = render_figure(_line, (1, 2, 3))
+    assert image.startswith(b'\x89PNG')
+    assert render_figure(_line, (1, 2, 3)) is image
+    assert plt.get_fignums() == before
+
+
+# إذا فشلت builder الأشكال اللي فتحتها تتسكر والخطأ يوصل للي طلب الرسم
+def test_render_figure_closes_figures_on_builder_error():
+    before = plt.get_fignums()
+    with pytest.raises(RuntimeError):
+        render_figure(_broken, (1, 2, 3))
+    assert plt.get_fignums() == before
+    with pytest.raises(RuntimeError):
+        render_figure(_broken, (1, 2, 3))
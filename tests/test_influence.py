@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from statsmodels.stats.outliers_influence import OLSInfluence
+
+from engine.influence import InfluenceDiagnostics
+
+
+@pytest.fixture(scope='module')
+def expected(reference):
+    return OLSInfluence(reference)
+
+
+# نفس المقاييس مهما كان حجم الدفعة في QR (دفعة وحدة أو دفعات صغيرة)
+@pytest.mark.parametrize('chunk_rows', [65_536, 33])
+def test_matches_statsmodels(X, y, expected, chunk_rows):
+    ours = InfluenceDiagnostics(X, y, names=X.columns, chunk_rows=chunk_rows)
+    np.testing.assert_allclose(ours.leverage, expected.hat_matrix_diag, rtol=1e-8)
+    np.testing.assert_allclose(ours.student_internal, expected.resid_studentized_internal, rtol=1e-8)
+    np.testing.assert_allclose(ours.student_external, expected.resid_studentized_external, rtol=1e-8)
+    np.testing.assert_allclose(ours.cooks_distance, expected.cooks_distance[0], rtol=1e-8)
+    np.testing.assert_allclose(ours.dffits, expected.dffits[0], rtol=1e-8)
+    np.testing.assert_allclose(ours.press_resid, expected.resid_press, rtol=1e-8)
+    np.testing.assert_allclose(ours.press, expected.ess_press, rtol=1e-8)
+    np.testing.assert_allclose(ours.dfbetas(X), expected.dfbetas, rtol=1e-7, atol=1e-12)
+
+
+# الجدول للأسطر الأكثر تأثيرا بترتيب مسافة Cook، و DFBETAS لأسطر محددة
+def test_most_influential_frame(X, y, expected):
+    ours = InfluenceDiagnostics(X, y, names=X.columns)
+    top = ours.most_influential(5)
+    np.testing.assert_array_equal(top, np.argsort(-expected.cooks_distance[0])[:5])
+    table = ours.frame(X, top, index=X.index)
+    assert list(table.index) == list(X.index[top])
+    np.testing.assert_allclose(table.iloc[:, -5:], expected.dfbetas[top], rtol=1e-7, atol=1e-12)
+    np.testing.assert_allclose(table['DFFITS'], expected.dffits[0][top], rtol=1e-8)
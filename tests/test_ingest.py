@@ -0,0 +1,93 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine import ingest
+from engine.ingest import ColumnScan, iter_table
+
+
+def _scan(*chunks):
+    scan = ColumnScan()
+    for chunk in chunks:
+        scan.update(pd.Series(chunk))
+    return scan.resolve()
+
+
+# أصغر نوع يحفظ القيم من كل الدفعات، ماشي من أول دفعة برك
+def test_numeric_plan():
+    assert _scan([1, 2, 3], [100, -5]) == np.int8
+    assert _scan([1, 2, 3], [1000]) == np.int16
+    assert _scan([1, 2], [2 ** 40]) == np.int64
+    assert _scan([0.5, 0.25], [1.5]) == np.float32
+    assert _scan([0.5], [0.1]) == np.float64
+    # دفعة فارغة (كلها NaN) ما تحددش النوع، لكن العمود يحتاج NaN لذلك يولي float
+    assert _scan([1, 2], [np.nan, np.nan]) == np.float32
+    assert _scan([np.nan], [np.nan]) == np.float32
+
+
+def test_text_plan():
+    assert _scan(['1', '2'], ['3']) == np.int8
+    assert _scan(['1.5', None], ['2']) == np.float32
+    assert _scan(['a', 'b', 'a', 'b'], ['a', 'b']) == pd.CategoricalDtype(['a', 'b'])
+    # أرقام أو قيم منطقية في دفعة ونص في أخرى: كل العمود نص
+    text = pd.Series(['x']).dtype
+    assert _scan([1, 2], ['x', 'y', 'x', 'x']) == text
+    assert _scan([True, False], ['x']) == text
+    assert _scan([True, False], [True]) == np.bool_
+    assert _scan([True, False], [np.nan]) == object
+
+
+# القيم المختلفة تتوقف عن الجمع فوق الحد، والعمود يبقى نص
+def test_distinct_values_are_capped(monkeypatch):
+    monkeypatch.setattr(ingest, 'MAX_CATEGORIES', 10)
+    scan = ColumnScan()
+    scan.update(pd.Series(['a', 'b'] * 50))
+    assert len(scan.distinct) == 2
+    scan.update(pd.Series([f'id{i}' for i in range(100)]))
+    assert scan.distinct is None
+    assert not isinstance(scan.resolve(), pd.CategoricalDtype)
+
+    # أرقام التعريف تتخلى من أول دفعة (أكثر من CATEGORY_RATIO من الأسطر)
+    ids = ColumnScan()
+    ids.update(pd.Series([f'id{i}' for i in range(100)]))
+    assert ids.distinct is None
+
+
+# كل الدفعات تخرج بنفس الأنواع، والقيم ما تتبدلش
+@pytest.mark.parametrize('chunk_rows', [7, 1000])
+def test_iter_table_dtypes_are_consistent(chunk_rows):
+    n = 60
+    frame = pd.DataFrame({'small': np.r_[np.arange(n // 2) % 100, np.arange(n // 2) + 1000],
+                          'f': np.r_[np.full(n // 2, 0.5), np.linspace(0, 1, n // 2) / 3],
+                          'label': ['a', 'b', 'c'] * (n // 3),
+                          'gap': np.r_[np.full(n // 2, np.nan), np.arange(n // 2)]})
+    source = io.BytesIO(frame.to_csv(index=False).encode())
+    chunks = list(iter_table(source, 'data.csv', chunk_rows=chunk_rows))
+    assert len({tuple(map(str, chunk.dtypes)) for chunk in chunks}) == 1
+    result = pd.concat(chunks, ignore_index=True)
+    assert result['small'].dtype == np.int16
+    assert isinstance(result['label'].dtype, pd.CategoricalDtype)
+    np.testing.assert_array_equal(result['small'], frame['small'])
+    np.testing.assert_allclose(result['f'], frame['f'])
+    np.testing.assert_allclose(result['gap'], frame['gap'])
+
+
+def test_unsupported_extension():
+    with pytest.raises(ValueError):
+        list(iter_table(io.BytesIO(b''), 'data.json'))
+
+
+# الأعمدة اللي تنفع كمتغيرات تتحدد من ملخصات كل الدفعات: بلا الثابتة، النص، وأرقام التعريف
+@pytest.mark.parametrize('chunk_rows', [7, 1000])
+def test_regressor_columns_from_scans(chunk_rows):
+    n = 60
+    frame = pd.DataFrame({'id': np.arange(n) + 1, 'x': np.arange(n) % 7, 'f': np.linspace(0, 1, n),
+                          'const': np.full(n, 3.0), 'label': ['a', 'b', 'c'] * (n // 3),
+                          'flag': [True, False] * (n // 2), 'text_num': [str(i % 5) for i in range(n)],
+                          'empty': np.full(n, np.nan)})
+    scans = {}
+    source = io.BytesIO(frame.to_csv(index=False).encode())
+    list(iter_table(source, 'data.csv', chunk_rows=chunk_rows, scans=scans))
+    assert [col for col, scan in scans.items() if scan.regressor()] == ['x', 'f', 'text_num']
@@ -0,0 +1,60 @@
+import numpy as np
+import statsmodels.api as sm
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+from engine.ols import SufficientStats, fit_ols_chunks, fit_split_chunks
+
+
+def _chunks(data, size):
+    return [data.iloc[start:start + size] for start in range(0, len(data), size)]
+
+
+# التقدير على دفعات يعطي نفس نتائج statsmodels مهما كان حجم الدفعة
+def test_chunked_fit_matches_statsmodels(data, X, reference):
+    for size in (len(data), 64, 7):
+        model = fit_ols_chunks(_chunks(data, size), X.columns, 'y')
+        np.testing.assert_allclose(model.params, reference.params, rtol=1e-9)
+        np.testing.assert_allclose(model.bse, reference.bse, rtol=1e-9)
+        np.testing.assert_allclose(model.pvalues, reference.pvalues, rtol=1e-6, atol=1e-12)
+        np.testing.assert_allclose(model.conf_int(), reference.conf_int(), rtol=1e-9)
+        np.testing.assert_allclose([model.rsquared, model.rsquared_adj, model.fvalue, model.ssr],
+                                   [reference.rsquared, reference.rsquared_adj, reference.fvalue, reference.ssr],
+                                   rtol=1e-9)
+
+
+# الأسطر اللي فيها NaN أو inf تتحذف قبل التقدير
+def test_missing_rows_are_dropped(data, X):
+    noisy = data.copy()
+    noisy.loc[[3, 50, 200], 'x2'] = np.nan
+    noisy.loc[7, 'y'] = np.inf
+    clean = noisy.replace(np.inf, np.nan).dropna()
+    expected = sm.OLS(clean['y'], sm.add_constant(clean[X.columns])).fit()
+    model = SufficientStats(X.columns).update(noisy[X.columns], noisy['y']).fit()
+    assert model.nobs == expected.nobs
+    np.testing.assert_allclose(model.params, expected.params, rtol=1e-9)
+
+
+# المعاملات المعيارية = معاملات الانحدار على المتغيرات الموحدة
+def test_standardized_params_match_sklearn(data, X, y):
+    model = fit_ols_chunks(_chunks(data, 50), X.columns, 'y')
+    scaled = StandardScaler().fit_transform(X)
+    target = (y - y.mean()) / y.std(ddof=0)
+    np.testing.assert_allclose(model.standardized_params(), LinearRegression().fit(scaled, target).coef_, rtol=1e-9)
+
+
+# التقسيم على دفعات: نموذج التدريب و R² للاختبار مثل statsmodels و sklearn على نفس الأسطر
+def test_split_fit_matches_in_memory_split(data, X):
+    split = fit_split_chunks(lambda: _chunks(data, 64), X.columns, 'y', test_size=0.25, seed=3)
+    rng = np.random.default_rng(3)
+    test = np.concatenate([rng.random(len(chunk)) < 0.25 for chunk in _chunks(data, 64)])
+    train, held_out = data[~test], data[test]
+    expected = sm.OLS(train['y'], sm.add_constant(train[X.columns])).fit()
+    np.testing.assert_allclose(split.model.params, expected.params, rtol=1e-9)
+
+    prediction = LinearRegression().fit(train[X.columns], train['y']).predict(held_out[X.columns])
+    residual = held_out['y'] - prediction
+    r2 = 1 - residual @ residual / np.sum(np.square(held_out['y'] - held_out['y'].mean()))
+    assert split.nobs_test == test.sum()
+    np.testing.assert_allclose(split.r2_test, r2, rtol=1e-9)
+    np.testing.assert_allclose(np.sort(split.y_test), np.sort(held_out['y']))
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import ElasticNet, Ridge
+
+from engine.penalized import PENALTIES, cross_validate_path, regularization_path
+
+# نقارنو غير بعض قيم λ على طول المسار
+CHECKED = [0, 10, 40, 70, 99]
+
+
+# نفس دالة الهدف في sklearn على المتغيرات الموحدة (انحراف معياري بـ ddof=0)، ومن بعد نرجعو للسلم الأصلي
+def _sklearn_fit(X, y, lam, alpha):
+    X = np.asarray(X, dtype=np.float64)
+    mean, scale = X.mean(axis=0), X.std(axis=0)
+    if alpha == 0.0:
+        model = Ridge(alpha=len(y) * lam)
+    else:
+        model = ElasticNet(alpha=lam, l1_ratio=alpha, tol=1e-12, max_iter=100_000)
+    model.fit((X - mean) / scale, y)
+    coefs = model.coef_ / scale
+    return coefs, model.intercept_ - coefs @ mean
+
+
+@pytest.mark.parametrize('penalty', list(PENALTIES))
+def test_path_matches_sklearn(X, y, penalty):
+    alpha = PENALTIES[penalty]
+    path = regularization_path(X, y, alpha=alpha, names=X.columns)
+    for index in CHECKED:
+        coefs, intercept = _sklearn_fit(X, y, path.lambdas[index], alpha)
+        np.testing.assert_allclose(path.coefs.iloc[index], coefs, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(path.intercepts.iloc[index], intercept, rtol=1e-5, atol=1e-6)
+
+
+# Lasso: عند λ_max كل المعاملات صفر، والمتغيرات تدخل المسار شوية بشوية
+def test_lasso_path_shape(X, y):
+    path = regularization_path(X, y, alpha=1.0)
+    assert path.df.iloc[0] == 0
+    assert path.df.iloc[-1] == X.shape[1]
+    assert (np.diff(path.df.to_numpy()) >= -1).all()
+
+
+# خطأ التحقق المتقاطع لكل λ: كل طية تتوحد بمتوسطات وانحرافات أسطر تدريبها، مثل sklearn على نفس الطيات
+def test_cross_validation_matches_sklearn(X, y):
+    folds = 5
+    path = regularization_path(X, y, alpha=0.5)
+    mean, std = cross_validate_path(X, y, path, folds=folds, seed=4)
+    assignment = np.random.default_rng(4).permutation(len(y)) % folds
+    values, target = X.to_numpy(), y.to_numpy()
+    for index in CHECKED:
+        errors = []
+        for fold in range(folds):
+            test = assignment == fold
+            coefs, intercept = _sklearn_fit(values[~test], target[~test], path.lambdas[index], 0.5)
+            errors.append(np.mean(np.square(target[test] - values[test] @ coefs - intercept)))
+        np.testing.assert_allclose(mean[index], np.mean(errors), rtol=1e-5)
+        np.testing.assert_allclose(std[index], np.std(errors, ddof=1), rtol=1e-4)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+
+from engine.permutation import METHODS, permutation_f_test
+
+# القيود على [const, x1, x2, x3, x4]: x4 ما عندوش أثر، والباقي معنوي
+NULL_RESTRICTION = [[0, 0, 0, 0, 1]]
+JOINT_RESTRICTION = [[0, 0, 0, 1, 0], [0, 0, 0, 0, 1]]
+
+
+# الإحصائية F و p-value التقريبية مثل f_test في statsmodels، حتى مع قيد غير متجانس (r ≠ 0)
+@pytest.mark.parametrize('R, r', [(NULL_RESTRICTION, None), (JOINT_RESTRICTION, None), ([[0, 1, 1, 0, 0]], [0.3])])
+def test_f_statistic_matches_statsmodels(X, y, reference, R, r):
+    result = permutation_f_test(sm.add_constant(X), y, R, r, max_permutations=200, seed=0)
+    expected = reference.f_test(R if r is None else (R, r))
+    np.testing.assert_allclose(result.fvalue, float(np.squeeze(expected.fvalue)), rtol=1e-9)
+    np.testing.assert_allclose(result.f_pvalue, float(expected.pvalue), rtol=1e-8)
+    assert (result.df_num, result.df_denom) == (len(R), reference.df_resid)
+
+
+# تحت فرضية العدم p-value بالتبديلات تقرب من p-value توزيع F، وللقيد المرفوض تكون في أصغر قيمة ممكنة
+@pytest.mark.parametrize('method', METHODS)
+def test_permutation_pvalues(X, y, reference, method):
+    null = permutation_f_test(sm.add_constant(X), y, NULL_RESTRICTION, method=method, max_permutations=4000,
+                              seed=2, early_stop=False)
+    assert abs(null.pvalue - float(reference.f_test(NULL_RESTRICTION).pvalue)) < 0.03
+    assert null.permutations == 4000 and not null.stopped_early
+
+    rejected = permutation_f_test(sm.add_constant(X), y, JOINT_RESTRICTION, method=method, seed=2)
+    assert rejected.exceed == 0
+    assert rejected.stopped_early and rejected.permutations < 10000
+    assert rejected.pvalue == 1 / (rejected.permutations + 1)
+
+
+# نفس البذرة تعطي نفس النتيجة
+def test_seeded(X, y):
+    first = permutation_f_test(sm.add_constant(X), y, NULL_RESTRICTION, max_permutations=500, seed=9)
+    second = permutation_f_test(sm.add_constant(X), y, NULL_RESTRICTION, max_permutations=500, seed=9)
+    assert (first.exceed, first.permutations) == (second.exceed, second.permutations)
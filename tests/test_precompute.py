@@ -0,0 +1,47 @@
+import threading
+
+from engine.precompute import Precomputer
+
+
+def _task(log, steps, started=None, release=None):
+    def run():
+        for step in range(steps):
+            if started is not None and step == 1:
+                started.set()
+                release.wait(5)
+            log.append(step)
+            yield
+
+    return run
+
+
+# العامل ما يبداش خطوة جديدة وقت العرض التفاعلي، ويكمل منين يتسكر
+def test_interactive_pauses_steps():
+    worker = Precomputer()
+    log = []
+    with worker.interactive():
+        assert worker.submit('a', _task(log, 3))
+        threading.Event().wait(0.2)
+        assert log == []
+    worker._queue.join()
+    assert log == [0, 1, 2]
+    assert worker.completed == ['a']
+    # كل اسم يتحسب مرة وحدة في العملية
+    assert not worker.submit('a', _task(log, 3))
+
+
+# الإيقاف يرمي المهام اللي في الانتظار ويوقف المهمة الجارية عند الخطوة الجاية
+def test_cancel_stops_running_and_pending_tasks():
+    worker = Precomputer()
+    started, release = threading.Event(), threading.Event()
+    running, pending = [], []
+    worker.submit('running', _task(running, 5, started, release))
+    worker.submit('pending', _task(pending, 3))
+    assert started.wait(5)
+    worker.cancel()
+    release.set()
+    worker._thread.join(5)
+    assert not worker._thread.is_alive()
+    assert running == [0, 1] and pending == []
+    assert worker.completed == []
+    assert not worker.submit('later', _task([], 1))
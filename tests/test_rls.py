@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from statsmodels.regression.rolling import RollingOLS
+
+from engine.rls import RecursiveLeastSquares
+
+
+@pytest.fixture(scope='module')
+def recursive(X, y):
+    return sm.RecursiveLS(y.to_numpy(), sm.add_constant(X.to_numpy())).fit()
+
+
+# بعد كل الأسطر، التحديثات rank-one تعطي نفس OLS الكامل
+def test_full_sample_matches_ols(X, y, reference):
+    model = RecursiveLeastSquares(X.columns).update(X, y).fit()
+    np.testing.assert_allclose(model.params, reference.params, rtol=1e-8)
+    np.testing.assert_allclose(model.bse, reference.bse, rtol=1e-8)
+    np.testing.assert_allclose(model.rsquared, reference.rsquared, rtol=1e-10)
+
+
+# البواقي التكرارية و CUSUM مثل RecursiveLS في statsmodels (بعد أسطر التهيئة)
+def test_recursive_residuals_and_cusum(X, y, recursive):
+    model = RecursiveLeastSquares(X.columns).update(X, y)
+    start = recursive.nobs_diffuse
+    np.testing.assert_allclose(model.recursive_residuals, recursive.resid_recursive[start:], rtol=1e-7, atol=1e-9)
+
+    statistic, lower, upper = model.cusum()
+    np.testing.assert_allclose(statistic, recursive.cusum, rtol=1e-7, atol=1e-9)
+    # الحدود عند t = k+1, ..., n
+    _, expected_upper = recursive._cusum_significance_bounds(0.05, ddof=0,
+                                                             points=np.arange(start + 1, recursive.nobs + 1))
+    np.testing.assert_allclose(upper, expected_upper, rtol=1e-12)
+    np.testing.assert_allclose(lower, -upper)
+
+
+# النافذة المتحركة (update + downdate) تعطي نفس نتائج RollingOLS في كل خطوة
+def test_window_matches_rolling_ols(X, y):
+    window = 60
+    expected = RollingOLS(y, sm.add_constant(X), window=window).fit()
+    model = RecursiveLeastSquares(X.columns, window=window)
+    for end in range(len(y)):
+        model.update(X.iloc[end], y.iloc[end])
+        if end >= window - 1 and end % 37 == 0:
+            fit = model.fit()
+            np.testing.assert_allclose(fit.params, expected.params.iloc[end], rtol=1e-7)
+            np.testing.assert_allclose(fit.bse, expected.bse.iloc[end], rtol=1e-7)
+            np.testing.assert_allclose(fit.rsquared, expected.rsquared.iloc[end], rtol=1e-8)
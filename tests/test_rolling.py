@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from statsmodels.regression.rolling import RollingOLS
+
+from engine.rolling import rolling_ols
+
+
+# كل نافذة مثل RollingOLS: المعاملات، الأخطاء المعيارية (مع الثابت) و R²
+@pytest.mark.parametrize('window', [30, 150])
+def test_moving_window_matches_statsmodels(X, y, window):
+    result = rolling_ols(X, y, window=window, names=X.columns, index=X.index)
+    expected = RollingOLS(y, sm.add_constant(X), window=window).fit()
+    ends = result.params.index
+    np.testing.assert_allclose(result.params, expected.params.loc[ends], rtol=1e-8)
+    np.testing.assert_allclose(result.bse, expected.bse.loc[ends], rtol=1e-8)
+    np.testing.assert_allclose(result.rsquared, expected.rsquared.loc[ends], rtol=1e-8)
+    assert (result.nobs == window).all()
+
+
+# النافذة المتوسعة (window=None) تبدا من min_nobs وآخر نافذة هي العينة كاملة
+def test_expanding_window_matches_statsmodels(X, y, reference):
+    result = rolling_ols(X, y, names=X.columns, min_nobs=20)
+    expected = RollingOLS(y.to_numpy(), sm.add_constant(X.to_numpy()), window=len(y), min_nobs=20, expanding=True).fit()
+    ends = result.params.index
+    np.testing.assert_allclose(result.params, expected.params[ends], rtol=1e-8)
+    np.testing.assert_allclose(result.bse, expected.bse[ends], rtol=1e-8)
+    np.testing.assert_allclose(result.params.iloc[-1], reference.params, rtol=1e-9)
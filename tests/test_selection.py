@@ -0,0 +1,75 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error
+
+from engine.selection import CRITERIA, MAX_EXHAUSTIVE, prepare_problem, search_best_subsets, stepwise
+
+TOP = 5
+
+
+@pytest.fixture(scope='module')
+def split(X, y):
+    return X.iloc[:300], y.iloc[:300], X.iloc[300:], y.iloc[300:]
+
+
+@pytest.fixture(scope='module')
+def problem(split):
+    return prepare_problem(*split)
+
+
+# قيمة المعيار من statsmodels (أو sklearn لخطأ الاختبار)، بنفس الاتجاه: كلما صغرت كان أحسن
+def _reference_score(split, criterion, subset):
+    X_train, y_train, X_test, y_test = split
+    columns = X_train.columns[list(subset)]
+    if criterion == 'test_rmse':
+        model = LinearRegression().fit(X_train[columns], y_train)
+        return math.sqrt(mean_squared_error(y_test, model.predict(X_test[columns])))
+    fit = sm.OLS(y_train, sm.add_constant(X_train[columns])).fit()
+    return {'aic': fit.aic, 'bic': fit.bic, 'adj_r2': -fit.rsquared_adj}[criterion]
+
+
+def _brute_force(split, criterion, k):
+    scores = [(_reference_score(split, criterion, subset), subset)
+              for size in range(1, k + 1) for subset in itertools.combinations(range(k), size)]
+    return sorted(scores)[:TOP]
+
+
+# البحث (مع branch-and-bound للمعايير الرتيبة) يلقى نفس أحسن المجموعات اللي يلقاها البحث الشامل
+@pytest.mark.parametrize('criterion', CRITERIA)
+def test_best_subsets_match_brute_force(split, problem, criterion):
+    *_, (leaderboard, done, total, _) = search_best_subsets(problem, criterion, top=TOP, processes=1)
+    assert done == total
+    expected = _brute_force(split, criterion, problem['k'])
+    assert [subset for _, subset in leaderboard] == [subset for _, subset in expected]
+    np.testing.assert_allclose([score for score, _ in leaderboard], [score for score, _ in expected], rtol=1e-9)
+
+
+# الاختيار الأمامي: في كل خطوة نفس المتغير اللي يختاره البحث الجشع بـ statsmodels
+def test_forward_stepwise_matches_greedy_search(split, problem):
+    path = stepwise(problem, 'aic', 'forward')
+    current, best = [], math.inf
+    for step, variable, action, score, subset in path:
+        moves = sorted((_reference_score(split, 'aic', sorted(current + [j])), j)
+                       for j in range(problem['k']) if j not in current)
+        assert action == 'add' and variable == moves[0][1]
+        np.testing.assert_allclose(score, moves[0][0], rtol=1e-9)
+        assert moves[0][0] < best
+        current, best = sorted(current + [variable]), moves[0][0]
+        assert subset == tuple(current)
+    # ووقف لما ما بقاش متغير يحسن المعيار
+    remaining = [_reference_score(split, 'aic', sorted(current + [j])) for j in range(problem['k']) if j not in current]
+    assert all(score >= best for score in remaining)
+
+
+# فوق MAX_EXHAUSTIVE متغير البحث في كل التوليفات يترفض قبل ما يبدا
+def test_exhaustive_search_refuses_too_many_regressors():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, MAX_EXHAUSTIVE + 1))
+    problem = prepare_problem(X, X.sum(axis=1) + rng.normal(size=200))
+    with pytest.raises(ValueError):
+        next(search_best_subsets(problem, 'aic'))
@@ -0,0 +1,77 @@
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from engine import store
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, 'CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _csv(rows):
+    frame = pd.DataFrame({'a': range(rows), 'b': [0.5 * i for i in range(rows)]})
+    return io.BytesIO(frame.to_csv(index=False).encode())
+
+
+def _age(digest, seconds):
+    os.utime(store._path(digest), (seconds, seconds))
+
+
+# load_or_ingest يرجع جدول Arrow، والمرة الثانية يقراه من القرص بلا ما يعاود يحول الملف
+def test_load_or_ingest_returns_cached_table(cache_dir, monkeypatch):
+    digest, table = store.load_or_ingest(_csv(50), 'data.csv')
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 50
+    assert table.select(['b']).to_pandas()['b'].iloc[-1] == 24.5
+
+    monkeypatch.setattr(store, 'ingest', lambda *args, **kwargs: pytest.fail('re-ingested'))
+    again, cached = store.load_or_ingest(_csv(50), 'data.csv')
+    assert again == digest
+    assert cached.equals(table)
+
+
+# evict يحذف الأقدم استعمالا، ويخلي الملفات المفتوحة واللي في keep
+def test_evict_skips_open_and_kept_files(cache_dir):
+    digests = [store.load_or_ingest(_csv(rows), 'data.csv')[0] for rows in (10, 20, 30)]
+    for age, digest in enumerate(digests):
+        _age(digest, 1_000 + age)
+
+    with store._opened(digests[0]):
+        store.evict(max_bytes=0, keep=(digests[1],))
+        remaining = {path.stem for path in cache_dir.glob('*.feather')}
+    assert remaining == {digests[0], digests[1]}
+    assert not store._open
+
+    store.evict(max_bytes=0)
+    assert not list(cache_dir.glob('*.feather'))
+
+
+# إذا تحذف الملف، iter_cached_batches يعاود يكتبو عبر reingest قبل القراءة
+def test_iter_cached_batches_reingests_evicted_file(cache_dir):
+    source = _csv(40)
+    digest, _ = store.load_or_ingest(source, 'data.csv')
+    store.evict(max_bytes=0)
+    calls = []
+
+    def reingest():
+        calls.append(digest)
+        store.ingest(digest, source, 'data.csv')
+
+    batches = list(store.iter_cached_batches(digest, ['b', 'b'], reingest=reingest))
+    assert calls == [digest]
+    assert list(pd.concat(batches).columns) == ['b']
+    assert len(pd.concat(batches)) == 40
+
+
+# الأعمدة الرقمية تتحفظ في مخطط الملف وقت القراءة
+def test_numeric_columns_are_stored_in_schema(cache_dir):
+    frame = pd.DataFrame({'id': range(30), 'x': [i % 4 for i in range(30)], 'label': ['a', 'b', 'c'] * 10})
+    source = io.BytesIO(frame.to_csv(index=False).encode())
+    _, table = store.load_or_ingest(source, 'data.csv')
+    assert store.numeric_columns(table) == ['x']
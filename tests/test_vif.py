@@ -0,0 +1,24 @@
+import numpy as np
+import statsmodels.api as sm
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+from engine.vif import variance_inflation_factors
+
+
+# قطر معكوس مصفوفة الارتباط = VIF من الانحدارات المساعدة في statsmodels (مع الثابت)
+def test_matches_statsmodels(X):
+    design = sm.add_constant(X).to_numpy()
+    expected = [variance_inflation_factor(design, i) for i in range(1, design.shape[1])]
+    np.testing.assert_allclose(variance_inflation_factors(X), expected, rtol=1e-9)
+
+
+# متغير ثابت يعطي NaN، ومتغيرات مرتبطة خطيا تماما تعطي VIF لانهائي
+def test_degenerate_designs(X):
+    values = X.to_numpy()
+    constant = variance_inflation_factors(np.column_stack([values, np.ones(len(values))]))
+    assert np.isnan(constant[-1])
+    np.testing.assert_allclose(constant[:-1], variance_inflation_factors(values), rtol=1e-9)
+
+    collinear = variance_inflation_factors(np.column_stack([values, values[:, 0] + 2 * values[:, 2]]))
+    assert np.isinf(collinear[[0, 2, 4]]).all()
+    assert np.isfinite(collinear[[1, 3]]).all()